@@ -19,17 +19,29 @@ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
 General Public License for more details.
 """
 
+import contextlib
+import contextvars
+import collections
 import copy
+import gc
+import heapq
 import inspect
+import io
 import json
+import keyword
 import os
 import pprint
+import random
+import shlex
 import socket
 import sys
 import textwrap
+import threading
+import time
 import types
+from array import array
 from importlib import import_module
-from itertools import chain
+from itertools import chain, islice
 from pathlib import Path, PurePath
 from typing import Dict, Optional, Union
 
@@ -38,20 +50,65 @@ from netifaces import ifaddresses, interfaces
 # Use json5 for imports if it is avallable
 # else use json (json5 allowes comments within the json-data)
 # data is ALLWAYS printed as pure json.
+# The (C-accelerated) json decoder is tried first, json5 is used only for
+# files that are no strict json or are named "*.json5".
 
 try:
     # import json5
     globals()["json5"] = import_module("json5")  # to fake requirements.txt
-    JsonLoads = json5.loads  # type: ignore  pylint: disable=undefined-variable
-    JsonLoad = json5.load  # type: ignore  pylint: disable=undefined-variable
 except ModuleNotFoundError:
-    JsonLoads = json.loads
-    JsonLoad = json.load
+    json5 = None  # pylint: disable=invalid-name
+
+
+def JsonLoads(Text: str, Name: str = ""):
+    """Decode Text with json, with json5 (if installed) if this fails or Name ends with '.json5'"""
+    if json5 is not None and Name.endswith(".json5"):
+        return json5.loads(Text)
+    try:
+        return json.loads(Text)
+    except ValueError:
+        if json5 is None:
+            raise
+    return json5.loads(Text)
+
+
+def JsonLoad(fp, Name: str = ""):
+    """Like JsonLoads for a file-object"""
+    return JsonLoads(fp.read(), Name or str(getattr(fp, "name", "")))
+
+
+# Use numpy for compact multi-values ('A': "numpy") if it is available
+# else the compact values are stored as array.array.
+# numpy is imported only when a definition asks for it (look at _Numpy).
+
+numpy = None  # pylint: disable=invalid-name
+_NumpyTried = False
+
+
+def _Numpy():
+    """Import numpy on the first call, return the module or None if it is not installed"""
+    global _NumpyTried  # pylint: disable=global-statement
+    if not _NumpyTried:
+        _NumpyTried = True
+        try:
+            globals()["numpy"] = import_module("numpy")  # to fake requirements.txt
+        except ModuleNotFoundError:
+            pass
+    return numpy
+
+
+def _IsCompact(v) -> bool:
+    """True if v is a compact multi-value (array.array or numpy.ndarray, e.g. also from an unpickled tree)"""
+    if isinstance(v, array):
+        return True
+    Np = sys.modules.get("numpy")
+    return Np is not None and isinstance(v, Np.ndarray)
 
 __updated__ = "339.230404114747"
 Version = f"1.15.{__updated__}"
 
 GLOBAL_NAME = "global"
+COMPLETE_ENV = "ARGPASS_COMPLETE"  # environment-variable set by the shell completion scripts
 
 GPL_Preamble: str = """
 This program is free software: you can redistribute it and/or modify
@@ -934,6 +991,10 @@ Translation_en_US: dict = {
     "UndefinedOptionMultiple": "options {OptStr} not recognized",
     "InvalidIp": "Value '{OptValue}' for parameter {ParKey} is not a valid IP{IpVers} address",
     "InvalidLocalIp": "Value '{OptValue}' for parameter {ParKey} is no a valid local IP{IpVers} address on this computer",
+    "ResponseFileError": "Response file '{FileName}' could not be read: {Error}",
+    "ResponseFileDepth": "Response file '{FileName}' is nested deeper than {MaxDepth} levels",
+    "ValueFileError": "The values for parameter {ParKey} could not be read from '{FileName}': {Error}",
+    "LookupTimeout": "The check of '{OptValue}' for parameter {ParKey} (mode '{Mode}') did not finish within {Timeout} seconds",
 }
 
 Translation_de_DE: dict = {
@@ -984,9 +1045,403 @@ Translation_de_DE: dict = {
     "UndefinedOptionMultiple": "Unbekannte Optionen {OptStr} angegeben",
     "InvalidIp": "Der Wert '{OptValue}' für den Parameter {ParKey} ist keine gültige IP{IpVers} Adresse",
     "InvalidLocalIp": "Der Wert '{OptValue}' für den Parameter {ParKey} ist keine gültige, lokale IP{IpVers} Adresse auf diesem Computer",
+    "ResponseFileError": "Die Antwortdatei '{FileName}' kann nicht gelesen werden: {Error}",
+    "ResponseFileDepth": "Die Antwortdatei '{FileName}' ist tiefer als {MaxDepth} Ebenen verschachtelt",
+    "ValueFileError": "Die Werte für den Parameter {ParKey} können nicht aus '{FileName}' gelesen werden: {Error}",
+    "LookupTimeout": "Die Prüfung von '{OptValue}' für den Parameter {ParKey} (Modus '{Mode}') ist nicht innerhalb von {Timeout} Sekunden fertig geworden",
 }
 
 
+# The getopt engine and the prefix handling of Param (shared with the modules generated
+# by Param.GenerateParser). _iter_gnu_getopt is the only tokenizer, _gnu_getopt collects its records.
+# Msg(Key, **Fields) returns the translated message for an error.
+
+
+class _GetoptError(Exception):
+    """Own error-class for option-errors"""
+
+    opt = ""
+    msg = ""
+
+    def __init__(self, msg, opt=""):
+        self.msg = msg
+        self.opt = opt
+        Exception.__init__(self, msg, opt)
+
+    def __str__(self):
+        return self.msg
+
+
+def _iter_gnu_getopt(args, shortopts, longopts, AcceptAll, Start, Msg):
+    """
+    Yield the records of args[Start:] while args is consumed (GNU style scanning).
+
+    The records are (Index, Pos, Kind, Option, Argument): Index is the index of the
+    argument within args, Pos the position of a short option within its argument
+    (0 for long options and positional arguments). Kind is "o" (option),
+    "u" (unknown option, only if AcceptAll), "p" (positional) or
+    "t" (the last record: args[Index:] are positional, Pos is -1).
+    If shortopts starts with '+' or POSIXLY_CORRECT is set the scan stops at the
+    first positional argument.
+    """
+    if isinstance(longopts, str):
+        longopts = [longopts]
+    else:
+        longopts = list(longopts)
+
+    if shortopts.startswith("+"):
+        shortopts = shortopts[1:]
+        all_options_first = True
+    elif os.environ.get("POSIXLY_CORRECT"):
+        all_options_first = True
+    else:
+        all_options_first = False
+
+    i = Start
+    n = len(args)
+    while i < n:
+        arg = args[i]
+        if arg == "--":
+            yield (i + 1, -1, "t", "", "")
+            return
+
+        if arg[:2] == "--":
+            opt = arg[2:]
+            k = opt.find("=")
+            if k < 0:
+                optarg = None
+            else:
+                opt, optarg = opt[:k], opt[k + 1 :]
+            try:
+                has_arg, opt = _long_has_args(opt, longopts, Msg)
+            except _GetoptError:
+                if not AcceptAll:
+                    raise
+                yield (i, 0, "u", "--" + opt, "")
+                i += 1
+                continue
+            Index = i
+            i += 1
+            if has_arg:
+                if optarg is None:
+                    if i >= n:
+                        raise _GetoptError(Msg("OptionRequiresArgumentLong", **{"opt": opt}), opt)
+                    optarg = args[i]
+                    i += 1
+            elif optarg is not None:
+                raise _GetoptError(Msg("OptionNeedNoArgs", **{"opt": opt}), opt)
+            yield (Index, 0, "o", "--" + opt, optarg or "")
+        elif arg[:1] == "-" and arg != "-":
+            Index = i
+            i += 1
+            m = len(arg)
+            for j in range(1, m):
+                opt = arg[j]
+                try:
+                    wHasArgs = _short_has_arg(opt, shortopts, Msg)
+                except _GetoptError:
+                    if not AcceptAll:
+                        raise
+                    yield (Index, j, "u", "-" + opt, "")
+                    continue
+                if wHasArgs:
+                    if j + 1 == m:
+                        if i >= n:
+                            raise _GetoptError(Msg("OptionRequiresArgumentShort", **{"opt": opt}), opt)
+                        optarg = args[i]
+                        i += 1
+                    else:
+                        optarg = arg[j + 1 :]
+                    yield (Index, j, "o", "-" + opt, optarg)
+                    break
+                yield (Index, j, "o", "-" + opt, "")
+        else:
+            if all_options_first:
+                break
+            yield (i, 0, "p", arg, "")
+            i += 1
+    yield (i, -1, "t", "", "")
+
+
+def _gnu_getopt(args, shortopts, longopts, AcceptAll, Msg):
+    """
+    Return (options, positional arguments, unknown options) of args.
+
+    The options are (Option, Argument) pairs, an unknown short option is also
+    listed there with an empty argument (like getopt did).
+    """
+    opts = []
+    prog_args = []
+    unused = []
+    for i, j, Kind, Opt, Arg in _iter_gnu_getopt(args, shortopts, longopts, AcceptAll, 0, Msg):
+        if Kind == "o":
+            opts.append((Opt, Arg))
+        elif Kind == "p":
+            prog_args.append(Opt)
+        elif Kind == "u":
+            unused.append(Opt)
+            if j > 0:
+                opts.append((Opt, ""))
+        else:
+            prog_args.extend(args[i:])
+    return opts, prog_args, unused
+
+
+def _long_has_args(opt, longopts, Msg):
+    """
+    Return (has_arg, full option name) of a long option (a unique abbreviation is accepted)
+    """
+    possibilities = [o for o in longopts if o.startswith(opt)]
+    if not possibilities:
+        raise _GetoptError(Msg("OptionNotRecognizedLong", **{"opt": opt}), opt)
+    # Is there an exact match?
+    if opt in possibilities:
+        return False, opt
+    elif opt + "=" in possibilities:
+        return True, opt
+    # No exact match, so better be unique.
+    if len(possibilities) > 1:
+        # since possibilities contains all valid continuations, might be
+        # nice to work them into the error msg
+        raise _GetoptError(Msg("ParNoUniquePrefix", **{"opt": opt}), opt)
+    unique_match = possibilities[0]
+    has_arg = unique_match.endswith("=")
+    if has_arg:
+        unique_match = unique_match[:-1]
+    return has_arg, unique_match
+
+
+def _short_has_arg(opt, shortopts, Msg):
+    """
+    Determine if short option has args
+    """
+    i = shortopts.find(opt) if opt != ":" else -1
+    if i < 0:
+        raise _GetoptError(Msg("OptionNotRecognizedShort", **{"opt": opt}), opt)
+    return shortopts.startswith(":", i + 1)
+
+
+def _MakeOptName(OptionNameIn, Prefix, Error):
+    """
+    Return the option-name without Prefix ("--pre.name=x" -> "--name=x" for Prefix "pre")
+
+    Error is the exception class raised for an invalid prefixed name.
+    """
+    OptionName = OptionNameIn
+    LongOptStr = OptionNameIn
+    RemStr = ""
+    if OptionName.startswith("--"):
+        if "." in OptionName:
+            if "=" in OptionName:
+                w = OptionName.split("=", 1)
+                OptionName = w[0]
+                RemStr = "=" + w[1]
+            wList = OptionName[2:].split(".")
+            if len(wList) != 2:
+                raise Error(f"Error in prefixed parameter {OptionName}") from None
+            if wList[0] == Prefix:
+                LongOptStr = "--" + wList[1] + RemStr
+    return LongOptStr
+
+
+def _ArgPrefixes(Args):
+    """Return the prefixes used by long options within Args[1:] (in order of appearance)"""
+    PreList = []
+    for wPar in Args[1:]:
+        if wPar[0:2] == "--":
+            xPar = wPar[2:]
+            if "=" in xPar:
+                xPar = xPar.split("=", 1)[0]
+            if "." in xPar:
+                xPre = wPar[2:].split(".", 1)[0]
+                if xPre not in PreList:
+                    PreList.append(xPre)
+    return PreList
+
+
+def _Intersection(List1, List2):
+    """Return the entries of the longer list that are also within the other one (in order of the longer list)"""
+    if len(List2) > len(List1):
+        List1, List2 = List2, List1
+    if List1 == List2:
+        return List1
+    Keep = set(List2)
+    return [value for value in List1 if value in Keep]
+
+
+def _IsValidIp4(Ip):
+    """Return the (purified) IPV4 address of Ip (or DNS-name) or None"""
+    try:
+        return socket.getaddrinfo(Ip, None, family=socket.AF_INET, type=socket.SOCK_STREAM)[0][4][0]
+    except (socket.gaierror, IndexError):
+        return None
+
+
+def _IsValidIp6(Ip):
+    """Return the (purified) IPV6 address of Ip (or DNS-name) or None"""
+    try:
+        return socket.getaddrinfo(Ip, None, family=socket.AF_INET6, type=socket.SOCK_STREAM)[0][4][0]
+    except (socket.gaierror, IndexError):
+        return None
+
+
+def _IsValidIp(Ip):
+    """Return the (purified) IPV4 or IPV6 address of Ip (or DNS-name) or None"""
+    wIp = _IsValidIp4(Ip)
+    if wIp is not None:
+        return wIp
+    return _IsValidIp6(Ip)
+
+
+# The functions above copied into the modules generated by Param.GenerateParser (inspect.getsource),
+# the IP-validators only if the tree uses IP modes. They use only os, socket and each other.
+_PARSER_SHARED = (_GetoptError, _iter_gnu_getopt, _gnu_getopt, _long_has_args, _short_has_arg, _MakeOptName, _ArgPrefixes, _Intersection)
+_PARSER_SHARED_IP = (_IsValidIp4, _IsValidIp6, _IsValidIp)
+
+
+# Static part of the modules generated by Param.GenerateParser,
+# followed by the sources of _PARSER_SHARED (and of _PARSER_SHARED_IP).
+_PARSER_RUNTIME = r'''
+import os
+import sys
+
+GLOBAL_NAME = "global"
+
+
+class _ExceptionTemplate(Exception):
+    def __str__(self):
+        return ": ".join(self.args)
+
+
+class DeclarationError(_ExceptionTemplate):
+    """Error within the declaration (like Param.DeclarationError)"""
+
+
+class ParamError(_ExceptionTemplate):
+    """Error within the runtime-parameters (like Param.ParamError)"""
+
+
+def _Msg(Key, **Fields):
+    return _MSG[Key].format(**Fields)
+
+
+def _InKnown(P, W, Anc):
+    return P in W or any(P in x for x in Anc)
+'''
+
+# Traversal of the generated modules, same order as Param.Process:
+# first pass parents bevore children (help & licenses), second pass children bevore parents.
+_PARSER_PROCESS = r'''
+
+def _Tokens(i, Args, PreList, Tok):
+    if Tok[i] is None:
+        Node = _NODES[i]
+        wLongList = list(Node[_LONG])
+        for nPre in PreList:
+            for nLong in Node[_LONG]:
+                wLongList.append(nPre + "." + nLong)
+        try:
+            Tok[i] = _gnu_getopt(Args[1:], Node[_SHORT], wLongList, True, _Msg)
+        except _GetoptError as exc:
+            raise ParamError(exc.msg) from None
+    return Tok[i]
+
+
+def _Usage(i):
+    from pathlib import Path  # pylint: disable=import-outside-toplevel
+
+    return _USAGE[i].replace(_PROG, Path(sys.argv[0]).stem)
+
+
+def _First(i, Args, PreList, Tok):
+    Node = _NODES[i]
+    for OptionName, a in _Tokens(i, Args, PreList, Tok)[0]:
+        del a
+        OptionName = _MakeOptName(OptionName, Node[_PREFIX], ParamError)
+        if OptionName in Node[_HELP]:
+            if Node[_PREFIX] != "" and Node[_PREFIX] != GLOBAL_NAME:
+                print(f"#{'-'*60}\n# {Node[_PREFIX]}\n#{'-'*60}\n")
+            print(_Usage(i))
+            if Node[_PARENT] is None:
+                sys.exit(0)
+            return True
+        if OptionName in Node[_LICENSE]:
+            print(Node[_LICENSETEXT][0])
+            return True
+        if OptionName in Node[_FULLLICENSE]:
+            print("\n".join(Node[_LICENSETEXT]))
+            return True
+    Erg = False
+    for c in Node[_CHILDREN]:
+        if _First(c, Args, PreList, Tok):
+            Erg = True
+    return Erg
+
+
+def _Second(i, Args, PreList, Tok, Values, Pwd):
+    Node = _NODES[i]
+    Erg = False
+    for c in Node[_CHILDREN]:
+        if _Second(c, Args, PreList, Tok, Values, Pwd):
+            Erg = True
+    W = Values[i]
+    Anc = [Values[x] for x in Node[_ANCESTORS]]
+    for OptionName, a in _Tokens(i, Args, PreList, Tok)[0]:
+        OptionName = _MakeOptName(OptionName, Node[_PREFIX], ParamError)
+        if OptionName in Node[_HELP]:
+            continue
+        Func = Node[_DISPATCH].get(OptionName)
+        if Func is not None:
+            Func(W, OptionName, a, Anc, Pwd)
+    for DefArgName, ParList in Node[_REQUIRED]:
+        if not _InKnown(DefArgName, W, Anc):
+            raise ParamError(_MSG["OptionRequired"].format(**{"DefArgName": DefArgName, "ParList": ParList})) from None
+    return Erg
+
+
+def _Collect(i, Tok, Pos):
+    Res = Tok[i][Pos] if Tok[i] is not None else []
+    for c in _NODES[i][_CHILDREN]:
+        Res = _Intersection(Res, _Collect(c, Tok, Pos))
+    return Res
+
+
+def Process(Args=None):
+    """
+    Process the runtime-arguments like Param.Process of the tree this module was generated from.
+
+    :param Args: the arguments including the program name, defaults to sys.argv
+    :return: (Terminal, Values, Remainder, Unused)
+        Terminal is True if a help or license option was given,
+        Values is a dictionary FullPrefix -> dictionary of the own values of this node,
+        Remainder and Unused are the lists of Param.GetRemainder and Param.UnusedArgs
+    :raises ParamError: if an error occures within a parameter
+    """
+    if Args is None:
+        Args = sys.argv
+    Pwd = os.getcwd()
+    Values = [Func(Pwd) for Func in _DEFAULTS]
+    PreList = _ArgPrefixes(Args)
+    Tok = [None] * len(_NODES)
+    Erg = _First(0, Args, PreList, Tok)
+    if not Erg:
+        Erg = _Second(0, Args, PreList, Tok, Values, Pwd)
+        Unused = _Collect(0, Tok, 2)
+        if len(Unused) > 0 and _ERROR_ON_UNKNOWN:
+            OptStr = ", ".join(["'" + x + "'" for x in Unused])
+            if len(Unused) > 1:
+                raise ParamError(_MSG["UndefinedOptionMultiple"].format(**{"OptStr": OptStr})) from None
+            raise ParamError(_MSG["UndefinedOptionSingle"].format(**{"OptStr": OptStr})) from None
+    Res = {}
+    for i, Node in enumerate(_NODES):
+        Res[Node[_FULLPREFIX]] = Values[i]
+    return Erg, Res, _Collect(0, Tok, 1), _Collect(0, Tok, 2)
+'''
+
+_PROG_MARK = "\x00PROG\x00"  # placeholder for the program-name in generated help-texts
+_LOOKUPS: contextvars.ContextVar = contextvars.ContextVar("ArgpassLookups", default=None)  # session of the running Process-call
+
+
 class Param:
     """
     Main class and also the result-dictionary.
@@ -1051,9 +1506,143 @@ class Param:
             """
             if isinstance(o, Path) or isinstance(o, PurePath):
                 return str(o)  # return the string representation of the Path
+            elif _IsCompact(o):
+                return o.tolist()  # compact multi-values are written as a plain list
             else:
                 return super().default(o)  # let the default library do the work
 
+    class Metrics:
+        """
+        Aggregate the parse statistics within the process (look at :func:`Param.SetMetrics`)
+        and return or write them in the Prometheus text format.
+
+        :param Prefix: The prefix of the metric names, defaults to "argpass"
+        :type Prefix: str, optional
+        """
+
+        # event -> metric-name, help-text, label-name (None: not labeled), type
+        # a "summary" has the sum and the number of the values, a "counter" the sum
+        Events = {
+            "process": ("process_seconds", "Duration of Param.Process by result", "status", "summary"),
+            "error": ("errors_total", "Validation errors by translation key", "key", "counter"),
+            "unknown": ("unknown_options_total", "Unknown options on the command-line", None, "counter"),
+            "import": ("import_bytes", "Size of the imported files", "mode", "summary"),
+            "lookup": ("lookup_seconds", "Duration of resolver and filesystem calls", "mode", "summary"),
+        }
+
+        def __init__(self, Prefix: str = "argpass"):
+            self.Prefix = Prefix
+            self.__Lock = threading.Lock()
+            self.__Values: Dict[tuple, list] = {}  # (event, label) -> [count, sum]
+
+        def __call__(self, Event: str, Key: str, Value: float) -> None:
+            """Add an event (this is the sink interface)"""
+            with self.__Lock:
+                try:
+                    Entry = self.__Values[(Event, Key)]
+                except KeyError:
+                    Entry = self.__Values[(Event, Key)] = [0, 0]
+                Entry[0] += 1
+                Entry[1] += Value
+
+        @property
+        def Values(self) -> dict:
+            """
+            Return a copy of the aggregated values
+
+            :return: {(Event, Key): [Count, Sum], ...}
+            :rtype: dict
+            """
+            with self.__Lock:
+                return {k: list(v) for k, v in self.__Values.items()}
+
+        def Prometheus(self) -> str:
+            """
+            Return the aggregated values in the Prometheus text format
+
+            :return: the exposition text
+            :rtype: str
+            """
+            Values = self.Values
+            Lines = []
+            for Event, (Name, Help, Label, Type) in self.Events.items():
+                Entries = sorted((k[1], v) for k, v in Values.items() if k[0] == Event)
+                if not Entries:
+                    continue
+                FullName = f"{self.Prefix}_{Name}"
+                Lines.append(f"# HELP {FullName} {Help}")
+                Lines.append(f"# TYPE {FullName} {Type}")
+                for Key, (Count, Sum) in Entries:
+                    Lbl = ""
+                    if Label is not None:
+                        wKey = str(Key).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                        Lbl = f'{{{Label}="{wKey}"}}'
+                    if Type == "summary":
+                        Lines.append(f"{FullName}_sum{Lbl} {Sum!r}")
+                        Lines.append(f"{FullName}_count{Lbl} {Count}")
+                    else:
+                        Lines.append(f"{FullName}{Lbl} {Sum}")
+            return "\n".join(Lines) + "\n"
+
+        def WritePrometheus(self, FileName: str) -> None:
+            """
+            Write the aggregated values to a file for the textfile-collector of the node-exporter.
+
+            The file is replaced atomically, so the collector never reads a partial file.
+
+            :param FileName: The name of the file (should end with ".prom")
+            :type FileName: str
+            """
+            Tmp = f"{FileName}.{os.getpid()}.tmp"
+            with open(Tmp, "w", encoding="utf-8") as wFile:
+                wFile.write(self.Prometheus())
+            os.replace(Tmp, FileName)
+
+    class OptionStream:
+        """
+        Iterator over the options of the command-line (returned by :func:`Param.IterOptions`).
+
+        The records are (FullPrefix, Name, Value). :attr:`Unused` lists the unknown
+        options found so far, :attr:`Remainder` is a lazy view of the positional arguments.
+
+        .. note::
+            :attr:`Remainder` is matched by position within the arguments, :func:`Param.GetRemainder`
+            intersects the remainders of the instances by value. They differ if a value is
+            positional for one instance but e.g. the argument of an option for another one
+            (and occurs also elsewhere as positional argument), or if a value is repeated.
+            Every iteration of :attr:`Remainder` parses the whole argument list again with the
+            tables of all instances of the tree (independent from the iteration of the stream).
+        """
+
+        def __init__(self, Records, Unused: list, Remainder: "Param.ArgsView"):
+            self.__Records = Records
+            self.Unused = Unused
+            self.Remainder = Remainder
+
+        def __iter__(self):
+            return self
+
+        def __next__(self) -> tuple:
+            return next(self.__Records)
+
+    class ArgsView:
+        """
+        Lazy view of the positional arguments of an :class:`OptionStream`.
+
+        Every iteration parses the whole argument list again with the tables of all
+        instances of the tree (the cost of a whole stream), only the arguments after '--'
+        are a slice of the argument list. Nothing is copied.
+
+        The arguments are matched by position, so the view can differ from
+        :func:`Param.GetRemainder` (intersected by value), look at :class:`OptionStream`.
+        """
+
+        def __init__(self, Scan):
+            self.__Scan = Scan
+
+        def __iter__(self):
+            return self.__Scan()
+
     _InitTranslation = {
         "PrefixError": "Error in prefixed parameter {OptionName}",
         "JsonError": "Import failed '{wMsg}' in {OptionPath} ({FullPath}) for parameter {OptionName}",
@@ -1102,6 +1691,10 @@ class Param:
         "UndefinedOptionMultiple": "options {OptStr} not recognized",
         "InvalidIp": "Value '{OptValue}' for parameter {ParKey} is not a valid IP{IpVers} address",
         "InvalidLocalIp": "Value '{OptValue}' for parameter {ParKey} is no a valid local IP{IpVers} address on this computer",
+        "ResponseFileError": "Response file '{FileName}' could not be read: {Error}",
+        "ResponseFileDepth": "Response file '{FileName}' is nested deeper than {MaxDepth} levels",
+        "ValueFileError": "The values for parameter {ParKey} could not be read from '{FileName}': {Error}",
+        "LookupTimeout": "The check of '{OptValue}' for parameter {ParKey} (mode '{Mode}') did not finish within {Timeout} seconds",
     }
 
     def __init__(
@@ -1123,6 +1716,8 @@ class Param:
         License: Union[str, tuple, list, dict, None] = None,  # pylint: disable=too-many-function-args
         ShowPrefixOnHelp: bool = True,
         ShowConfigName: bool = False,
+        EnvPrefix: Optional[str] = None,
+        LazyChildren: bool = False,
         _Child=False,
     ):
         """
@@ -1250,6 +1845,15 @@ class Param:
         :type ShowPrefixOnHelp: bool, optional
         :param ShowConfigName: Anzeige des Parameters innerhalb der Config-Datei, defaults to False
         :type ShowConfigName:  bool, optional
+        :param EnvPrefix: For details check out :func:`SetEnvPrefix`, defaults to None
+        :type EnvPrefix: Optional[str], optional
+        :param LazyChildren: If True the children declared with 'Children' (or :func:`AddChild`)
+            are only checked at construction. A child is built and prepared when its options
+            are on the command-line, in the environment, in a global import, if it has
+            required options or if it is accessed (:attr:`Child`, :func:`Usage`, export, ...).
+            The results are the same as without this flag. This setting is inherited by
+            all children. Defaults to False
+        :type LazyChildren: bool, optional
         :param _Child: True if this instance should be a child, defaults to False
         :type _Child: bool, optional
 
@@ -1324,13 +1928,23 @@ class Param:
         self.__WorkDict: dict = {}  # This is the result dictionary used to make the class look like dicktionary
         self.__Version = Version  # Optional version string for help display
         self.__Children: Dict[str, Param] = {}  # Dictionary of our children (all are our one class! )
+        self.__LazyChildren: bool = LazyChildren  # build the children only if they are needed
+        self.__Pending: Dict[str, list] = {}  # prefix -> [declaration, scan, settings] of children not built yet
+        self.__ChildOrder: list = []  # prefixes of all children in order of declaration (only if LazyChildren)
+        self.__PendingArgs: tuple = ([], [])  # (remainder, unused) of the children not built yet
+        self.__ArgsCombined: Optional[tuple] = None  # (remainder, unused) of us and all children (once per "Process")
+        self.__Processed: bool = False  # True after the values are set by "Process"
+        self.__Phases: int = 0  # number of phases of "Process" our children got (0..2)
+        self.__ResultLayout: Optional[tuple] = None  # (class, parameter-names, child-prefixes) for "Result"
+        self.__ResultObj = None  # the values of the last "Process" as instance of the result-class
         self.__Parent: Union[Param, None] = None  # Our parent if we are a child else None
         self.__MyProgName: str = ""  # the programm-name from __Argumente[0] (only name)
         self.__MyProgPath: str = ""  # the path of the executeable from __Argumente[0]
         self.__MyPwd: str = ""  # Actual directory at invocation of "Process"
+        self.__Cwd: Optional[str] = None  # the directory of the running Serve-request (root only), None: os.getcwd()
         self.__Definition: dict = {}  # the definition-dict
         self.__Description: str = ""  # Description of program for help
-        self.__Argumente: list = []  # list of commandline arguments
+        self.__Argumente: Optional[Union[list, tuple]] = None  # list of commandline arguments (None: use the list of the parent)
         self.__ChkFunc = None  # pylint: disable=unused-private-member # external check-funktion (not implemented jet)
         self.__ErrorOnUnknown: bool = ErrorOnUnknown  # raise error if unknown options on commandline
         self.__UsageText: str = ""  # Complete help-text
@@ -1338,11 +1952,29 @@ class Param:
         self.__ShortList: list = []  # List of short parameters (e.g. ["v", "h", "l:", "m:"])
         self.__LongList: list = []  # List of Long parameters (e.g. "help","len="...)
         self.__ParDict: dict = {}  # dict of "argtext" -> "Parameter-name"
+        self.__Actions: dict = {}  # dict of "argtext" -> (kind, Parameter-name, definition, validator or None)
+        self.__OptViews: tuple = ((), (), types.MappingProxyType({}))  # read-only (LongList, ShortList, ParDict)
         self.__RemainArgs: list = []  # List of remaining arguments from commandline
         self.__UnusedArgs: list = []  # liste aller nicht vorgesehener Parameter
         self.__AddPar: str = ""  # Additional parameter Text (for help)
         self.__UsageTextList: list = []  # List of single help entries (also lists)
-        self.__IsPrepared: bool = False  # Marker if "Prepare" is run after changes
+        self.__DefDirty: bool = True  # Marker if "Prepare" has to compile the option-tables and defaults
+        self.__TextDirty: bool = True  # Marker if the usage-text has to be generated
+        self.__UsageLens: tuple = (0, 0)  # max. length of the short and long options (compiled in __Prepare)
+        self.__PwdDependent: bool = False  # True if a default is a path relative to __MyPwd
+        self.__PrefixCache: dict = {}  # id(Args) -> prefixes used on the command-line (root only, per Process)
+        self.__ArgCache: dict = {}  # id(Args) -> (Args, Args with expanded response-files) (root only, per Process)
+        self.__ResponseFiles: Optional[tuple] = None  # (Quoted, MaxDepth) if "@file" arguments are expanded
+        self.__SparseExport: Optional[bool] = None  # None: full exports, else: sparse exports (value: with required options)
+        self.__ImportLayers: Optional[tuple] = None  # (Files, Name, Required) of the layered import (look at SetImportLayers)
+        self.__LookupLog: list = []  # (ParKey, Mode, Value, Seconds, Status) of the lookups of the last Process-call
+        self.__Observe = None  # the metrics-sink (root only, look at SetMetrics)
+        self.__Lock = threading.RLock()  # serialises Process, Reload and the snapshot readers (root only, look at Lock)
+        self.__LastMsgKey: Optional[str] = None  # translation key of the last error message (root only)
+        self.__DefaultDict: dict = {}  # the compiled defaults (set by "Prepare")
+        self.__ImportRecords: list = []  # imported files [IsGlobal, OptionName, OptionPath, FullPath, Signature, Data]
+        self.__ImportRaw: dict = {}  # Parameter-name -> imported (raw) value
+        self.__PinnedKeys: set = set()  # Parameter-names set by the environment or the command-line
 
         self.__HelpList: list = []  # List of all parameters with type 'H'  (Help)
         self.__ImportList: list = []  # List of all parameters with type 'x'  (single Import)
@@ -1360,6 +1992,10 @@ class Param:
         self.__ShowPrefixOnHelp = ShowPrefixOnHelp
         self.__ShowConfigName = ShowConfigName
         self._Translation: dict = {}  # Dictionary for translations
+        self.__EnvPrefix: Optional[str] = None  # Prefix for environment names derived from FullPrefix
+        self.__Environ: Optional[dict] = None  # Environment source, None = os.environ
+        self.__Engine: str = "fast"  # getopt-engine: "fast" or "reference" (root only, look at SetEngine)
+        self.__EnvMap: dict = {}  # environment name -> Parameter-name (compiled in __Prepare)
         self.__License: list = [""]
         if isinstance(License, str):
             self.__License = [License]
@@ -1378,6 +2014,8 @@ class Param:
             "uplimit": "U",
             "required": "r",
             "multiple": "M",
+            "env": "e",
+            "compact": "A",
         }
 
         self.__WorkModes = {
@@ -1438,72 +2076,20 @@ class Param:
         self.SetDesc(Desc)
         self.SetUserKeys(UserPars=UserPars, UserModes=UserModes)
         self.SetDef(Def)
-        self.SetArgs(Args)
+        if not _Child:  # children use the arguments of their parent
+            self.SetArgs(Args)
         self.SetChk(Chk)
         self.SetAllParams(AllParams)
         self.SetAddPar(AddPar)
+        self.SetEnvPrefix(EnvPrefix)
+        # the translation first: the children share this table
+        self.SetTranslation(translation, _Child)
         if Children is None:  # fix issue if Children is None
             Children = {}
-        for wPrefix, wDict in Children.items():
-            TheFullPrefix = self.FullPrefix
-            # Prefix (=Name) must be a string and not empty
-            if not isinstance(wPrefix, str):
-                raise self.DeclarationError(f"{TheFullPrefix}: Name of child '{wPrefix} is not a string")  # ChildNameNoStr
-            wPrefix = wPrefix.strip()
-            if wPrefix == "":
-                raise self.DeclarationError(f"{TheFullPrefix}: Name of child could not be blank")  # ChildNameBlank
-
-            # the declaration of a child has to bee a dictionary
-            if not isinstance(wDict, dict):
-                raise self.DeclarationError(f"{self.FullPrefix}: Child definition for '{wPrefix} is not a dictionary")
-
-            # the declaration of a child needs at least a 'Def' entry whitch is a dictionary
-            if "Def" not in wDict:
-                raise self.DeclarationError(f"{self.FullPrefix}: Child definition for '{wPrefix} does not include 'Def'")
-            if not isinstance(wDict["Def"], dict):
-                raise self.DeclarationError(f"{self.FullPrefix}: 'Def' in child definition for '{wPrefix} is not a dictionary")
-
-            # if 'Children' not given set it to an empty dictionary
-            if "Children" not in wDict:
-                wDict["Children"] = {}
-            if wDict["Children"] is None:
-                wDict["Children"] = {}
-
-            # the declaration of "Children" has to bee a dictionary
-            if not isinstance(wDict["Children"], dict):
-                raise self.DeclarationError(f"{self.FullPrefix}: 'Children' in child definition for '{wPrefix} is not a dictionary")
-
-            # if 'Desc' not given set it to ''
-            if "Desc" not in wDict:
-                wDict["Desc"] = ""
-
-            # the declaration of "Desc" has to bee a string
-            if not isinstance(wDict["Desc"], str):
-                raise self.DeclarationError(f"{self.FullPrefix}: 'Desc' in child definition for '{wPrefix} is not a string")
-
-            # if 'AddPar' not given set it to ''
-            if "AddPar" not in wDict:
-                wDict["AddPar"] = ""
-
-            # the declaration of "AddPar" has to bee a string
-            if not isinstance(wDict["AddPar"], str):
-                raise self.DeclarationError(f"{self.FullPrefix}: 'AddPar' in child definition for '{wPrefix} is not a string")
-
-            # now add all the children (if necessary also recursive)
-            self.AddChild(
-                Prefix=wPrefix,  # pylint: disable=too-many-function-args
-                Def=wDict["Def"],
-                Children=wDict["Children"],
-                Description=wDict["Desc"],
-                Version=self.__Version,
-                License=self.__License,
-                AddPar=wDict["AddPar"],
-            )
-
-        self.SetTranslation(translation, _Child)
+        self.__BuildChildren(Children)
 
         # show that we need preparation
-        self.__IsPrepared = False
+        self.__DefDirty = True
 
     def SetTranslation(self, translation: dict, IsChild: bool = False) -> None:
         """
@@ -1611,6 +2197,14 @@ class Param:
                 "option {OptStr} not recognized",
             'UndefinedOptionMultiple':
                 "options {OptStr} not recognized",
+            'ResponseFileError':
+                "Response file '{FileName}' could not be read: {Error}",
+            'ResponseFileDepth':
+                "Response file '{FileName}' is nested deeper than {MaxDepth} levels",
+            'ValueFileError':
+                "The values for parameter {ParKey} could not be read from '{FileName}': {Error}",
+            'LookupTimeout':
+                "The check of '{OptValue}' for parameter {ParKey} (mode '{Mode}') did not finish within {Timeout} seconds",
             }
 
         """
@@ -1631,6 +2225,7 @@ class Param:
                             self._Translation[k] = w
                     except KeyError:
                         self._Translation[k] = InitVal
+        self.__TextDirty = True  # only the usage-text depends on the translation
         for c in self.__Children.values():
             c.SetTranslation(translation, True)
 
@@ -1717,6 +2312,8 @@ class Param:
         else:
             if item in self.__WorkDict:
                 return self.__WorkDict[item]
+            if self.__Pending:
+                self.__Materialize([p for p, Rec in self.__Pending.items() if item in Rec[1]["Name"]])
             for c in self.__Children.values():
                 try:
                     return c.__SearchItem(item, Up)  # pylint: disable=protected-access
@@ -1790,6 +2387,66 @@ class Param:
         else:
             return chain(self.__Parent.__iter__(), self.__iter__())
 
+    # attributes not pickled: views, bound methods, the caches of a Process-call and the metrics-sink
+    __Transient = ("OptViews", "Actions", "PrefixCache", "ArgCache", "Observe", "ResultObj", "ResultLayout", "Lock")
+
+    def __getstate__(self) -> dict:
+        """
+        Return the state for pickle and copy.
+
+        The definitions, the prepared tables and the processed values are kept.
+        Views, bound methods and caches are left out and rebuilt by __setstate__,
+        the parents and children are pickled with us (a tree is pickled as a whole).
+        The metrics-sink is not pickled, set it again after loading (look at :func:`SetMetrics`).
+
+        :return: the state of this instance
+        :rtype: dict
+        """
+        State = self.__dict__.copy()
+        for Name in self.__Transient:
+            del State["_Param__" + Name]
+        # the validators of the IP modes are stored by name
+        State["_Param__IpModes"] = {k: [v[0].__name__] + v[1:] for k, v in self.__IpModes.items()}
+        return State
+
+    def __setstate__(self, State: dict) -> None:
+        """
+        Restore the state returned by __getstate__ and rebuild the views, bound methods and caches.
+
+        :param State: the state of an instance
+        :type State: dict
+        """
+        self.__dict__.update(State)
+        self.__IpModes = {k: [getattr(self, v[0])] + v[1:] for k, v in self.__IpModes.items()}
+        self.__OptViews = (tuple(self.__LongList), tuple(self.__ShortList), types.MappingProxyType(self.__ParDict))
+        self.__Actions = self.__CompileActions()
+        self.__PrefixCache = {}
+        self.__ArgCache = {}
+        self.__Observe = None
+        self.__ResultObj = None
+        self.__ResultLayout = None
+        self.__Lock = threading.RLock()
+
+    @property
+    def Lock(self) -> threading.RLock:
+        """
+        Return the lock of the tree (the lock of the root).
+
+        :func:`Process`, :func:`Reload`, :attr:`Result`, :attr:`GetExportDict` and
+        :func:`GetSparseExportDict` hold it, so they never see a tree that is partly
+        processed or partly reloaded. Hold it to read several values consistently while
+        :func:`WatchImports` is running:
+
+        .. code-block:: python
+
+            with MyParam.Lock:
+                Host, Port = MyParam["Host"], MyParam["Port"]
+
+        :return: the (reentrant) lock
+        :rtype: threading.RLock
+        """
+        return self.__GetRoot().__Lock
+
     def IsOwnKey(self, key: str) -> bool:
         """
         Check if the key is from the own optionset
@@ -1950,13 +2607,7 @@ class Param:
         :return: The (purified) IP or None if this address is not a valid IPV4 address
         :rtype: Union[str, None]
         """
-        try:
-            wIp = socket.getaddrinfo(Ip, None, family=socket.AF_INET, type=socket.SOCK_STREAM)[0][4][
-                0
-            ]  # pylint: disable=unsubscriptable-object
-        except (socket.gaierror, IndexError):
-            return None
-        return wIp
+        return _IsValidIp4(Ip)
 
     def IsValidIp6(self, Ip: str) -> Union[str, None]:
         """
@@ -1967,13 +2618,7 @@ class Param:
         :return: The (purified) IP or None if this address is not a valid IPV6 address
         :rtype: Union[str, None]
         """
-        try:
-            wIp = socket.getaddrinfo(Ip, None, family=socket.AF_INET6, type=socket.SOCK_STREAM)[0][4][
-                0
-            ]  # pylint: disable=unsubscriptable-object
-        except (socket.gaierror, IndexError):
-            return None
-        return wIp
+        return _IsValidIp6(Ip)
 
     def IsValidIp(self, Ip: str) -> Union[str, None]:
         """
@@ -1997,8 +2642,290 @@ class Param:
         :return: return all the children of this instance
         :rtype: Dict[str, :py:class:`Param`]
         """
+        if self.__Pending:
+            self.__Materialize(list(self.__Pending))
         return self.__Children
 
+    def __BuildChildren(self, Children: dict, Checked: bool = False, Settings: Optional[dict] = None) -> None:
+        """
+        Build the whole tree of children below this instance in one breadth-first pass.
+
+        Every declaration is checked once, every child is created without children
+        and wired to its parent (prefix, settings and the shared translation-table),
+        so the construction time is linear in the number of nodes and does not use
+        recursion. The garbage collector is paused while the tree is built: the new
+        nodes are no garbage, but every collection would scan the growing tree again.
+        Look at benchmarks/tree_construction.py.
+
+        With LazyChildren the declarations are only checked and scanned, the children
+        are built later by :func:`__Materialize`.
+
+        :param Children: Dictionary of children (look at :func:`AddChild`)
+        :type Children: dict
+        :param Checked: True if the declarations are already checked, defaults to False
+        :type Checked: bool, optional
+        :param Settings: the settings for the children (lazy only), defaults to None: our own settings
+        :type Settings: Optional[dict], optional
+        :raises self.DeclarationError: If a declaration is invalid
+        """
+        if Settings is None:
+            Settings = self.__ChildSettings()
+        GcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            Queue = collections.deque([(self, Children, self.FullPrefix, None)])
+            while Queue:
+                Parent, wChildren, TheFullPrefix, Scan = Queue.popleft()
+                Used = set(self.__ChildOrder) if Parent is self else set()
+                ParentSettings = None if self.__LazyChildren else Parent.__ChildSettings()  # pylint: disable=protected-access
+                for wPrefix, wDict in wChildren.items():
+                    if not Checked:
+                        wPrefix = self.__CheckChildDecl(wPrefix, wDict, TheFullPrefix)
+
+                    if not self.__LazyChildren:
+                        # now add the child, its children are added later (breadth first)
+                        Child = Parent.__NewChild(  # pylint: disable=protected-access
+                            Prefix=wPrefix,
+                            Def=wDict["Def"],
+                            Description=wDict["Desc"],
+                            AddPar=wDict["AddPar"],
+                            Settings=ParentSettings,
+                        )
+                        Queue.append((Child, wDict["Children"], f"{TheFullPrefix}.{Child.__Prefix}", None))  # pylint: disable=protected-access
+                        continue
+
+                    # lazy: the prefix is checked like __NewChild does it, the whole subtree is scanned
+                    p = wPrefix.lower().strip()
+                    if p in Used:
+                        raise self.DeclarationError(f"{TheFullPrefix}: Prefix '{p}' is already used")
+                    if p == GLOBAL_NAME:
+                        raise self.DeclarationError(f"{TheFullPrefix}: Prefix '{p}' is {GLOBAL_NAME} -> invalid!")
+                    Used.add(p)
+                    if Parent is self:
+                        Scan = {"Long": [], "Short": set(), "Prefix": set(), "Name": set(), "Env": [], "Always": False}
+                        self.__Pending[p] = [wDict, Scan, Settings]
+                        self.__ChildOrder.append(p)
+                    self.__ScanDecl(Scan, wDict["Def"], p, f"{TheFullPrefix}.{p}")
+                    Queue.append((None, wDict["Children"], f"{TheFullPrefix}.{p}", Scan))
+        finally:
+            if GcEnabled:
+                gc.enable()
+
+    def __CheckChildDecl(self, wPrefix, wDict, TheFullPrefix: str) -> str:
+        """
+        Check the declaration of one child and fill in the optional entries
+
+        :return: the stripped prefix
+        :rtype: str
+        :raises self.DeclarationError: If the declaration is invalid
+        """
+        # Prefix (=Name) must be a string and not empty
+        if not isinstance(wPrefix, str):
+            raise self.DeclarationError(f"{TheFullPrefix}: Name of child '{wPrefix} is not a string")  # ChildNameNoStr
+        wPrefix = wPrefix.strip()
+        if wPrefix == "":
+            raise self.DeclarationError(f"{TheFullPrefix}: Name of child could not be blank")  # ChildNameBlank
+
+        # the declaration of a child has to bee a dictionary
+        if not isinstance(wDict, dict):
+            raise self.DeclarationError(f"{TheFullPrefix}: Child definition for '{wPrefix} is not a dictionary")
+
+        # the declaration of a child needs at least a 'Def' entry whitch is a dictionary
+        if "Def" not in wDict:
+            raise self.DeclarationError(f"{TheFullPrefix}: Child definition for '{wPrefix} does not include 'Def'")
+        if not isinstance(wDict["Def"], dict):
+            raise self.DeclarationError(f"{TheFullPrefix}: 'Def' in child definition for '{wPrefix} is not a dictionary")
+
+        # if 'Children' not given set it to an empty dictionary
+        if "Children" not in wDict:
+            wDict["Children"] = {}
+        if wDict["Children"] is None:
+            wDict["Children"] = {}
+
+        # the declaration of "Children" has to bee a dictionary
+        if not isinstance(wDict["Children"], dict):
+            raise self.DeclarationError(f"{TheFullPrefix}: 'Children' in child definition for '{wPrefix} is not a dictionary")
+
+        # if 'Desc' not given set it to ''
+        if "Desc" not in wDict:
+            wDict["Desc"] = ""
+
+        # the declaration of "Desc" has to bee a string
+        if not isinstance(wDict["Desc"], str):
+            raise self.DeclarationError(f"{TheFullPrefix}: 'Desc' in child definition for '{wPrefix} is not a string")
+
+        # if 'AddPar' not given set it to ''
+        if "AddPar" not in wDict:
+            wDict["AddPar"] = ""
+
+        # the declaration of "AddPar" has to bee a string
+        if not isinstance(wDict["AddPar"], str):
+            raise self.DeclarationError(f"{TheFullPrefix}: 'AddPar' in child definition for '{wPrefix} is not a string")
+        return wPrefix
+
+    def __ScanDecl(self, Scan: dict, Def: dict, Prefix: str, TheFullPrefix: str) -> None:
+        """
+        Add the names used by one (not built) child to the scan of its pending ancestor.
+
+        Entries __Prepare would reject set "Always", so the error is raised
+        at the next "Process" like without LazyChildren.
+
+        Args:
+            Scan (dict): the scan of the pending child
+            Def (dict): the definition of the child (or grand-child)
+            Prefix (str): the prefix of the child
+            TheFullPrefix (str): the full prefix of the child
+        """
+        Scan["Prefix"].add(Prefix)
+        for ParName, SingleDef in Def.items():
+            Scan["Name"].add(ParName)
+            if not isinstance(SingleDef, dict) or self.__WorkPars["mode"] not in SingleDef:
+                Scan["Always"] = True
+                continue
+            ParMode = SingleDef[self.__WorkPars["mode"]]
+            if SingleDef.get(self.__WorkPars["required"], False):
+                Scan["Always"] = True
+            wLong = SingleDef.get(self.__WorkPars["longpar"], [])
+            for ws in [wLong] if isinstance(wLong, str) else wLong:
+                if isinstance(ws, str):
+                    Scan["Long"].append(ws)
+                else:
+                    Scan["Always"] = True
+            wShort = SingleDef.get(self.__WorkPars["shortpar"], [])
+            for ws in [wShort] if isinstance(wShort, str) else wShort:
+                if isinstance(ws, str):
+                    Scan["Short"].update(ws)
+                else:
+                    Scan["Always"] = True
+            if "+" in Scan["Short"]:
+                Scan["Always"] = True  # may change the scanning mode of getopt
+            if self.__WorkPars["env"] in SingleDef:
+                EnvName = SingleDef[self.__WorkPars["env"]]
+                if not isinstance(EnvName, str) or ParMode in self.__SpecialOpts:
+                    Scan["Always"] = True
+                else:
+                    Scan["Env"].append((TheFullPrefix, ParName, EnvName))
+            elif ParMode not in self.__SpecialOpts:
+                Scan["Env"].append((TheFullPrefix, ParName, None))
+
+    def __ChildSettings(self) -> dict:
+        """Return the settings a child gets from this instance"""
+        return {
+            "UserPars": self.__UserPars,
+            "AllParams": self.__AllParams,
+            "HelpType": self.__HelpType,
+            "Version": self.__Version,
+            "License": self.__License,
+            "ShowPrefixOnHelp": self.__ShowPrefixOnHelp,
+            "ShowConfigName": self.__ShowConfigName,
+            "LazyChildren": self.__LazyChildren,
+        }
+
+    def __ArgTokens(self, Args: Union[list, tuple]) -> tuple:
+        """
+        Return the option names used on the command-line (up to '--').
+
+        Returns:
+            tuple: (list of long names without '=...', set of short characters, prefixes)
+        """
+        Longs = []
+        Shorts = set()
+        for wPar in Args[1:]:
+            if wPar == "--":
+                break
+            if wPar[:2] == "--":
+                Longs.append(wPar[2:].split("=", 1)[0])
+            elif wPar[:1] == "-" and wPar != "-":
+                Shorts.update(wPar[1:])
+        return (Longs, Shorts, self.__ArgPrefixes(Args))
+
+    def __IsTouched(self, Scan: dict, Tokens: tuple, Environ) -> bool:
+        """
+        Check if a pending child could get a value from the command-line or the environment.
+
+        A long option is matched like getopt does it (abbreviations and 'prefix.name'),
+        so every child that would find an option on the command-line is built.
+        """
+        if Scan["Always"]:
+            return True
+        Longs, Shorts, PreList = Tokens
+        if not Shorts.isdisjoint(Scan["Short"]):
+            return True
+        if Scan["Long"]:
+            for wOpt in Longs:
+                if "." in wOpt:
+                    wRest = wOpt.split(".", 1)[1]
+                    if any(wLong.startswith(wRest) or wLong.startswith(wOpt) for wLong in Scan["Long"]):
+                        return True
+                elif any(wLong.startswith(wOpt) for wLong in Scan["Long"]) or any(x.startswith(wOpt) for x in PreList):
+                    return True
+        for TheFullPrefix, ParName, EnvName in Scan["Env"]:
+            if EnvName is None:
+                if self.__EnvPrefix is None:
+                    continue
+                EnvName = f"{self.__EnvPrefix}_{TheFullPrefix}_{ParName}".replace(".", "_").upper()
+            if EnvName in Environ:
+                return True
+        return False
+
+    def __MaterializeNeeded(self, Tokens: tuple, Environ) -> None:
+        """Build all pending children (of the whole tree) touched by the command-line or the environment"""
+        if self.__Pending:
+            self.__Materialize([p for p, Rec in self.__Pending.items() if self.__IsTouched(Rec[1], Tokens, Environ)], Replay=False)
+        for c in self.__Children.values():
+            c.__MaterializeNeeded(Tokens, Environ)  # pylint: disable=protected-access
+
+    def __MaterializeImport(self, wGlobDict, Replay: bool = False) -> list:
+        """Build the pending children with entries in a global import, return their prefixes"""
+        if not self.__Pending or not isinstance(wGlobDict, dict):
+            return []
+        Wanted = [p for p, Rec in self.__Pending.items() if not Rec[1]["Prefix"].isdisjoint(wGlobDict)]
+        self.__Materialize(Wanted, Replay)
+        return Wanted
+
+    def __MaterializeAll(self) -> None:
+        """Build all pending children of the whole subtree"""
+        if self.__Pending:
+            self.__Materialize(list(self.__Pending))
+        for c in self.__Children.values():
+            c.__MaterializeAll()  # pylint: disable=protected-access
+
+    def __Materialize(self, Prefixes: list, Replay: bool = True) -> None:
+        """
+        Build pending children.
+
+        If we are already processed and Replay is True, the new children get their values
+        like in "Process" (defaults, global imports of the ancestors, environment, command-line),
+        but only the phases our other children got.
+
+        Args:
+            Prefixes (list): the prefixes of the pending children
+            Replay (bool, optional): True: process the new children. Defaults to True.
+        """
+        if not Prefixes:
+            return
+        for p in Prefixes:
+            wDict, _, Settings = self.__Pending.pop(p)
+            Child = self.__NewChild(p, Def=wDict["Def"], Description=wDict["Desc"], AddPar=wDict["AddPar"], Settings=Settings)
+            Child.__BuildChildren(wDict["Children"], Checked=True, Settings=Settings)  # pylint: disable=protected-access
+            if Replay and self.__Processed:
+                Child.__ClearWorkDict(self.__MyPwd)  # pylint: disable=protected-access
+                Chain = []
+                Node = self
+                while Node is not None:
+                    Chain.insert(0, Node)
+                    Node = Node.__Parent  # pylint: disable=protected-access
+                for Node in Chain:
+                    for Rec in Node.__ImportRecords:  # pylint: disable=protected-access
+                        if Rec[0]:
+                            Child.__AssignImportValues(Rec[5], FileName=str(Rec[3]))  # pylint: disable=protected-access
+                if self.__Phases >= 1:
+                    Child.__Process(True)  # pylint: disable=protected-access
+                if self.__Phases >= 2:
+                    Child.__Process(False)  # pylint: disable=protected-access
+        # keep the order of the declaration
+        self.__Children = {p: self.__Children[p] for p in self.__ChildOrder if p in self.__Children}
+
     def AddChild(  # pylint: disable=dangerous-default-value,redefined-outer-name
         self,
         Prefix: str,
@@ -2024,34 +2951,55 @@ class Param:
         :type AddPar: str, optional
         :raises self.DeclarationError: If a parameter is invalid
         """
+        Settings = self.__ChildSettings()
+        Settings["Version"] = Version
+        Settings["License"] = License
+        Child = self.__NewChild(Prefix, Def=Def, Description=Description, AddPar=AddPar, Settings=Settings)
+        if Children:
+            Child.__BuildChildren(Children)  # pylint: disable=protected-access
+
+    def __NewChild(  # pylint: disable=redefined-outer-name
+        self,
+        Prefix: str,
+        Def: dict,
+        Description: str,
+        AddPar: str,
+        Settings: dict,
+    ) -> "Param":
+        """
+        Create a child without children and wire it to this instance.
+
+        The child gets the given settings (look at :func:`__ChildSettings`) and shares
+        our translation-table.
+
+        :return: the new child
+        :rtype: Param
+        :raises self.DeclarationError: If the prefix is invalid
+        """
         if not isinstance(Prefix, str):
             raise self.DeclarationError(f"{self.FullPrefix}: Prefix is not a string")
         p = Prefix.lower().strip()
-        if p in self.__Children:
+        if p in self.__Children or p in self.__Pending:
             raise self.DeclarationError(f"{self.FullPrefix}: Prefix '{p}' is already used")
         if p == GLOBAL_NAME:
             raise self.DeclarationError(f"{self.FullPrefix}: Prefix '{p}' is {GLOBAL_NAME} -> invalid!")
-        # self.__Children[p] = self.__class__( Def = Def,
-        self.__Children[p] = Param(
+        Child = Param(
             Def=Def,
-            Args=self.__Argumente,
-            # Translate = self.__DoTranslate,
-            UserPars=self.__UserPars,
             Desc=Description,
-            Children=Children,
             AddPar=AddPar,
-            AllParams=self.__AllParams,
             _Child=True,
-            HelpType=self.__HelpType,
-            Version=Version,
-            License=License,
-            ShowPrefixOnHelp=self.__ShowPrefixOnHelp,
-            ShowConfigName=self.__ShowConfigName,
+            EnvPrefix=self.__EnvPrefix,
             ErrorOnUnknown=False,  # always False for children
+            **Settings,
         )
-        self.__Children[p].__Parent = self  # pylint: disable=protected-access
-        self.__Children[p].__Prefix = p  # pylint: disable=protected-access
-        self.__Children[p]._Translation = self._Translation  # pylint: disable=protected-access
+        Child.__Parent = self  # pylint: disable=protected-access
+        Child.__Prefix = p  # pylint: disable=protected-access
+        Child._Translation = self._Translation  # pylint: disable=protected-access
+        self.__Children[p] = Child
+        self.__ResultLayout = None  # the result-class has a new member
+        if self.__LazyChildren and p not in self.__ChildOrder:
+            self.__ChildOrder.append(p)
+        return Child
 
     def SetAllParams(self, AllParams: bool = True) -> None:
         """
@@ -2063,7 +3011,7 @@ class Param:
         :type AllParams: bool, optional
         """
         self.__AllParams = AllParams
-        self.__IsPrepared = False  # we need a Prepare-call after this
+        self.__DefDirty = True  # we need a Prepare-call after this
 
     def SetDef(self, Def: dict = {}) -> None:  # pylint: disable=dangerous-default-value
         """
@@ -2142,6 +3090,13 @@ class Param:
             d : Description for helptext
             M : If True: multiples of this option are accepted.
                 the resulting value is a list.
+            A : Compact storage for multiples of 'i' and 'F' (needs "M": True) ->
+                    True or "array" = array.array('q') or array.array('d'),
+                    "numpy" = numpy-array if numpy is installed, else like True
+                Each argument may be a comma separated list of values
+                or "@file" to read such a list from a file.
+            e : Name of an environment variable for this option
+                (look at :func:`SetEnvPrefix` for details).
 
         The entries "m" and ("s" or "l") must be present, all others are optional.
 
@@ -2150,7 +3105,7 @@ class Param:
             self.__Definition = Def
         else:
             raise TypeError(f"{self.FullPrefix}: Def is not a dict")
-        self.__IsPrepared = False  # we need a Prepare-call after this
+        self.__DefDirty = True  # we need a Prepare-call after this
 
     @property
     def Definition(self) -> dict:
@@ -2356,6 +3311,10 @@ class Param:
         """
         Set the argument list to process
 
+        Children use the argument list of their parent as long as they
+        get no own list by this function. Setting the arguments does not
+        require a new preparation of the definitions.
+
         :param Args: Runtime Arguments, if None: use sys.argv as the arguments , defaults to None
         :type Args: Optional[Union[list, tuple]], optional
         :raises TypeError: if Args is not a list or tuple
@@ -2366,8 +3325,247 @@ class Param:
             self.__Argumente = Args
         else:
             raise TypeError(f"{self.FullPrefix}: Args is not a list or tuple")
-        for c in self.__Children.values():
-            c.SetArgs(Args)
+
+    def __GetArgs(self) -> Union[list, tuple]:
+        """Return the argument list of this node (inherited from the parent if not set)"""
+        if self.__Argumente is None:
+            if self.__Parent is not None:
+                return self.__Parent.__GetArgs()  # pylint: disable=protected-access
+            Args = sys.argv
+        else:
+            Args = self.__Argumente
+        if self.__ResponseFiles is None:
+            return Args
+        # the files are read once per "Process", all children share the expanded list
+        Root = self.__GetRoot()
+        Hit = Root.__ArgCache.get(id(Args))  # pylint: disable=protected-access
+        if Hit is not None and Hit[0] is Args:
+            return Hit[1]
+        Expanded = [Args[0]] if len(Args) > 0 else []
+        self.__ExpandArgs(islice(Args, 1, None), Expanded, 0)
+        Root.__ArgCache[id(Args)] = (Args, Expanded)  # pylint: disable=protected-access
+        return Expanded
+
+    def SetResponseFiles(self, Enable: bool = True, Quoted: bool = False, MaxDepth: int = 8) -> None:
+        """
+        Enable the expansion of response-files within the argument list.
+
+        An argument '@name' is replaced by the arguments read from the file 'name'
+        (relative to the current directory), response-files may contain other
+        response-files up to MaxDepth levels. Arguments after '--' are not expanded.
+        The files are read line by line (streaming) once per "Process" directly into the
+        argument list used by all children, e.g.
+
+        .. code-block:: bash
+
+            find . -name '*.txt' > files.txt
+            PROG -v @files.txt
+
+        Set this on the instance owning the argument list (normally the root).
+
+        :param Enable: True: expand '@name' arguments, defaults to True
+        :type Enable: bool, optional
+        :param Quoted: False: every line is one argument (empty lines are ignored),
+            True: the files are split like a shell would do (:mod:`shlex`), defaults to False
+        :type Quoted: bool, optional
+        :param MaxDepth: max. nesting of response-files, defaults to 8
+        :type MaxDepth: int, optional
+        :raises TypeError: if a parameter has the wrong type
+        """
+        if not isinstance(Enable, bool) or not isinstance(Quoted, bool):
+            raise TypeError(f"{self.FullPrefix}: Enable and Quoted must be bool")
+        if not isinstance(MaxDepth, int) or MaxDepth < 1:
+            raise TypeError(f"{self.FullPrefix}: MaxDepth must be a positive int")
+        self.__ResponseFiles = (Quoted, MaxDepth) if Enable else None
+
+    def SetImportLayers(self, Files: Optional[list] = None, Name: Optional[str] = None, Required: bool = False) -> None:
+        """
+        Import a stack of configuration files (like '<' global imports) at the start of every :func:`Process`.
+
+        The files are given in ascending precedence, e.g. system-wide, per user, per project.
+        With Name the files found by :func:`LayerPaths` are put in front of Files.
+        Every file is decoded once, the entries are merged per prefix (a later file wins for every
+        single key) and every resulting value is checked once. The layers are imported bevore
+        the '<' and 'x' options of the command-line, so the order of the sources is
+
+            1. the defaults from the definition
+            2. the layers
+            3. the values from imported files ('<', 'x')
+            4. the values from the environment
+            5. the values from the command-line
+
+        The layers are watched by :func:`Reload` like the other imported files.
+        Set this on the instance "Process" is called for (normally the root).
+
+        :param Files: paths of the files (lowest precedence first), defaults to None
+        :type Files: Optional[list], optional
+        :param Name: name for :func:`LayerPaths`, None: no discovery, defaults to None
+        :type Name: Optional[str], optional
+        :param Required: True: a file of Files that does not exist is an error, else it is skipped.
+            Discovered files are always optional. Defaults to False
+        :type Required: bool, optional
+        :raises TypeError: if a parameter has the wrong type
+        """
+        if Files is None:
+            Files = []
+        if not isinstance(Files, (list, tuple)) or not all(isinstance(f, (str, PurePath)) for f in Files):
+            raise TypeError(f"{self.FullPrefix}: Files must be a list of paths")
+        if Name is not None and not isinstance(Name, str):
+            raise TypeError(f"{self.FullPrefix}: Name is not a string")
+        if not isinstance(Required, bool):
+            raise TypeError(f"{self.FullPrefix}: Required must be bool")
+        self.__ImportLayers = (tuple(str(f) for f in Files), Name, Required) if Files or Name else None
+
+    @staticmethod
+    def LayerPaths(Name: str, Cwd: Optional[str] = None, Environ: Optional[dict] = None) -> list:
+        """
+        Return the standard locations of the configuration files for Name (lowest precedence first):
+
+        .. code-block:: text
+
+            /etc/<Name>.json                                   system-wide
+            $XDG_CONFIG_HOME/<Name>.json (~/.config/<Name>.json) per user
+            .<Name>.json in Cwd or the nearest parent          per project
+
+        The files are not checked for existence.
+
+        :param Name: the name of the program
+        :type Name: str
+        :param Cwd: the directory to start the search for the project-file, defaults to the current directory
+        :type Cwd: Optional[str], optional
+        :param Environ: the environment, defaults to os.environ
+        :type Environ: Optional[dict], optional
+        :return: list of the paths
+        :rtype: list[str]
+        """
+        if Environ is None:
+            Environ = os.environ  # type: ignore
+        ConfigHome = Environ.get("XDG_CONFIG_HOME", "")
+        if ConfigHome == "":
+            ConfigHome = str(Path(Environ.get("HOME", str(Path.home()))) / ".config")
+        Paths = [f"/etc/{Name}.json", str(Path(ConfigHome) / f"{Name}.json")]
+        Dir = Path(Cwd if Cwd is not None else Path.cwd()).absolute()
+        for d in chain((Dir,), Dir.parents):
+            if (d / f".{Name}.json").is_file():
+                Paths.append(str(d / f".{Name}.json"))
+                break
+        return Paths
+
+    def __LayerFiles(self, Pwd: str) -> list:
+        """Return [(Path, Required), ...] of the layered import (discovered files first, searched from Pwd)"""
+        if self.__ImportLayers is None:
+            return []
+        Files, Name, Required = self.__ImportLayers
+        Layers = []
+        if Name is not None:
+            Layers = [(f, False) for f in self.LayerPaths(Name, Pwd, self.__GetEnviron())]
+        return Layers + [(f, Required) for f in Files]
+
+    def __ImportLayered(self) -> None:
+        """Decode the layers once, merge them per prefix (last wins) and check the merged values once
+
+        Raises:
+            self.ParamError: if a required file is missing, a file can not be decoded or a value is invalid
+        """
+        OptionName = "ImportLayers"
+        wMod = self.__WorkModes["glob_import"]
+        Merged = {}
+        Sources = {}
+        for OptionPath, Required in self.__LayerFiles(self.__MyPwd):
+            FullPath = self.__Lookup("resolve", self.__InDir(self.__MyPwd, OptionPath), self.__Resolve, OptionName, wMod)
+            if not self.__Lookup("stat", FullPath, self.__StatPath, OptionName, wMod)[1]:
+                if Required:
+                    raise self.ParamError(
+                        self.__Msg(
+                            "PathNoFile", **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
+                        )
+                    ) from None
+                continue
+            Signature = self.__FileSignature(FullPath)
+            wGlobDict = self.__LoadImport(True, OptionName, OptionPath, FullPath)
+            if not isinstance(wGlobDict, dict):
+                raise self.ParamError(
+                    self.__Msg(
+                        "JsonError",
+                        **{"wMsg": "not an object", "OptionPath": OptionPath, "FullPath": FullPath, "OptionName": OptionName},
+                    )
+                ) from None
+            self.__ImportRecords.append([True, OptionName, OptionPath, FullPath, Signature, wGlobDict])
+            for Prefix, wDict in wGlobDict.items():
+                if isinstance(wDict, dict):
+                    Merged.setdefault(Prefix, {}).update(wDict)
+                    Sources.setdefault(Prefix, {}).update(dict.fromkeys(wDict, str(FullPath)))
+        if Merged:
+            self.__AssignImportValues(Merged, FileName="", Sources=Sources)
+
+    def __ExpandArgs(self, Tokens, Expanded: list, Depth: int) -> bool:
+        """
+        Append Tokens to Expanded, arguments '@name' are replaced by the content of the file.
+
+        Args:
+            Tokens (iterator): the arguments
+            Expanded (list): the resulting argument list
+            Depth (int): the nesting level of Tokens (0 = command-line)
+
+        Raises:
+            self.ParamError: if a file could not be read or the files are nested too deep
+
+        Returns:
+            bool: True if '--' was found (all following arguments are appended unchanged)
+        """
+        for wArg in Tokens:
+            if wArg == "--":
+                Expanded.append(wArg)
+                Expanded.extend(Tokens)
+                return True
+            if wArg[:1] == "@" and len(wArg) > 1:
+                if self.__ReadResponseFile(wArg[1:], Expanded, Depth + 1):
+                    Expanded.extend(Tokens)
+                    return True
+            else:
+                Expanded.append(wArg)
+        return False
+
+    @staticmethod
+    def __ShellTokens(wFile):
+        """
+        Split a file like a shell would do, line by line.
+
+        Lines without quotes or backslashes are split by str.split, all others by
+        shlex.split (together with the following lines as long as a quotation is open
+        or the line ends with an escaped newline).
+        The result is the same as splitting the whole file at once.
+        """
+        Buffer = ""
+        for Line in wFile:
+            Buffer += Line
+            if '"' not in Buffer and "'" not in Buffer and "\\" not in Buffer:
+                yield from Buffer.split()
+                Buffer = ""
+                continue
+            if Line.endswith("\n") and (len(Line) - 1 - len(Line[:-1].rstrip("\\"))) % 2 == 1:
+                continue  # backslash-newline -> the token goes on in the next line
+            try:
+                Tokens = shlex.split(Buffer)
+            except ValueError:
+                continue  # open quotation -> take the next line
+            yield from Tokens
+            Buffer = ""
+        if Buffer != "":
+            yield from shlex.split(Buffer)  # raises ValueError on an open quotation
+
+    def __ReadResponseFile(self, FileName: str, Expanded: list, Depth: int) -> bool:
+        """Append the arguments of one response-file to Expanded (see :func:`__ExpandArgs`)"""
+        Quoted, MaxDepth = self.__ResponseFiles  # type: ignore
+        if Depth > MaxDepth:
+            raise self.ParamError(self.__Msg("ResponseFileDepth", **{"FileName": FileName, "MaxDepth": MaxDepth})) from None
+        try:
+            with open(os.path.join(self.__GetCwd(), FileName), encoding="utf-8") as wFile:
+                if Quoted:
+                    return self.__ExpandArgs(self.__ShellTokens(wFile), Expanded, Depth)
+                return self.__ExpandArgs((l.rstrip("\r\n") for l in wFile if l not in ("\n", "\r\n")), Expanded, Depth)
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            raise self.ParamError(self.__Msg("ResponseFileError", **{"FileName": FileName, "Error": exc})) from None
 
     def SetChk(self, Chk=None):
         """
@@ -2387,9 +3585,6 @@ class Param:
                 self.__ChkFunc = Chk  # pylint: disable=unused-private-member
             else:
                 raise TypeError(f"{self.FullPrefix}: Check is not a function")
-        self.__IsPrepared = False  # we need a Prepare-call after this
-        for c in self.__Children.values():
-            c.SetChk(Chk)
 
     def SetDesc(self, Desc: str = "") -> None:
         """
@@ -2404,7 +3599,7 @@ class Param:
             self.__Description = Desc
         else:
             raise TypeError(f"{self.FullPrefix}: Desc is not a string")
-        self.__IsPrepared = False  # we need a Prepare-call after this
+        self.__TextDirty = True  # only the usage-text has to be generated again
 
     def SetAddPar(self, AddPar: str = "") -> None:
         """
@@ -2421,18 +3616,110 @@ class Param:
             self.__AddPar = AddPar
         else:
             raise TypeError(f"{self.FullPrefix}: AddPar is not a string")
-        self.__IsPrepared = False  # we need a Prepare-call after this
+        self.__TextDirty = True  # only the usage-text has to be generated again
 
-    def MyProgName(self) -> str:
+    def SetEnvPrefix(self, EnvPrefix: Optional[str] = None) -> None:
         """
-        Return the program-name
+        Set the prefix used to derive environment-variable names for all options.
 
-        :return: Name of the executeable
-        :rtype: str
-        """
-        return self.__MyProgName
+        If set, every option (except the special modes like help, import and export)
+        can also be given by an environment variable named
 
-    def MyProgPath(self) -> str:
+        .. code-block:: text
+
+            <EnvPrefix>_<FullPrefix>_<Name>
+
+        in upper case with all '.' replaced by '_'. E.g. with EnvPrefix='MYAPP' the option
+        'Count' of the child 'alpha' is read from 'MYAPP_GLOBAL_ALPHA_COUNT'.
+        An explicit name given with the 'e' entry of a definition always wins.
+
+        The values are taken in the following order, a later source overwrites an earlier one:
+
+            1. the defaults from the definition
+            2. the values from imported files ('<', 'x')
+            3. the values from the environment
+            4. the values from the command-line
+
+        The names are compiled once when the definitions are prepared and the values are
+        checked like command-line values. For 'M' (multiple) options the value is split
+        like a shell would do (:func:`shlex.split`) and replaces the imported list, a
+        'C' (counter) option is set to the given number.
+
+        :param EnvPrefix: The prefix for the environment names, None disables
+            the derived names. Defaults to None.
+        :type EnvPrefix: Optional[str], optional
+        :raises TypeError: if EnvPrefix is not a string or None
+        """
+        if EnvPrefix is not None and not isinstance(EnvPrefix, str):
+            raise TypeError(f"{self.FullPrefix}: EnvPrefix is not a string")
+        self.__EnvPrefix = EnvPrefix
+        self.__DefDirty = True  # we need a Prepare-call after this
+        for c in self.__Children.values():
+            c.SetEnvPrefix(EnvPrefix)
+
+    def SetEnviron(self, Environ: Optional[dict] = None) -> None:
+        """
+        Set the environment used as value-source (see :func:`SetEnvPrefix`).
+
+        Only the setting of the root is used.
+
+        :param Environ: A dictionary of environment-variables, if None: use os.environ, defaults to None
+        :type Environ: Optional[dict], optional
+        :raises TypeError: if Environ is not a dict or None
+        """
+        if Environ is not None and not isinstance(Environ, dict):
+            raise TypeError(f"{self.FullPrefix}: Environ is not a dict")
+        self.__Environ = Environ
+
+    def SetEngine(self, Engine: str = "fast") -> None:
+        """
+        Select the getopt-engine used by :func:`Process`.
+
+        "fast" is the index based tokenizer, "reference" the original implementation
+        (a port of the getopt module, slicing the argument list for every token). Both give the
+        same results, the reference is kept to verify optimisations (look at :func:`FuzzEngines`).
+
+        Only the setting of the root is used.
+
+        :param Engine: "fast" or "reference", defaults to "fast"
+        :type Engine: str, optional
+        :raises self.DeclarationError: if the engine is unknown
+        """
+        if Engine not in ("fast", "reference"):
+            raise self.DeclarationError(f"{self.FullPrefix}: Engine '{Engine}' is unknown (use 'fast' or 'reference')")
+        self.__Engine = Engine
+
+    def __Getopt(self):
+        """Return the _gnu_getopt function of the engine selected by the root"""
+        if self.__GetRoot().__Engine == "reference":
+            return self._ref_gnu_getopt
+        return self._gnu_getopt
+
+    def __GetRoot(self) -> "Param":
+        """Return the root of the tree"""
+        Root = self
+        while Root.__Parent is not None:  # pylint: disable=protected-access
+            Root = Root.__Parent  # pylint: disable=protected-access
+        return Root
+
+    def __GetEnviron(self) -> dict:
+        """Return the environment of the root (os.environ if not set)"""
+        if self.__Parent is not None:
+            return self.__Parent.__GetEnviron()  # pylint: disable=protected-access
+        if self.__Environ is None:
+            return os.environ  # type: ignore
+        return self.__Environ
+
+    def MyProgName(self) -> str:
+        """
+        Return the program-name
+
+        :return: Name of the executeable
+        :rtype: str
+        """
+        return self.__MyProgName
+
+    def MyProgPath(self) -> str:
         """
         Return the program-path
 
@@ -2489,10 +3776,13 @@ class Param:
         else:
             Text = f"{VerText}{self._Translation['HelpUsage']}\n\n    {self.__MyProgName} {self._Translation['HelpOptionInline']} {self.__AddPar}\n\n{wDesc}{wPrefText}{self._Translation['HelpOptions']}\n"
         for Single in self.__UsageTextList:
-            Ut_Short = Single[0]
-            Ut_Long = Single[1]
-            Ut_Param = Single[2]
-            Ut_Type = Single[3]
+            Ut_Short = list(Single[0])
+            Ut_Long = list(Single[1])
+            if Single[2]:
+                Ut_Param = self._Translation["HelpValue"]
+            else:
+                Ut_Param = " " * len(self._Translation["HelpValue"])
+            Ut_Type = self._Translation[Single[3]]
             Ut_Default = Single[4]
             Ut_Low = Single[6]
             Ut_High = Single[7]
@@ -2594,6 +3884,7 @@ class Param:
                     Text += wLine
             Text += "\n"
         self.__UsageText = Text
+        self.__TextDirty = False
 
     def Usage(self, ShowPrefixHeader: bool = True) -> str:
         """
@@ -2602,9 +3893,13 @@ class Param:
         :return: The help-text as would be printet if a "Help" option is set on command-line
         :rtype: str
         """
-        if not self.__IsPrepared:
+        if self.__DefDirty:
             self.__Prepare()
+        if self.__TextDirty:
+            self.__GenUsageText(*self.__UsageLens, IsChild=self.__Parent is not None)
         Ret = self.__UsageText
+        if self.__Pending:
+            self.__Materialize(list(self.__Pending))
         for c in self.__Children.values():
             Ret += (
                 f"""
@@ -2621,34 +3916,234 @@ class Param:
                 Ret += "    " + l + "\n"
         return Ret
 
-    def __Prepare(self) -> None:
+    def __CompletionTable(self, Table: dict) -> None:
+        """
+        Collect all options of this node and its children for the completion.
+
+        Only the compiled option-tables are used, no usage-text is generated.
+
+        Args:
+            Table (dict): option ("--name", "--prefix.name", "-n") -> [NeedArg, Mode]
+        """
+        if self.__DefDirty:
+            self.__Prepare()
+        Entries = []
+        for wLong in self.__LongList:
+            NeedArg = wLong.endswith("=")
+            wName = wLong[:-1] if NeedArg else wLong
+            Entries.append(("--" + wName, NeedArg))
+            Entries.append((f"--{self.__Prefix}.{wName}", NeedArg))
+        for wShort in self.__ShortList:
+            Entries.append(("-" + wShort[0], wShort.endswith(":")))
+        for wOpt, NeedArg in Entries:
+            wKey = wOpt if not wOpt.startswith(f"--{self.__Prefix}.") else "--" + wOpt.split(".", 1)[1]
+            Mode = self.__Definition[self.__ParDict[wKey]][self.__WorkPars["mode"]]
+            if wOpt in Table:
+                if NeedArg and not Table[wOpt][0]:
+                    Table[wOpt] = [NeedArg, Mode]
+            else:
+                Table[wOpt] = [NeedArg, Mode]
+        if self.__Pending:
+            self.__Materialize(list(self.__Pending))
+        for c in self.__Children.values():
+            c.__CompletionTable(Table)  # pylint: disable=protected-access
+
+    def __CompletePath(self, Partial: str, Mode: str) -> list:
+        """
+        Complete a path for options of the modes 'file', 'dir', 'path' and the imports.
+
+        Directories are returned with a trailing '/', files only if the mode is not 'dir'.
+        """
+        wHead, wTail = os.path.split(Partial)
+        wDir = os.path.expanduser(wHead) if wHead != "" else "."
+        Ret = []
+        try:
+            with os.scandir(wDir) as It:
+                for Entry in It:
+                    if not Entry.name.startswith(wTail):
+                        continue
+                    if Entry.name.startswith(".") and not wTail.startswith("."):
+                        continue
+                    if Entry.is_dir():
+                        Ret.append(os.path.join(wHead, Entry.name) + "/")
+                    elif Mode != self.__WorkModes["dir"]:
+                        Ret.append(os.path.join(wHead, Entry.name))
+        except OSError:
+            return []
+        return sorted(Ret)
+
+    def Complete(self, Words: Union[list, tuple]) -> list:
+        """
+        Return the completion candidates for a partial command-line.
+
+        Only the compiled option-tables are used (no "Process", no usage-text),
+        so this is fast enough to be called on every TAB press of a shell.
+
+        :param Words: The words of the command-line without the program name. The last
+            word is the (maybe empty) word to complete.
+        :type Words: Union[list, tuple]
+        :return: A sorted list of candidates. Options needing a value end with '=', directories
+            end with '/'. An empty list means "let the shell complete file-names".
+        :rtype: list
+
+        .. code-block:: python
+
+            P.Complete(['--ver'])           # -> ['--verbose']
+            P.Complete(['--alpha.c'])       # -> ['--alpha.count=']
+            P.Complete(['--file=/tm'])      # -> ['--file=/tmp/']
+        """
+        if not isinstance(Words, (list, tuple)):
+            raise TypeError(f"{self.FullPrefix}: Words is not a list or tuple")
+        Words = list(Words) if len(Words) > 0 else [""]
+        if "--" in Words[:-1]:
+            return []
+        Table = {}
+        self.__CompletionTable(Table)
+        PathModes = (
+            self.__WorkModes["file"],
+            self.__WorkModes["dir"],
+            self.__WorkModes["path"],
+            self.__WorkModes["import"],
+            self.__WorkModes["glob_import"],
+        )
+        Cur = Words[-1]
+        Prev = Words[-2] if len(Words) > 1 else ""
+        if Prev in Table and Table[Prev][0]:
+            # the value of an option given as a separate word
+            if Table[Prev][1] in PathModes:
+                return self.__CompletePath(Cur, Table[Prev][1])
+            return []
+        if Cur.startswith("--") and "=" in Cur:
+            wOpt, wVal = Cur.split("=", 1)
+            if wOpt in Table and Table[wOpt][0] and Table[wOpt][1] in PathModes:
+                return [wOpt + "=" + x for x in self.__CompletePath(wVal, Table[wOpt][1])]
+            return []
+        if not Cur.startswith("-"):
+            return []
+        if Cur == "-":
+            return sorted(k + ("=" if v[0] and k.startswith("--") else "") for k, v in Table.items())
+        if not Cur.startswith("--"):
+            # short options are complete with 2 characters
+            return [Cur] if Cur[:2] in Table else []
+        return sorted(k + ("=" if v[0] else "") for k, v in Table.items() if k.startswith("--") and k.startswith(Cur))
+
+    def __CompletionResponder(self) -> None:
+        """
+        Answer a completion request of the shell glue (look at :func:`CompletionScript`).
+
+        If the environment-variable ARGPASS_COMPLETE is set, the candidates for
+        COMP_LINE (up to COMP_POINT) are printed one per line and the program exits.
+        """
+        Environ = self.__GetEnviron()
+        Shell = Environ.get(COMPLETE_ENV, "")
+        if Shell == "":
+            return
+        Line = Environ.get("COMP_LINE", "")
+        try:
+            Point = int(Environ.get("COMP_POINT", len(Line)))
+        except ValueError:
+            Point = len(Line)
+        Line = Line[:Point]
+        Words = Line.split()
+        if Line == "" or Line[-1].isspace():
+            Words.append("")
+        Cands = self.Complete(Words[1:])
+        Cur = Words[-1]
+        if Shell == "bash" and "=" in Cur:
+            # bash splits the word at '=' (COMP_WORDBREAKS)
+            Cut = Cur.rindex("=") + 1
+            Cands = [x[Cut:] for x in Cands]
+        print("\n".join(Cands))
+        sys.exit(0)
+
+    def CompletionScript(self, Shell: str = "bash", ProgName: Optional[str] = None) -> str:
+        """
+        Return the shell glue-code for the completion of this program.
+
+        The script calls the program itself with the environment-variable ARGPASS_COMPLETE
+        set, "Process" answers these calls with the candidates of :func:`Complete`
+        and exits. There is no option printing the script, write it from the module
+        defining the parameters (here *myprog* with the instance *MyParam*):
+
+        .. code-block:: bash
+
+            python3 -c 'import myprog; print(myprog.MyParam.CompletionScript("bash", "myprog"))' > /etc/bash_completion.d/myprog
+            # or in ~/.bashrc
+            eval "$(python3 -c 'import myprog; print(myprog.MyParam.CompletionScript("bash", "myprog"))')"
+
+        :param Shell: "bash" or "zsh", defaults to "bash"
+        :type Shell: str, optional
+        :param ProgName: The name of the command to complete, defaults to the name of the program
+        :type ProgName: Optional[str], optional
+        :raises self.DeclarationError: if the shell is not supported
+        :return: The script
+        :rtype: str
+        """
+        if ProgName is None:
+            ProgName = Path(sys.argv[0]).name
+        FuncName = "_argpass_complete_" + "".join(x if x.isalnum() else "_" for x in ProgName)
+        if Shell == "bash":
+            return f"""{FuncName}() {{
+    local IFS=$'\\n'
+    COMPREPLY=( $({COMPLETE_ENV}=bash COMP_LINE="$COMP_LINE" COMP_POINT="$COMP_POINT" "${{COMP_WORDS[0]}}" 2>/dev/null) )
+    if [[ ${{#COMPREPLY[@]}} -eq 1 && ( "${{COMPREPLY[0]}}" == *= || "${{COMPREPLY[0]}}" == */ ) ]]; then
+        compopt -o nospace
+    fi
+}}
+complete -o default -F {FuncName} {shlex.quote(ProgName)}
+"""
+        if Shell == "zsh":
+            return f"""#compdef {ProgName}
+{FuncName}() {{
+    local -a reply sp nosp
+    local c
+    reply=( ${{(f)"$({COMPLETE_ENV}=zsh COMP_LINE="$BUFFER" COMP_POINT="$CURSOR" "${{words[1]}}" 2>/dev/null)"}} )
+    if (( ${{#reply}} == 0 )); then
+        _files
+        return
+    fi
+    for c in $reply; do
+        if [[ $c == *= || $c == */ ]]; then nosp+=( $c ); else sp+=( $c ); fi
+    done
+    (( ${{#sp}} )) && compadd -- $sp
+    (( ${{#nosp}} )) && compadd -S '' -- $nosp
+}}
+compdef {FuncName} {shlex.quote(ProgName)}
+"""
+        raise self.DeclarationError(f"{self.FullPrefix}: Shell '{Shell}' is not supported for completion")
+
+    def __Prepare(self, Pwd: Optional[str] = None) -> None:
         """
         Prepare the class to be able to be used
 
+        Only this node is compiled (option-tables and defaults), the children
+        are prepared by themselves if necessary (look at __PrepareTree).
+        The usage-text is generated on demand by "Usage".
+
+        Args:
+            Pwd (str, optional): The directory relative defaults are based on. Defaults to the current directory.
+
         Raises:
             self.DeclarationError: if there are errors within the declaration-dict
         """
 
         # clear all values
-        self.__WorkDict.clear()
-        self.__UsageText = ""
+        Defaults = {}
         LongParLen = 0
         ShortParLen = 0
         self.__LongList = []
         self.__ShortStr = ""
         self.__ShortList = []
         self.__ParDict = {}
-        self.__RemainArgs = []
-        self.__UnusedArgs = []
+        self.__EnvMap = {}
         self.__UsageTextList = []
-        self.__MyPwd = str(Path.cwd())
+        for ListVal in self.__ModeToList.values():
+            ListVal.clear()
+        self.__PwdDependent = False
+        self.__MyPwd = self.__GetCwd() if Pwd is None else Pwd
         self.__MyProgName = Path(sys.argv[0]).stem
         self.__MyProgPath = str(Path(sys.argv[0]).parent)
 
-        for c in self.__Children.values():
-            if not c.__IsPrepared:  # pylint: disable=protected-access
-                c.__Prepare()  # pylint: disable=protected-access
-
         for ParName in self.__Definition.keys():
             SingleDef = self.__Definition[ParName]
             Ut_Short = []
@@ -2676,52 +4171,52 @@ class Param:
             else:
                 raise self.DeclarationError(f"{self.FullPrefix}: No mode setting in Def for {ParName}")
             if ParMode == self.__WorkModes["path"]:
-                Ut_Type = self._Translation["TypePath"]
+                Ut_Type = "TypePath"
                 SingleDef[self.__WorkPars["needoption"]] = True
             elif ParMode == self.__WorkModes["int"]:
-                Ut_Type = self._Translation["TypeInteger"]
+                Ut_Type = "TypeInteger"
                 Ut_Default = 0
             elif ParMode in self.__IpModes:
-                Ut_Type = self._Translation[self.__IpModes[ParMode][3]]
+                Ut_Type = self.__IpModes[ParMode][3]
             elif ParMode == self.__WorkModes["bool"]:
-                Ut_Type = self._Translation["TypeBool"]
+                Ut_Type = "TypeBool"
                 Ut_Default = False
             elif ParMode == self.__WorkModes["float"]:
-                Ut_Type = self._Translation["TypeFloat"]
+                Ut_Type = "TypeFloat"
                 Ut_Default = 0.0
             elif ParMode == self.__WorkModes["file"]:
-                Ut_Type = self._Translation["TypeFile"]
+                Ut_Type = "TypeFile"
                 SingleDef[self.__WorkPars["needoption"]] = True
             elif ParMode == self.__WorkModes["dir"]:
-                Ut_Type = self._Translation["TypeDir"]
+                Ut_Type = "TypeDir"
                 SingleDef[self.__WorkPars["needoption"]] = True
             elif ParMode == self.__WorkModes["count"]:
-                Ut_Type = self._Translation["TypeCount"]
+                Ut_Type = "TypeCount"
                 if self.__WorkPars["longpar"] in ParKeys:
                     SingleDef[self.__WorkPars["needoption"]] = True
             elif ParMode == self.__WorkModes["help"]:
-                Ut_Type = self._Translation["TypeHelp"]
+                Ut_Type = "TypeHelp"
                 Ut_HasConfig = False
             elif ParMode == self.__WorkModes["import"]:
-                Ut_Type = self._Translation["TypeImport"]
+                Ut_Type = "TypeImport"
                 SingleDef[self.__WorkPars["needoption"]] = True
                 Ut_HasConfig = False
             elif ParMode == self.__WorkModes["export"]:
-                Ut_Type = self._Translation["TypeExport"]
+                Ut_Type = "TypeExport"
                 Ut_HasConfig = False
             elif ParMode == self.__WorkModes["glob_import"]:
                 if self.__Parent is not None:
                     raise self.DeclarationError(f"{self.FullPrefix}: {ParName} is invalid in child definition")
-                Ut_Type = self._Translation["TypeGlobImport"]
+                Ut_Type = "TypeGlobImport"
                 SingleDef[self.__WorkPars["needoption"]] = True
                 Ut_HasConfig = False
             elif ParMode == self.__WorkModes["glob_export"]:
                 if self.__Parent is not None:
                     raise self.DeclarationError(f"{self.FullPrefix}: {ParName} is invalid in child definition")
-                Ut_Type = self._Translation["TypeGlobExport"]
+                Ut_Type = "TypeGlobExport"
                 Ut_HasConfig = False
             else:
-                Ut_Type = self._Translation["TypeStr"]
+                Ut_Type = "TypeStr"
 
             if self.__WorkPars["default"] in ParKeys:
                 wMode = SingleDef[self.__WorkPars["mode"]]
@@ -2740,36 +4235,39 @@ class Param:
                                 f"{self.FullPrefix}: {ParName} default value '{DefVal}' is invalid for this type (IP{self.__IpModes[wMode][2]})"
                             )
                         else:
-                            self.__WorkDict[ParName] = wIp
+                            Defaults[ParName] = wIp
                     else:
-                        self.__WorkDict[ParName] = SingleDef[self.__WorkPars["default"]]
+                        Defaults[ParName] = SingleDef[self.__WorkPars["default"]]
                 if ParMode == self.__WorkModes["file"]:
                     wText = SingleDef[self.__WorkPars["default"]]
                     try:
                         if wText[0] != "/":
                             wText = self.__MyPwd + "/" + wText
+                            self.__PwdDependent = True
                         wFile = Path(wText).absolute()
                         if wFile.is_file():
-                            self.__WorkDict[ParName] = str(wFile)
+                            Defaults[ParName] = str(wFile)
                     except IndexError:
                         wText = ""
-                        self.__WorkDict[ParName] = wText
+                        Defaults[ParName] = wText
                 elif ParMode == self.__WorkPars["description"]:
                     wText = SingleDef[self.__WorkPars["default"]]
                     if wText[0] != "/":
                         wText = self.__MyPwd + "/" + wText
+                        self.__PwdDependent = True
                     wFile = Path(wText).absolute()
                     if wFile.is_dir():
-                        self.__WorkDict[ParName] = str(wFile)
+                        Defaults[ParName] = str(wFile)
                 elif ParMode == self.__WorkModes["path"]:
                     wText = SingleDef[self.__WorkPars["default"]]
                     if len(wText) > 0:
                         if wText[0] != "/":
                             wText = self.__MyPwd + "/" + wText
+                            self.__PwdDependent = True
                         wFile = Path(wText).absolute()
-                        self.__WorkDict[ParName] = str(wFile)
+                        Defaults[ParName] = str(wFile)
                     else:
-                        self.__WorkDict[ParName] = ""
+                        Defaults[ParName] = ""
                 if ParMode != self.__WorkModes["pwd"]:
                     Ut_Default = SingleDef[self.__WorkPars["default"]]
                 else:
@@ -2777,12 +4275,12 @@ class Param:
             else:
                 if self.__AllParams:
                     if ParMode == self.__WorkModes["bool"]:
-                        self.__WorkDict[ParName] = False
+                        Defaults[ParName] = False
                     elif ParMode == self.__WorkModes["text"] or ParMode == self.__WorkModes["pwd"]:
                         if ParMulti:
-                            self.__WorkDict[ParName] = []
+                            Defaults[ParName] = []
                         else:
-                            self.__WorkDict[ParName] = ""
+                            Defaults[ParName] = ""
                     elif (
                         ParMode == self.__WorkModes["ip"]
                         or ParMode == self.__WorkModes["ip4"]
@@ -2790,41 +4288,55 @@ class Param:
                         or ParMode == self.__WorkModes["lip"]
                     ):
                         if ParMulti:
-                            self.__WorkDict[ParName] = ["0.0.0.0"]
+                            Defaults[ParName] = ["0.0.0.0"]
                         else:
-                            self.__WorkDict[ParName] = "0.0.0.0"
+                            Defaults[ParName] = "0.0.0.0"
                     elif ParMode == self.__WorkModes["ip6"] or ParMode == self.__WorkModes["lip6"]:
                         if ParMulti:
-                            self.__WorkDict[ParName] = ["::"]
+                            Defaults[ParName] = ["::"]
                         else:
-                            self.__WorkDict[ParName] = "::"
+                            Defaults[ParName] = "::"
                     elif ParMode == self.__WorkModes["int"]:
                         if ParMulti:
-                            self.__WorkDict[ParName] = []
+                            Defaults[ParName] = []
                         else:
-                            self.__WorkDict[ParName] = 0
+                            Defaults[ParName] = 0
                     elif ParMode == self.__WorkModes["float"]:
                         if ParMulti:
-                            self.__WorkDict[ParName] = []
+                            Defaults[ParName] = []
                         else:
-                            self.__WorkDict[ParName] = 0.0
+                            Defaults[ParName] = 0.0
                     elif ParMode == self.__WorkModes["count"]:
-                        self.__WorkDict[ParName] = 0
+                        Defaults[ParName] = 0
                     else:
                         if ParMode not in self.__SpecialOpts:
                             if ParMulti:
-                                self.__WorkDict[ParName] = []
+                                Defaults[ParName] = []
                             else:
-                                self.__WorkDict[ParName] = None
+                                Defaults[ParName] = None
+            if SingleDef.get(self.__WorkPars["compact"], False):
+                if not ParMulti or ParMode not in (self.__WorkModes["int"], self.__WorkModes["float"]):
+                    raise self.DeclarationError(
+                        f"{self.FullPrefix}: Compact storage for {ParName} needs mode 'i' or 'F' with multiples"
+                    )
+                if SingleDef[self.__WorkPars["compact"]] not in (True, "array", "numpy"):
+                    raise self.DeclarationError(
+                        f"{self.FullPrefix}: Compact storage for {ParName} must be True, 'array' or 'numpy'"
+                    )
+                if SingleDef[self.__WorkPars["compact"]] == "numpy":
+                    _Numpy()
+                SingleDef[self.__WorkPars["needoption"]] = True
+                if ParName in Defaults:
+                    try:
+                        Defaults[ParName] = self.__ToCompact(SingleDef, Defaults[ParName])
+                    except (ValueError, TypeError, OverflowError):
+                        raise self.DeclarationError(
+                            f"{self.FullPrefix}: {ParName} default value '{Defaults[ParName]}' is invalid for compact storage"
+                        ) from None
             NeedOpt = False
             if self.__WorkPars["needoption"] in ParKeys:
                 if SingleDef[self.__WorkPars["needoption"]]:
                     NeedOpt = True
-                    Ut_Param = self._Translation["HelpValue"]
-                else:
-                    Ut_Param = " " * len(self._Translation["HelpValue"])
-            else:
-                Ut_Param = " " * len(self._Translation["HelpValue"])
             if self.__WorkPars["longpar"] in ParKeys:
                 wText = SingleDef[self.__WorkPars["longpar"]]
                 if isinstance(wText, (list, tuple)):
@@ -2904,13 +4416,27 @@ class Param:
                         self.__ShortList.append(rEntry)
                 if ShortParLen == 0:
                     ShortParLen = 1
+            if self.__WorkPars["env"] in ParKeys:
+                EnvName = SingleDef[self.__WorkPars["env"]]
+                if not isinstance(EnvName, str):
+                    raise self.DeclarationError(f"{self.FullPrefix}: Environment name for {ParName} is not a string")
+                if ParMode in self.__SpecialOpts:
+                    raise self.DeclarationError(f"{self.FullPrefix}: {ParName} can not be set by the environment")
+            elif self.__EnvPrefix is not None and ParMode not in self.__SpecialOpts:
+                EnvName = f"{self.__EnvPrefix}_{self.FullPrefix}_{ParName}".replace(".", "_").upper()
+            else:
+                EnvName = ""
+            if EnvName != "":
+                if EnvName in self.__EnvMap:
+                    raise self.DeclarationError(f"{self.FullPrefix}: Double environment name for {ParName}: {EnvName}")
+                self.__EnvMap[EnvName] = ParName
             if self.__WorkPars["description"] in ParKeys:
                 Ut_Text = SingleDef[self.__WorkPars["description"]]
             self.__UsageTextList.append(
                 [
                     Ut_Short,
                     Ut_Long,
-                    Ut_Param,
+                    NeedOpt,
                     Ut_Type,
                     Ut_Default,
                     Ut_Text,
@@ -2920,30 +4446,338 @@ class Param:
                     Ut_HasConfig,
                 ]
             )
-        IsChild = True
-        if self.__Parent is None:
-            IsChild = False
-        self.__GenUsageText(ShortParLen, LongParLen, IsChild=IsChild)
-        self.__IsPrepared = True
+        self.__DefaultDict = Defaults
+        self.__Actions = self.__CompileActions()
+        self.__OptViews = (tuple(self.__LongList), tuple(self.__ShortList), types.MappingProxyType(self.__ParDict))
+        self.__ResultLayout = None
+        self.__UsageLens = (ShortParLen, LongParLen)
+        self.__DefDirty = False
+        self.__TextDirty = True
+
+    def __CompileActions(self) -> dict:
+        """
+        Return the action of every option (from the ParDict), so an option is dispatched with one lookup.
+
+        The kind is the name of the special mode ("help", "import", ...), "option" for options
+        with a value (checked by the validator), "bool", "count" or "undefined".
+
+        Returns:
+            dict: {"argtext": (kind, Parameter-name, definition, validator or None), ...}
+        """
+        Kinds = {
+            self.__WorkModes[k]: k
+            for k in ("help", "license", "fullLicense", "import", "glob_import", "export", "glob_export")
+        }
+        Actions = {}
+        for wOpt, ParName in self.__ParDict.items():
+            wPar = self.__Definition[ParName]
+            wMod = wPar[self.__WorkPars["mode"]]
+            Check = self.__CheckOption if wPar.get(self.__WorkPars["needoption"], False) else None
+            if wMod in Kinds:
+                Kind = Kinds[wMod]
+            elif wMod == self.__WorkModes["count"]:
+                Kind = "count"
+            elif Check is not None:
+                Kind = "option"
+            elif wMod == self.__WorkModes["bool"]:
+                Kind = "bool"
+            else:
+                Kind = "undefined"
+            Actions[wOpt] = (Kind, ParName, wPar, Check)
+        return Actions
+
+    def __PrepareTree(self, Pwd: Optional[str] = None) -> None:
+        """
+        Prepare all nodes of the tree whose definitions have changed.
+
+        Unchanged nodes are not touched. If Pwd is given, nodes with defaults
+        relative to the current directory are prepared again if the directory changed.
+        Children not built yet (LazyChildren) are built first.
+
+        Args:
+            Pwd (str, optional): The current directory at invocation of "Process". Defaults to None.
+        """
+        if self.__DefDirty or (self.__PwdDependent and Pwd is not None and Pwd != self.__MyPwd):
+            self.__Prepare(Pwd)
+        elif Pwd is not None:
+            self.__MyPwd = Pwd
+        if self.__Pending:
+            self.__Materialize(list(self.__Pending))
+        for c in self.__Children.values():
+            c.__PrepareTree(Pwd)  # pylint: disable=protected-access
+
+    def __ArgPrefixes(self, Args: Union[list, tuple]) -> list:
+        """
+        Return the prefixes used by long options on the command-line.
+
+        The arguments are scanned only once per "Process" and argument-list,
+        the result is kept in the root and shared by all children.
+        """
+        Root = self.__GetRoot()
+        try:
+            return Root.__PrefixCache[id(Args)]  # pylint: disable=protected-access
+        except KeyError:
+            pass
+        PreList = _ArgPrefixes(Args)
+        Root.__PrefixCache[id(Args)] = PreList  # pylint: disable=protected-access
+        return PreList
 
     def __Make_OptName(self, OptionNameIn: str):
-        OptionName: str = OptionNameIn
-        LongOptStr = OptionNameIn
-        RemStr = ""
-        if OptionName.startswith("--"):
-            if "." in OptionName:
-                if "=" in OptionName:
-                    w = OptionName.split("=", 1)
-                    OptionName = w[0]
-                    RemStr = "=" + w[1]
-                wList = OptionName[2:].split(".")
-                if len(wList) != 2:
-                    raise self.ParamError(f"Error in prefixed parameter {OptionName}") from None
-                if wList[0] == self.__Prefix:
-                    LongOptStr = "--" + wList[1] + RemStr
-        return LongOptStr
-
-    def Process(self) -> bool:
+        return _MakeOptName(OptionNameIn, self.__Prefix, self.ParamError)
+
+    def Prewarm(self, Help: bool = True, Freeze: bool = False) -> None:
+        """
+        Prepare this instance and all children completely, e.g. in the parent of a pre-fork server.
+
+        All children are built (also with LazyChildren), the option-tables, defaults and
+        result-classes of every node are compiled and, if Help is True, the help-texts
+        are generated. A forked worker only sets its arguments and calls :func:`Process`,
+        which then reads these tables and builds only the new values:
+
+        .. code-block:: python
+
+            MyParam.Prewarm(Freeze=True)
+            for _ in range(Workers):
+                if os.fork() == 0:
+                    MyParam.SetArgs(WorkerArgs)
+                    MyParam.Process()
+                    ...
+
+        With Freeze True the garbage collector is run and all objects existing now are moved
+        to its permanent generation (gc.freeze()), so collections in the workers do not
+        write to the shared pages (copy-on-write). This affects the whole process, call it
+        as the last step before forking. Changing a definition after this prepares the
+        node again at the next :func:`Process`.
+
+        :param Help: Generate the help-texts too, defaults to True
+        :type Help: bool, optional
+        :param Freeze: Call gc.collect() and gc.freeze() at the end, defaults to False
+        :type Freeze: bool, optional
+        """
+        self.__MaterializeAll()
+        self.__PrepareTree(str(Path.cwd()))
+        Nodes = []
+        self.__CollectNodes(Nodes)
+        for n in Nodes:
+            n.__GetResultLayout()
+            if Help and n.__TextDirty:
+                n.__GenUsageText(*n.__UsageLens, IsChild=n.__Parent is not None)
+        if Freeze:
+            gc.collect()
+            gc.freeze()
+
+    def Serve(self, SocketPath: str, EnvNames: Optional[list] = None, Stop: Optional[threading.Event] = None) -> None:
+        """
+        Answer parse-requests on a UNIX domain socket (a local parse server).
+
+        The tree is prepared once (:func:`Prewarm`) and kept in memory. Every request
+        gives the arguments, the current directory and the environment of the caller;
+        it is processed like :func:`Process` and answered with the values, the help-text
+        (or any other printed text) or the translated error. The requests are handled
+        one after the other. Thin command-line wrappers use the script of
+        :func:`ClientScript`, python programs :func:`ServerRequest`.
+        The directory of the request is used for relative paths, imports and response-files,
+        the current directory of the server process is not changed (Serve can run in a thread).
+
+        The answer is a dictionary:
+            Status: "ok", "terminal" (help, license, export) or "error"
+            Values: {FullPrefix: {Name: Value, ...}, ...} (not if Status is "error")
+            Remainder, Unused: like :func:`GetRemainder` and :attr:`UnusedArgs`
+            Output: the printed text (e.g. the help)
+            Error: the error message (only if Status is "error")
+
+        :param SocketPath: The path of the socket (an existing file is replaced, the socket is only accessible by the owner)
+        :type SocketPath: str
+        :param EnvNames: The environment-variables taken from the requests, defaults to None (the variables read by the tree)
+        :type EnvNames: Optional[list], optional
+        :param Stop: The server stops if this event is set (checked twice per second), defaults to None (run forever)
+        :type Stop: Optional[threading.Event], optional
+        """
+        if self.__Parent is not None:
+            self.__Parent.Serve(SocketPath, EnvNames, Stop)
+            return
+        self.Prewarm(Help=True)
+        if EnvNames is None:
+            Nodes = []
+            self.__CollectNodes(Nodes)
+            EnvNames = [e for n in Nodes for e in n.__EnvMap]
+        EnvNames = set(EnvNames)
+        EnvNames.discard(COMPLETE_ENV)  # completion is answered by the program itself
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(SocketPath)
+        Server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            OldMask = os.umask(0o177)  # the socket is created with 0600, no window for other users
+            try:
+                Server.bind(SocketPath)
+            finally:
+                os.umask(OldMask)
+            Server.listen(16)
+            Server.settimeout(0.5)
+            while Stop is None or not Stop.is_set():
+                try:
+                    Conn, _ = Server.accept()
+                except socket.timeout:
+                    continue
+                with Conn:
+                    try:
+                        Conn.settimeout(10.0)
+                        Chunks = []
+                        while True:
+                            Chunk = Conn.recv(65536)
+                            if not Chunk:
+                                break
+                            Chunks.append(Chunk)
+                        try:
+                            Request = json.loads(b"".join(Chunks))
+                        except ValueError as exc:
+                            Answer = {"Status": "error", "Error": f"Invalid request: {exc}", "Output": ""}
+                        else:
+                            Answer = self.__Answer(Request, EnvNames)
+                        try:
+                            Reply = json.dumps(Answer, cls=self.__PathEncoder)
+                        except (TypeError, ValueError) as exc:
+                            Reply = json.dumps({"Status": "error", "Error": f"Invalid answer: {exc}", "Output": ""})
+                        Conn.sendall(Reply.encode("utf-8"))
+                    except OSError:
+                        pass  # the client is gone
+        finally:
+            Server.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(SocketPath)
+
+    def __Answer(self, Request: dict, EnvNames: set) -> dict:
+        """Process one request of :func:`Serve` (root only), our arguments and environment are restored"""
+        with self.__Lock:
+            return self.__AnswerLocked(Request, EnvNames)
+
+    def __AnswerLocked(self, Request: dict, EnvNames: set) -> dict:
+        """The body of __Answer, the directory of the request is used as current directory of Process"""
+        SavedArgs = self.__Argumente
+        SavedEnviron = self.__Environ
+        Stdout = io.StringIO()
+        try:
+            Environ = Request.get("Environ") or {}
+            self.SetArgs([str(a) for a in Request.get("Args") or [self.MyProgName()]])
+            self.SetEnviron({k: str(v) for k, v in Environ.items() if k in EnvNames})
+            Cwd = Request.get("Cwd")
+            self.__Cwd = None if not Cwd else str(Cwd)
+            with contextlib.redirect_stdout(Stdout):
+                Terminal = self.Process()
+            Nodes = []
+            self.__CollectNodes(Nodes)
+            Answer = {
+                "Status": "terminal" if Terminal else "ok",
+                "Values": {n.FullPrefix: dict(n.__WorkDict) for n in Nodes},
+                "Remainder": self.GetRemainder(),
+                "Unused": self.UnusedArgs,
+            }
+        except SystemExit:
+            Answer = {"Status": "terminal"}
+        except Exception as exc:  # pylint: disable=broad-except
+            Answer = {"Status": "error", "Error": str(exc)}  # one bad request must not stop the server
+        finally:
+            self.__Argumente = SavedArgs
+            self.__Environ = SavedEnviron
+            self.__Cwd = None
+        Answer["Output"] = Stdout.getvalue()
+        return Answer
+
+    @staticmethod
+    def ServerRequest(
+        SocketPath: str,
+        Args: Optional[list] = None,
+        Cwd: Optional[str] = None,
+        Environ: Optional[dict] = None,
+        Timeout: Optional[float] = 30.0,
+    ) -> dict:
+        """
+        Send a parse-request to a server started with :func:`Serve` and return its answer.
+
+        :param SocketPath: The path of the socket of the server
+        :type SocketPath: str
+        :param Args: The arguments (with the program-name), defaults to None (sys.argv)
+        :type Args: Optional[list], optional
+        :param Cwd: The current directory for the request, defaults to None (os.getcwd())
+        :type Cwd: Optional[str], optional
+        :param Environ: The environment, defaults to None (os.environ, the server uses only the variables it needs)
+        :type Environ: Optional[dict], optional
+        :param Timeout: Timeout in seconds for the request, defaults to 30.0
+        :type Timeout: Optional[float], optional
+        :raises OSError: if the server can not be reached
+        :return: The answer (look at :func:`Serve`)
+        :rtype: dict
+        """
+        Request = {
+            "Args": list(sys.argv if Args is None else Args),
+            "Cwd": os.getcwd() if Cwd is None else Cwd,
+            "Environ": dict(os.environ if Environ is None else Environ),
+        }
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as Conn:
+            Conn.settimeout(Timeout)
+            Conn.connect(SocketPath)
+            Conn.sendall(json.dumps(Request).encode("utf-8"))
+            Conn.shutdown(socket.SHUT_WR)
+            Chunks = []
+            while True:
+                Chunk = Conn.recv(65536)
+                if not Chunk:
+                    break
+                Chunks.append(Chunk)
+        return json.loads(b"".join(Chunks))
+
+    @staticmethod
+    def ClientScript(SocketPath: str) -> str:
+        """
+        Return a minimal python client for :func:`Serve` to be called from the shell.
+
+        The client imports only json, os, socket and sys. It prints the values, remainder and
+        unused arguments as json (or the text printed by the server, e.g. the help) and exits
+        with 0, the error to stderr with exit-code 2, or exits with 1 if the server can not be reached:
+
+        .. code-block:: bash
+
+            python3 -c 'from pcs_argpass.Param import Param; print(Param.ClientScript("/run/myprog.sock"))' > myprog-client
+            python3 -S myprog-client --verbose file.txt
+
+        :param SocketPath: The path of the socket of the server
+        :type SocketPath: str
+        :return: The source of the client
+        :rtype: str
+        """
+        return f"""#!/usr/bin/env python3
+# client of an argpass parse server (generated by Param.ClientScript)
+import json, os, socket, sys
+
+def main():
+    Request = {{"Args": sys.argv, "Cwd": os.getcwd(), "Environ": dict(os.environ)}}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as Conn:
+            Conn.connect({SocketPath!r})
+            Conn.sendall(json.dumps(Request).encode("utf-8"))
+            Conn.shutdown(socket.SHUT_WR)
+            Chunks = []
+            while True:
+                Chunk = Conn.recv(65536)
+                if not Chunk:
+                    break
+                Chunks.append(Chunk)
+    except OSError as exc:
+        print(f"parse server not reachable: {{exc}}", file=sys.stderr)
+        return 1
+    Answer = json.loads(b"".join(Chunks))
+    sys.stdout.write(Answer.get("Output", ""))
+    if Answer["Status"] == "error":
+        print(Answer["Error"], file=sys.stderr)
+        return 2
+    if Answer["Status"] == "ok":
+        print(json.dumps({{k: Answer[k] for k in ("Values", "Remainder", "Unused")}}))
+    return 0
+
+sys.exit(main())
+"""
+
+    def Process(self, Timeout: Optional[float] = None, ModeTimeouts: Optional[dict] = None) -> bool:
         """
         Process the runtime-arguments.
         After this call the values of the class are all set.
@@ -2952,31 +4786,456 @@ class Param:
             You can not access the values bevore you call this function. The results
             are undefined.
 
+        The resolver and filesystem calls (IP modes, file, dir and path modes, imports)
+        can be bounded: Timeout is the budget of all these calls together, ModeTimeouts
+        the limit of a single call per mode, e.g. {'ip4': 2.0, 'f': 0.5}. A call that
+        does not finish in time raises a ParamError naming the parameter; the
+        calls and their durations are listed by :attr:`Lookups`.
+
+        :param Timeout: Budget in seconds for all lookups, defaults to None (no limit)
+        :type Timeout: Optional[float], optional
+        :param ModeTimeouts: Limit in seconds of one lookup per mode, defaults to None (no limit)
+        :type ModeTimeouts: Optional[dict], optional
         :raises RuntimeError: if an internal error occures. Should never occure!
-        :raises ParamError: if an error occures within a parameter
+        :raises ParamError: if an error occures within a parameter or a lookup takes too long
         :return: True if a terminal function is requested. e.g this are "Help", all "License" and all "Export" options
         :rtype: bool
         """
-        self.__ClearWorkDict()
+        Root = self.__GetRoot()
+        with Root.__Lock:
+            if Root.__Session() is not None:  # ProcessAsync passes the prefetched lookups
+                return self.__ProcessTree()
+            return Root.__RunPrefetched(self.__LookupSession(Root, Timeout, ModeTimeouts), Root.__ObserveRun, self)
+
+    def __ProcessTree(self) -> bool:
+        """Process the arguments for this node and its children (the body of :func:`Process`)"""
+        if self.__Parent is None:
+            self.__CompletionResponder()
+        Root = self.__GetRoot()
+        Root.__PrefixCache = {}  # pylint: disable=protected-access
+        Root.__ArgCache = {}  # pylint: disable=protected-access
+        Node = self.__Parent
+        while Node is not None:  # the combined lists of our parents include our lists
+            Node.__ArgsCombined = None  # pylint: disable=protected-access
+            Node = Node.__Parent  # pylint: disable=protected-access
+        if self.__LazyChildren:
+            self.__MaterializeNeeded(self.__ArgTokens(self.__GetArgs()), self.__GetEnviron())
+        self.__ClearWorkDict(self.__GetCwd())
         Erg = self.__Process(True)
         if Erg:
             return Erg
         Erg = self.__Process(False)
         if len(self.UnusedArgs) > 0:
             if self.__ErrorOnUnknown:
-                # OptStr = ', '.join(self.UnusedArgs)
-                OptStr = ", ".join(["'" + x + "'" for x in self.UnusedArgs])
-                if len(self.UnusedArgs) > 1:
-                    raise self.ParamError(self._Translation["UndefinedOptionMultiple"].format(**{"OptStr": OptStr})) from None
-                else:
-                    raise self.ParamError(self._Translation["UndefinedOptionSingle"].format(**{"OptStr": OptStr})) from None
+                raise self.__UnknownError(self.UnusedArgs) from None
         return Erg
 
-    def __ClearWorkDict(self) -> None:
-        """Lösche das Work-Dictionary"""
-        self.__WorkDict = {}
+    def __UnknownError(self, Unused: list) -> "Param.ParamError":
+        """Return the error for the unknown options in Unused"""
+        # OptStr = ', '.join(Unused)
+        OptStr = ", ".join(["'" + x + "'" for x in Unused])
+        if len(Unused) > 1:
+            return self.ParamError(self.__Msg("UndefinedOptionMultiple", **{"OptStr": OptStr}))
+        return self.ParamError(self.__Msg("UndefinedOptionSingle", **{"OptStr": OptStr}))
+
+    def __ObserveRun(self, Node: "Param", Start: Optional[float] = None) -> bool:
+        """Process Node and report the run to the metrics-sink (root only)
+
+        Args:
+            Node (Param): the node "Process" was called for
+            Start (float, optional): time.perf_counter() at the start of the run, defaults to now
+        """
+        with self.__Lock:
+            Observe = self.__Observe
+            if Observe is None:
+                return Node.__ProcessTree()
+            if Start is None:
+                Start = time.perf_counter()
+            Status = "error"
+            self.__LastMsgKey = None
+            try:
+                Erg = Node.__ProcessTree()
+                Status = "terminal" if Erg else "ok"
+                return Erg
+            except SystemExit:
+                Status = "terminal"
+                raise
+            except self.ParamError:
+                Observe("error", self.__LastMsgKey or "Other", 1)
+                raise
+            finally:
+                Observe("process", Status, time.perf_counter() - Start)
+                for _, Mode, _, Seconds, _ in self.__LookupLog:
+                    Observe("lookup", Mode, Seconds)
+                if Status != "error" and Node.UnusedArgs:
+                    Observe("unknown", "", len(Node.UnusedArgs))
+
+    def SetMetrics(self, Sink=None) -> None:
+        """
+        Set the sink for the parse statistics of the tree (None to switch them off).
+
+        The sink is called as Sink(Event, Key, Value) with
+
+        .. code-block::
+
+            "process", Status, Seconds  once per Process-call, Status is "ok", "terminal" or "error"
+            "error",   Key, 1           the translation key of the error (e.g. "NoInt", "LessLow", "UndefinedOptionSingle")
+            "unknown", "", Count        number of unknown options (ErrorOnUnknown=False)
+            "import",  Mode, Bytes      size of an imported file ('x' or '<')
+            "lookup",  Mode, Seconds    duration of a resolver or filesystem call
+
+        Use any function as a callback or :class:`Param.Metrics` to aggregate the
+        events within the process and write them in the Prometheus text format.
+
+        .. code-block:: python
+
+            Stats = Param.Metrics()
+            MyParam.SetMetrics(Stats)
+            MyParam.Process()
+            Stats.WritePrometheus("/var/lib/node_exporter/myprog.prom")
+
+        :param Sink: The callable to report to, defaults to None
+        :type Sink: callable, optional
+        :raises TypeError: if Sink is not callable
+        """
+        if Sink is not None and not callable(Sink):
+            raise TypeError(f"{self.FullPrefix}: Sink is not callable")
+        self.__GetRoot().__Observe = Sink
+
+    async def ProcessAsync(
+        self, Executor=None, Timeout: Optional[float] = None, ModeTimeouts: Optional[dict] = None
+    ) -> bool:
+        """
+        Process the runtime-arguments like :func:`Process` without blocking the event loop.
+
+        The blocking lookups for the given arguments (IP addresses and DNS-names,
+        local IP addresses, paths, files, directories and import-files) are done
+        concurrently within the executor, then :func:`Process` itself runs within
+        the executor and uses these results. So the values, the order of multiple
+        values and the errors are exactly the same as with :func:`Process`.
+
+        .. code-block:: python
+
+            async def main():
+                await MyParam.ProcessAsync()
+
+        :param Executor: The executor for the blocking calls, defaults to None (the default executor of the loop)
+        :type Executor: concurrent.futures.Executor, optional
+        :param Timeout: Budget in seconds for all lookups (look at :func:`Process`), defaults to None
+        :type Timeout: Optional[float], optional
+        :param ModeTimeouts: Limit in seconds of one lookup per mode (look at :func:`Process`), defaults to None
+        :type ModeTimeouts: Optional[dict], optional
+        :raises ParamError: if an error occures within a parameter or a lookup takes too long
+        :return: True if a terminal function is requested. e.g this are "Help", all "License" and all "Export" options
+        :rtype: bool
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        Loop = asyncio.get_running_loop()
+        Root = self.__GetRoot()
+        Start = time.perf_counter()
+        Jobs = await Loop.run_in_executor(Executor, self.__CollectLookups)
+        Session = self.__LookupSession(Root, Timeout, ModeTimeouts)
+        # errors are left to Process, it reports them like without prefetching
+        await asyncio.gather(
+            *(Loop.run_in_executor(Executor, Root.__RunLookups, Session, Func, *Args) for Func, Args in Jobs),
+            return_exceptions=True,
+        )
+        return await Loop.run_in_executor(Executor, Root.__RunPrefetched, Session, Root.__ObserveRun, self, Start)
+
+    async def ReloadAsync(self, Callback=None, Executor=None) -> Dict[str, list]:
+        """
+        Like :func:`Reload` without blocking the event loop.
+
+        The changed files are read concurrently within the executor.
+
+        :param Callback: passed to :func:`Reload`, defaults to None
+        :type Callback: callable, optional
+        :param Executor: The executor for the blocking calls, defaults to None (the default executor of the loop)
+        :type Executor: concurrent.futures.Executor, optional
+        :raises ParamError: if a file is not readable or a value is invalid
+        :return: Dictionary of the changed keys per full prefix (look at :func:`Reload`)
+        :rtype: Dict[str, list]
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        Loop = asyncio.get_running_loop()
+        Root = self.__GetRoot()
+        Nodes = []
+        with Root.__Lock:
+            Root.__CollectNodes(Nodes)
+            Records = [Rec for n in Nodes for Rec in n.__ImportRecords]  # pylint: disable=protected-access
+        Session = self.__LookupSession(Root, None, None)
+        await asyncio.gather(
+            *(Loop.run_in_executor(Executor, Root.__RunLookups, Session, self.__PrefetchImport, Rec) for Rec in Records),
+            return_exceptions=True,
+        )
+        return await Loop.run_in_executor(Executor, Root.__RunPrefetched, Session, Root.Reload, Callback)
+
+    def __PrefetchImport(self, Rec: list) -> None:
+        """Read an imported file (record of __ImportRecords) into the lookups if it is changed"""
+        if self.__FileSignature(Rec[3]) != Rec[4]:
+            Mode = self.__WorkModes["glob_import"] if Rec[0] else self.__WorkModes["import"]
+            self.__Lookup("import", Rec[3], self.__ReadImport, Rec[1], Mode)
+
+    @property
+    def Lookups(self) -> list:
+        """
+        Return the resolver and filesystem calls of the last :func:`Process` call of the tree.
+
+        Every call is listed once (repeated values are memorized), so the slow
+        parameter is easy to find if the budget of :func:`Process` is used up.
+
+        :return: [(ParKey, Mode, Value, Seconds, Status), ...] Status is "ok", "error" or "timeout"
+        :rtype: list
+        """
+        return list(self.__GetRoot().__LookupLog)
+
+    class __LookupSession:
+        """Memo, budget and log of the blocking lookups of one Process-call of the tree Root"""
+
+        __slots__ = ("Root", "Memo", "Deadline", "ModeTimeouts", "Log")
+
+        def __init__(self, Root: "Param", Timeout: Optional[float], ModeTimeouts: Optional[dict]):
+            self.Root = Root
+            self.Memo = {}  # (Kind, Value) -> (Ok, Result)
+            self.Deadline = None if Timeout is None else time.monotonic() + Timeout
+            self.ModeTimeouts = {} if ModeTimeouts is None else dict(ModeTimeouts)
+            self.Log = []  # (ParKey, Mode, Value, Seconds, Status)
+
+    def __Session(self):
+        """Return the lookup session of the running Process-call of this tree or None"""
+        Session = _LOOKUPS.get()
+        if Session is not None and Session.Root is self.__GetRoot():
+            return Session
+        return None
+
+    def __RunLookups(self, Session, Func, *args):
+        """Return Func(*args) with the lookups of Session (in the calling thread only)"""
+        Token = _LOOKUPS.set(Session)
+        try:
+            return Func(*args)
+        finally:
+            _LOOKUPS.reset(Token)
+
+    def __RunPrefetched(self, Session, Func, *args):
+        """Return Func(*args) under the lock of the tree with the lookups of Session (root only)
+
+        Concurrent calls (also of ProcessAsync) keep their own memo and budget, the log
+        of the last call is kept for :attr:`Lookups`.
+        """
+        with self.__Lock:
+            self.__LookupLog = Session.Log
+            return self.__RunLookups(Session, Func, *args)
+
+    def __Lookup(self, Kind: str, Value, Func, ParKey: str = "", Mode: str = ""):
+        """Return Func(Value), memorized and bounded for the running Process-call
+
+        Args:
+            Kind (str): the kind of lookup (e.g. the IP mode, "resolve", "stat" or "import")
+            Value (any): the argument of Func
+            Func (callable): the blocking function
+            ParKey (str): the parameter for messages and the log
+            Mode (str): the mode of the parameter (selects the timeout)
+
+        Raises:
+            ValueError, OSError: raised by Func (also if memorized)
+            self.ParamError: if Func did not finish in time
+        """
+        Session = self.__Session()
+        if Session is None:
+            return Func(Value)
+        Memo = Session.Memo
+        Key = (Kind, Value)
+        try:
+            Ok, Res = Memo[Key]
+        except KeyError:
+            Timeout = Session.ModeTimeouts.get(Mode)
+            if Session.Deadline is not None:
+                Rest = Session.Deadline - time.monotonic()
+                Timeout = Rest if Timeout is None else min(Timeout, Rest)
+            Start = time.perf_counter()
+            if Timeout is None:
+                try:
+                    Ok, Res = True, Func(Value)
+                except (ValueError, OSError) as exc:
+                    Ok, Res = False, exc
+            else:
+                Ok, Res = self.__CallBounded(Func, Value, Timeout)
+                if Ok is False and not isinstance(Res, (ValueError, OSError)):
+                    raise Res
+            Status = "ok" if Ok else ("error" if Ok is False else "timeout")
+            Session.Log.append((ParKey, Mode, Value, time.perf_counter() - Start, Status))
+            Memo[Key] = (Ok, Res)
+        if Ok:
+            return Res
+        if Ok is None:
+            raise self.ParamError(
+                self.__Msg(
+                    "LookupTimeout", **{"OptValue": Value, "ParKey": ParKey, "Mode": Mode, "Timeout": round(Res, 3)}
+                )
+            ) from None
+        raise Res
+
+    @staticmethod
+    def __CallBounded(Func, Value, Timeout: float) -> tuple:
+        """Call Func(Value) within a daemon thread and wait at most Timeout seconds
+
+        A call that does not finish in time is left alone (blocking calls can not be cancelled).
+
+        Returns:
+            tuple: (True, result), (False, exception) or (None, Timeout) if the call did not finish in time
+        """
+        Box = []
+
+        def Run():
+            try:
+                Box.append((True, Func(Value)))
+            except BaseException as exc:  # pylint: disable=broad-except
+                Box.append((False, exc))
+
+        if Timeout > 0:
+            wThread = threading.Thread(target=Run, name="Argpass-Lookup", daemon=True)
+            wThread.start()
+            wThread.join(Timeout)
+        if Box:
+            return Box[0]
+        return (None, max(Timeout, 0.0))
+
+    def __GetCwd(self) -> str:
+        """The current directory for Process: the directory of the running Serve-request or os.getcwd()"""
+        Cwd = self.__GetRoot().__Cwd
+        return str(Path.cwd()) if Cwd is None else Cwd
+
+    @staticmethod
+    def __InDir(Pwd: str, a: str) -> str:
+        """The path a ('~' expanded) relative to the directory Pwd"""
+        return os.path.join(Pwd, os.path.expanduser(a))
+
+    @staticmethod
+    def __Resolve(a: str) -> Path:
+        """The resolved path"""
+        return Path(a).expanduser().resolve()
+
+    @staticmethod
+    def __StatPath(n: Path) -> tuple:
+        """(exists, is_file, is_dir) of a resolved path"""
+        return n.exists(), n.is_file(), n.is_dir()
+
+    @staticmethod
+    def __ReadImport(FullPath: Path) -> str:
+        """The content of an import-file"""
+        with FullPath.open(encoding="utf-8") as wFile:
+            return wFile.read()
+
+    def __CollectLookups(self) -> list:
+        """Return the blocking lookups needed by the arguments and environment-variables of the tree
+
+        Only the own option-tables are used (the same way __Process does), arguments
+        that can not be parsed are left to Process for the error message.
+
+        Returns:
+            list: [(Func, Args), ...] the prefetch-calls
+        """
+        Root = self.__GetRoot()
+        with Root.__Lock:
+            Root.__PrefixCache = {}
+            Root.__ArgCache = {}
+            Nodes = []
+            self.__CollectNodes(Nodes)
+            Pwd = self.__GetCwd()
+            Environ = self.__GetEnviron()
+            Jobs = {}
+            for n in Nodes:
+                if n.__DefDirty:
+                    n.__Prepare(Pwd)
+                try:
+                    opts = [(n.__Make_OptName(o), a) for o, a in n.__GetOpts(n.__GetArgs())[0]]
+                except self.ParamError:
+                    opts = []
+                Values = []
+                for o, a in opts:
+                    Kind, ParName, _, _ = n.__Actions.get(o, ("", None, None, None))
+                    Values.append((ParName, a))
+                    if Kind in ("import", "glob_import"):
+                        Jobs[("import", a)] = (n.__PrefetchImportArg, (n.__InDir(Pwd, a), o, n.__WorkModes[Kind]))
+                for a, _ in n.__LayerFiles(Pwd):
+                    Jobs[("import", a)] = (n.__PrefetchImportArg, (n.__InDir(Pwd, a), "ImportLayers", n.__WorkModes["glob_import"]))
+                for EnvName, ParName in n.__EnvMap.items():
+                    if EnvName not in Environ:
+                        continue
+                    if not n.__Definition[ParName].get(n.__WorkPars["multiple"], False):
+                        Values.append((ParName, Environ[EnvName]))
+                        continue
+                    try:
+                        Values.extend((ParName, a) for a in shlex.split(Environ[EnvName]))
+                    except ValueError:
+                        pass
+                for ParName, a in Values:
+                    if ParName is None or ParName not in n.__Definition:
+                        continue
+                    wMod = n.__Definition[ParName][n.__WorkPars["mode"]]
+                    if wMod in n.__IpModes:
+                        Jobs[(wMod, a)] = (n.__Lookup, (wMod, a, n.__IpModes[wMod][0], ParName, wMod))
+                    elif wMod in (n.__WorkModes["file"], n.__WorkModes["dir"], n.__WorkModes["path"]):
+                        a = str(a).strip()
+                        if a != "":
+                            a = a if a[0] == "/" else Pwd + "/" + a
+                            Jobs[("path", a)] = (n.__PrefetchPath, (a, ParName, wMod))
+            return list(Jobs.values())
+
+    def __PrefetchPath(self, a: str, ParKey: str, Mode: str) -> None:
+        """Resolve and stat a path into the lookups"""
+        n = self.__Lookup("resolve", a, self.__Resolve, ParKey, Mode)
+        self.__Lookup("stat", n, self.__StatPath, ParKey, Mode)
+
+    def __PrefetchImportArg(self, a: str, ParKey: str, Mode: str) -> None:
+        """Resolve an import-file given on the command-line and read it into the lookups"""
+        FullPath = self.__Lookup("resolve", a, self.__Resolve, ParKey, Mode)
+        if self.__Lookup("stat", FullPath, self.__StatPath, ParKey, Mode)[1]:
+            self.__Lookup("import", FullPath, self.__ReadImport, ParKey, Mode)
+
+    def __GetOpts(self, Args: Union[list, tuple]) -> tuple:
+        """Parse the arguments with the option-tables of this node
+
+        The long options are accepted also with every prefix used on the command-line.
+
+        Raises:
+            self.ParamError: if the arguments are invalid for the option-tables
+
+        Returns:
+            tuple: (options, remainder, unused) like _gnu_getopt
+        """
+        wLongList = list(self.__LongList)
+        for nPre in self.__ArgPrefixes(Args):
+            wLongList.extend(nPre + "." + nLong for nLong in self.__LongList)
+        try:
+            return self.__Getopt()(Args[1:], self.__ShortStr, wLongList, True)
+        except self.GetoptError as exc:
+            raise self.ParamError(exc.msg) from None
+
+    def __ClearWorkDict(self, Pwd: str) -> None:
+        """Lösche das Work-Dictionary und setze die Defaults (nur geänderte Knoten werden neu vorbereitet)"""
+        if self.__DefDirty or (self.__PwdDependent and Pwd != self.__MyPwd):
+            self.__Prepare(Pwd)
+        else:
+            self.__MyPwd = Pwd
+        self.__WorkDict = {
+            k: (list(v) if isinstance(v, list) else copy.copy(v) if isinstance(v, array) or hasattr(v, "copy") else v)
+            for k, v in self.__DefaultDict.items()
+        }
+        self.__RemainArgs = []
+        self.__UnusedArgs = []
+        self.__PendingArgs = ([], [])
+        self.__ArgsCombined = None
+        self.__Processed = True
+        self.__ResultObj = None
+        self.__Phases = 0
+        self.__ImportRecords = []
+        self.__ImportRaw = {}
+        self.__PinnedKeys = set()
         for c in self.__Children.values():
-            c.__ClearWorkDict()
+            c.__ClearWorkDict(Pwd)
 
     def __Process(self, IsFirst: bool) -> bool:
         """
@@ -3001,43 +5260,28 @@ class Param:
         """
         if not IsFirst:
             Erg = False
+            self.__Phases = 2
             for c in self.__Children.values():
                 if c.__Process(IsFirst):  # pylint: disable=W0212
                     Erg = True
 
-        if not self.__IsPrepared:
-            self.__Prepare()
-        PreList = []
-        for wPar in self.__Argumente[1:]:
-            if wPar[0:2] == "--":
-                xPar = wPar[2:]
-                if "=" in xPar:
-                    xPar = xPar.split("=", 1)[0]
-                if "." in xPar:
-                    xPre = wPar[2:].split(".", 1)[0]
-                    if xPre not in PreList:
-                        PreList.append(xPre)
-        wLongList = []
-        for nLong in self.__LongList:
-            wLongList.append(nLong)
-        if len(PreList) > 0:
-            for nPre in PreList:
-                for nLong in self.__LongList:
-                    wLongList.append(nPre + "." + nLong)
-        try:
-            opts, args, unused = self._gnu_getopt(self.__Argumente[1:], self.__ShortStr, wLongList, True)
-            # opts, args = self._getopt(self.__Argumente[1:], self.__ShortStr, wLongList, True)
-        except self.GetoptError as exc:
-            wMsg = exc.msg
-            raise self.ParamError(wMsg) from None
+        opts, args, unused = self.__GetOpts(self.__GetArgs())
         self.__RemainArgs = args
         self.__UnusedArgs = unused
+        self.__ArgsCombined = None
+        # every option is canonicalised once and looked up once, options not defined here are dropped
+        Actions = self.__Actions
+        Acts = []
+        for OptionName, a in opts:
+            OptionName = self.__Make_OptName(OptionName)
+            try:
+                Acts.append((Actions[OptionName], OptionName, a))
+            except KeyError:
+                pass
         if IsFirst:
             # HELP & Licenses
-            for OptionName, a in opts:
-                del a
-                OptionName = self.__Make_OptName(OptionName)
-                if OptionName in self.__HelpList:
+            for (Kind, _, _, _), _, _ in Acts:
+                if Kind == "help":
                     # Hier geben wir die Hilfe aus. print ist hier richtig! Soll auf StdOut gehen
                     if self.__Prefix is not None:
                         if self.__Prefix != "" and self.__Prefix != GLOBAL_NAME:
@@ -3046,132 +5290,121 @@ class Param:
                     if self.__Parent is None:
                         sys.exit(0)
                     return True
-                if OptionName in self.__LicenseList:
+                if Kind == "license":
                     print(self.__License[0])
                     return True
-                if OptionName in self.__FullLicenseList:
+                if Kind == "fullLicense":
                     print("\n".join(self.__License))
                     return True
+            # LAYERED IMPORT (bevore the imports of the command-line)
+            if self.__ImportLayers is not None:
+                self.__ImportLayered()
             # GLOBAL IMPORT
-            for OptionName, OptionPath in opts:
-                OptionName = self.__Make_OptName(OptionName)
-                if OptionName in self.__Glob_ImportList:
-                    FullPath = Path(OptionPath).expanduser().resolve()
-                    if FullPath.exists():
-                        if FullPath.is_file():
-                            try:
-                                wGlobDict = JsonLoad(FullPath.open(encoding="utf-8"))
-                            except Exception as exc:
-                                wMsg = str(exc)
-                                raise self.ParamError(
-                                    f"Import failed '{wMsg}' in {OptionPath} ({FullPath}) for parameter {OptionName}"
-                                ) from None  # JsonError
+            for (Kind, _, _, _), OptionName, OptionPath in Acts:
+                if Kind == "glob_import":
+                    wMod = self.__WorkModes["glob_import"]
+                    FullPath = self.__Lookup("resolve", self.__InDir(self.__MyPwd, OptionPath), self.__Resolve, OptionName, wMod)
+                    Exists, IsFile, _ = self.__Lookup("stat", FullPath, self.__StatPath, OptionName, wMod)
+                    if Exists:
+                        if IsFile:
+                            Signature = self.__FileSignature(FullPath)
+                            wGlobDict = self.__LoadImport(True, OptionName, OptionPath, FullPath)
+                            self.__ImportRecords.append([True, OptionName, OptionPath, FullPath, Signature, wGlobDict])
                             self.__AssignImportValues(wGlobDict, FileName=str(FullPath))
                         else:
                             raise self.ParamError(
-                                self._Translation["PathNoFile"].format(
-                                    **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
+                                self.__Msg(
+                                    "PathNoFile", **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
                                 )
                             ) from None
                             # f"The path {OptionPath} ({FullPath}) for parameter {OptionName} is not a file") from None # PathNoFile
                     else:
                         raise self.ParamError(
-                            self._Translation["PathNoFile"].format(
-                                **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
+                            self.__Msg(
+                                "PathNoFile", **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
                             )
                         ) from None
                         # f"The path {OptionPath} ({FullPath}) for parameter {OptionName} is not a file") from None # PathNoFile
 
             # IMPORT
-            for OptionName, OptionPath in opts:
-                OptionName = self.__Make_OptName(OptionName)
-                if OptionName in self.__ImportList:
-                    FullPath = Path(OptionPath).expanduser().resolve()
-                    if FullPath.exists():
-                        if FullPath.is_file():
-                            try:
-                                wDict = JsonLoad(FullPath.open(encoding="utf-8"))
-                            except Exception as exc:
-                                wMsg = str(exc)
-                                raise self.ParamError(
-                                    f"Import failed, {OptionPath} for parameter {OptionPath} is not a valid file"
-                                ) from None  # JsonError
+            for (Kind, _, _, _), OptionName, OptionPath in Acts:
+                if Kind == "import":
+                    wMod = self.__WorkModes["import"]
+                    FullPath = self.__Lookup("resolve", self.__InDir(self.__MyPwd, OptionPath), self.__Resolve, OptionName, wMod)
+                    Exists, IsFile, _ = self.__Lookup("stat", FullPath, self.__StatPath, OptionName, wMod)
+                    if Exists:
+                        if IsFile:
+                            Signature = self.__FileSignature(FullPath)
+                            wDict = self.__LoadImport(False, OptionName, OptionPath, FullPath)
+                            self.__ImportRecords.append([False, OptionName, OptionPath, FullPath, Signature, wDict])
                             for k in self.__WorkDict.keys():  # pylint: disable=consider-iterating-dictionary
                                 try:
                                     self.__WorkDict[k] = wDict[k]
+                                    self.__ImportRaw[k] = wDict[k]
                                 except KeyError:
                                     pass
                         else:
                             raise self.ParamError(
-                                self._Translation["PathNoFile"].format(
-                                    **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
+                                self.__Msg(
+                                    "PathNoFile", **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
                                 )
                             ) from None
                             # f"The path {OptionPath} ({FullPath}) for parameter {OptionName} is not a file") from None # PathNoFile
                     else:
                         raise self.ParamError(
-                            self._Translation["PathNoFile"].format(
-                                **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
+                            self.__Msg(
+                                "PathNoFile", **{"OptionPath": OptionPath, "OptionName": OptionName, "FullPath": FullPath}
                             )
                         ) from None
                         # f"The path {OptionPath} ({FullPath}) for parameter {OptionName} does not exist") from None # PathNoFile
         else:
+            # ENVIRONMENT (after the imports, bevore the command-line)
+            if self.__EnvMap:
+                self.__AssignEnvValues(self.__GetEnviron())
+
             # Other Options
-            for OptionName, OptionArg in opts:
-                OptionName = self.__Make_OptName(OptionName)
-                if OptionName in self.__HelpList:
-                    continue
-                if OptionName in self.__ImportList:
+            for (Kind, ParName, wPar, Check), OptionName, OptionArg in Acts:
+                if Kind in ("help", "import", "glob_import", "export", "glob_export"):
                     continue
-                if OptionName in self.__Glob_ImportList:
-                    continue
-                if OptionName in self.__ExportList:
-                    continue
-                if OptionName in self.__Glob_ExportList:
-                    continue
-                try:
-                    ParName = self.__ParDict[OptionName]
-                except KeyError:
-                    continue
-                    # raise RuntimeError(f"Error, option {o} not found in ParDict")
-                try:
-                    wPar = self.__Definition[ParName]
-                except:
-                    raise RuntimeError(f"Internal error, option {ParName} not found in Definition") from None
-                if self.__WorkPars["needoption"] in wPar.keys():
-                    if wPar[self.__WorkPars["needoption"]]:
-                        Res = self.__CheckOption(ParName, OptionName, wPar, OptionArg)
-                        if not Res is None:
-                            raise self.ParamError(Res) from None
-                        if wPar[self.__WorkPars["mode"]] != self.__WorkModes["count"]:
-                            continue
-                if wPar[self.__WorkPars["mode"]] == self.__WorkModes["bool"]:
+                self.__PinnedKeys.add(ParName)
+                if Check is not None:
+                    Res = Check(ParName, OptionName, wPar, OptionArg)
+                    if not Res is None:
+                        raise self.ParamError(Res) from None
+                    if Kind != "count":
+                        continue
+                if Kind == "bool":
                     try:
                         bVal = wPar[self.__WorkPars["default"]]
                     except KeyError:
                         bVal = False
                     self.__WorkDict[ParName] = not bVal
-                elif wPar[self.__WorkPars["mode"]] == self.__WorkModes["count"]:
+                elif Kind == "count":
                     if "--" not in OptionName:
                         self.__WorkDict[ParName] += 1
                 else:
-                    raise self.ParamError(self._Translation["OptionNotDefined"].format(**{"OptionName": OptionName}))
+                    raise self.ParamError(self.__Msg("OptionNotDefined", **{"OptionName": OptionName}))
                     # f"No action defined for {OptionName}")
 
-            for OptionName, OptionArg in opts:
-                OptionName = self.__Make_OptName(OptionName)
-                if OptionName in self.__Glob_ExportList:
-                    self.__Glob_ExportStr = json.dumps(self.GetExportDict, sort_keys=True, indent=4, cls=self.__PathEncoder)
+            for (Kind, _, _, _), _, _ in Acts:
+                if Kind == "glob_export":
+                    Sparse = self.__GetRoot().__SparseExport
+                    wExport = self.GetExportDict if Sparse is None else self.GetSparseExportDict(Sparse)
+                    self.__Glob_ExportStr = json.dumps(wExport, sort_keys=True, indent=4, cls=self.__PathEncoder)
                     self.__Glob_ExportStr += "\n"
                     if self.__Parent is None:
                         print(self.__Glob_ExportStr)
                         sys.exit(0)
                     return True
-                if OptionName in self.__ExportList:
+                if Kind == "export":
                     if self.__Prefix is not None:
                         if self.__Prefix != "":
                             print(f"//{'-'*60}\n// {self.__Prefix}\n//{'-'*60}\n")
-                    print(json.dumps(self.__WorkDict, sort_keys=True, indent=4, cls=self.__PathEncoder))
+                    Sparse = self.__GetRoot().__SparseExport
+                    wExport = self.__WorkDict
+                    if Sparse is not None:
+                        wExport = {k: v for k, v in wExport.items() if not self.__IsDefault(k, v, Sparse)}
+                    print(json.dumps(wExport, sort_keys=True, indent=4, cls=self.__PathEncoder))
                     if self.__Parent is None:
                         sys.exit(0)
                     return True
@@ -3185,22 +5418,28 @@ class Param:
                     if not DefArgName in self.keys():
                         ParList = self.__GetOptList(DefArgName)
                         raise self.ParamError(
-                            self._Translation["OptionRequired"].format(**{"DefArgName": DefArgName, "ParList": ParList})
+                            self.__Msg("OptionRequired", **{"DefArgName": DefArgName, "ParList": ParList})
                         ) from None
                         # f"{DefArgName} ({ParList}) required but not given") from None
         if IsFirst:
             Erg = False
+            self.__Phases = 1
+            if self.__Pending:
+                # a child not built would find nothing on the command-line
+                self.__PendingArgs = tuple(self.__Getopt()(self.__GetArgs()[1:], "", [], True)[1:])
             for c in self.__Children.values():
                 if c.__Process(IsFirst):  # pylint: disable=W0212
                     Erg = True
         return Erg
 
-    def __AssignImportValues(self, wGlobDict: dict, FileName: str) -> None:
+    def __AssignImportValues(self, wGlobDict: dict, FileName: str, Sources: Optional[dict] = None) -> None:
         """Weist die importierten Werte dem Arbeitsbereich - nach überprüfung - zu
 
         Args:
             wGlobDict (dict): Imported dictionary
             FileName (str): Name of the imported file
+            Sources (dict, optional): prefix -> {Parameter-name: file} for merged layers, the file
+                                      named in error messages (instead of FileName)
 
         Raises:
             self.ParamError: if values do not meet the limits
@@ -3209,31 +5448,328 @@ class Param:
             wDict = wGlobDict[self.__Prefix]  # versuche die gewünschten Werte zu erhalten
         except KeyError:
             wDict = {}  # es sind keine Angaben für diesen Prefix in der Datei -> Nichts zu setzen
+        wSources = Sources.get(self.__Prefix, {}) if Sources is not None else {}
+
+        # nur die Keys in der Datei (sparse exports enthalten nur wenige), in der Reihenfolge unserer Keys
+        for k in [k for k in self.__WorkDict if k in wDict] if wDict else ():
+            iVal = wDict[k]
+            self.__AssignImportValue(k, iVal, wSources.get(k, FileName), self.__WorkDict)
+            self.__ImportRaw[k] = iVal
+        for p in self.__MaterializeImport(wGlobDict):
+            self.__Children[p].__ClearWorkDict(self.__MyPwd)  # pylint: disable=protected-access
+        for c in self.__Children.values():
+            c.__AssignImportValues(  # pylint: disable=protected-access
+                wGlobDict, FileName=FileName, Sources=Sources
+            )  # löse auch für alle Child-Klassen auf
+
+    def __AssignImportValue(self, k: str, iVal, FileName: str, Target: dict) -> None:
+        """Check one imported value and assign it to Target
+
+        Args:
+            k (str): the parameter-name
+            iVal (any): the imported value
+            FileName (str): Name of the imported file
+            Target (dict): the dictionary to write the value to
 
-        for k in list(
-            self.__WorkDict.keys()
-        ):  # versuche Daten für all unsere Keys zu bekommen # pylint: disable=consider-iterating-dictionary
-            IsOk = True
+        Raises:
+            self.ParamError: if the value does not meet the limits
+        """
+        NameStr = f"{k} (Imported from {FileName} [{self.__Prefix}])"  # Bezeichnung für ev. Fehlermeldungen
+        if isinstance(iVal, (list, tuple)) and self.__Definition[k].get(self.__WorkPars["compact"], False):
+            Target[k] = []  # compact values are checked as one bulk
+            Res = self.__CheckOption(k, NameStr, self.__Definition[k], iVal, Target)
+            if Res is not None:
+                raise self.ParamError(Res) from None
+        elif isinstance(iVal, (list, tuple)):  # sind die Daten ein Array?
+            Target[k] = []
+            for iVs in iVal:  # Löse das Array auf
+                Res = self.__CheckOption(k, NameStr, self.__Definition[k], iVs, Target)
+                if Res is not None:
+                    raise self.ParamError(Res) from None
+        else:
+            Res = self.__CheckOption(k, NameStr, self.__Definition[k], iVal, Target)
+            if Res is not None:  # der übergebene Wert war ungültig
+                raise self.ParamError(Res) from None
+
+    def __LoadImport(self, IsGlobal: bool, OptionName: str, OptionPath: str, FullPath: Path):
+        """Read and decode an import-file
+
+        Args:
+            IsGlobal (bool): True for a global import ('<'), False for an import ('x')
+            OptionName (str): the option from the command-line
+            OptionPath (str): the path as given on the command-line
+            FullPath (Path): the resolved path
+
+        Raises:
+            self.ParamError: if the file could not be decoded
+
+        Returns:
+            any: the decoded data
+        """
+        try:
+            Mode = self.__WorkModes["glob_import"] if IsGlobal else self.__WorkModes["import"]
+            Text = self.__Lookup("import", FullPath, self.__ReadImport, OptionName, Mode)
+            Observe = self.__GetRoot().__Observe
+            if Observe is not None:
+                Observe("import", Mode, len(Text.encode("utf-8")))
+            return JsonLoads(Text, FullPath.name)
+        except self.ParamError:
+            raise  # e.g. the timeout of the lookup, it names the parameter already
+        except Exception as exc:  # pylint: disable=broad-except
+            wMsg = str(exc)
+            if IsGlobal:
+                raise self.ParamError(
+                    f"Import failed '{wMsg}' in {OptionPath} ({FullPath}) for parameter {OptionName}"
+                ) from None  # JsonError
+            raise self.ParamError(f"Import failed, {OptionPath} for parameter {OptionPath} is not a valid file") from None
+
+    @staticmethod
+    def __FileSignature(FullPath: Path) -> Union[tuple, None]:
+        """Return (st_mtime_ns, st_size) of a file or None if it is not availlable"""
+        try:
+            st = os.stat(FullPath)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def __CollectNodes(self, Nodes: list) -> None:
+        """Append ourself and all descendants to Nodes (parents bevore children)"""
+        Nodes.append(self)
+        for c in self.__Children.values():
+            c.__CollectNodes(Nodes)  # pylint: disable=protected-access
+
+    @property
+    def ImportedFiles(self) -> list:
+        """
+        Return the files imported by the last :func:`Process` call of this instance and all children.
+        These are the files watched by :func:`Reload`.
+
+        :return: list of the full paths
+        :rtype: list[str]
+        """
+        Nodes = []
+        self.__CollectNodes(Nodes)
+        return [str(Rec[3]) for n in Nodes for Rec in n.__ImportRecords]  # pylint: disable=protected-access
+
+    def Reload(self, Callback=None) -> Dict[str, list]:
+        """
+        Reload the imported files (options of type 'x' and '<') if they are changed.
+
+        The files are polled by their modification time (st_mtime_ns) and size,
+        only changed files are read and decoded again. Only values that are
+        different from the last import are checked again, values given by the
+        environment or on the command-line are never touched.
+
+        The new values are published after all of them are checked, so if there
+        is an error (a :class:`ParamError` is raised) all values are unchanged.
+        Checking and publishing are done holding :attr:`Lock`, so :func:`Process` and
+        the readers holding the lock see either the old or the new values of the whole tree.
+        The Callback is called after the lock is released.
+
+        Can be called on every instance, the reload is always done for the whole tree.
+
+        :param Callback: function called with the result if there are changed values, defaults to None
+        :type Callback: callable, optional
+        :raises ParamError: if a file is not readable or a value is invalid
+        :return: Dictionary of the changed keys per full prefix. e.g.:
+                    {'global': ['Verbose'], 'global.alpha': ['Count', 'Text']}
+        :rtype: Dict[str, list]
+        """
+        if self.__Parent is not None:
+            return self.__Parent.Reload(Callback)
+        with self.__Lock:
+            Changes = self.__ReloadLocked()
+        if Changes and Callback is not None:
+            Callback(Changes)
+        return Changes
+
+    def __ReloadLocked(self) -> Dict[str, list]:
+        """The body of :func:`Reload` (root only, the lock of the tree is held)"""
+        Nodes = []
+        self.__CollectNodes(Nodes)
+
+        # look for changed files, only these are decoded
+        NewRecords = {}
+        for n in Nodes:
+            for Rec in n.__ImportRecords:  # pylint: disable=protected-access
+                Signature = self.__FileSignature(Rec[3])
+                if Signature == Rec[4]:
+                    continue
+                if Signature is None:
+                    raise self.ParamError(
+                        self.__Msg("PathNoFile", **{"OptionPath": Rec[2], "OptionName": Rec[1], "FullPath": Rec[3]})
+                    ) from None
+                NewRecords[id(Rec)] = (Signature, n.__LoadImport(Rec[0], Rec[1], Rec[2], Rec[3]))  # pylint: disable=protected-access
+        if not NewRecords:
+            return {}
+
+        def RecData(Rec: list):
+            if id(Rec) in NewRecords:
+                return NewRecords[id(Rec)][1]
+            return Rec[5]
+
+        # check all new values
+        GlobRecords = [Rec for Rec in self.__ImportRecords if Rec[0]]
+        if self.__LazyChildren:
+            # children not built yet with entries in a changed file are built (with the old values)
+            for Rec in GlobRecords:
+                if id(Rec) in NewRecords:
+                    Queue = [self]
+                    while Queue:
+                        n = Queue.pop()
+                        n.__MaterializeImport(NewRecords[id(Rec)][1], Replay=True)  # pylint: disable=protected-access
+                        Queue.extend(n.__Children.values())  # pylint: disable=protected-access
+            Nodes = []
+            self.__CollectNodes(Nodes)
+        Staged = []
+        for n in Nodes:
+            Res = n.__StageReload(GlobRecords, RecData)  # pylint: disable=protected-access
+            if Res is not None:
+                Staged.append((n,) + Res)
+
+        # publish
+        Changes = {}
+        for n, NewDict, NewRaw, ChangedKeys in Staged:
+            n.__WorkDict = NewDict  # pylint: disable=protected-access
+            n.__ImportRaw = NewRaw  # pylint: disable=protected-access
+            if ChangedKeys:
+                Changes[n.FullPrefix] = ChangedKeys
+        for n in Nodes:
+            n.__ResultObj = None  # pylint: disable=protected-access
+            for Rec in n.__ImportRecords:  # pylint: disable=protected-access
+                if id(Rec) in NewRecords:
+                    Rec[4], Rec[5] = NewRecords[id(Rec)]
+        return Changes
+
+    def __StageReload(self, GlobRecords: list, RecData) -> Union[tuple, None]:
+        """Build the new result dictionary for a reload
+
+        Args:
+            GlobRecords (list): the records of the global imports (from the root)
+            RecData (callable): returns the (new) data of a record
+
+        Raises:
+            self.ParamError: if a value does not meet the limits
+
+        Returns:
+            tuple: (NewDict, NewRaw, ChangedKeys) or None if nothing is to do
+        """
+        Raw = {}
+        Source = {}
+        for Rec in GlobRecords:
             try:
-                iVal = wDict[k]
+                wDict = RecData(Rec)[self.__Prefix]
             except KeyError:
-                IsOk = False  # keine Daten für diesen Key
-            if IsOk:
-                NameStr = f"{k} (Imported from {FileName} [{self.__Prefix}])"  # Bezeichnung für ev. Fehlermeldungen
-                if isinstance(iVal, (list, tuple)):  # dind die Daten ein Array?
-                    self.__WorkDict[k] = []
-                    for iVs in iVal:  # Löse das Array auf
-                        Res = self.__CheckOption(k, NameStr, self.__Definition[k], iVs)
-                        if not Res is None:
-                            raise self.ParamError(Res) from None
+                continue
+            for k in self.__DefaultDict:
+                if k in wDict:
+                    Raw[k] = wDict[k]
+                    Source[k] = str(Rec[3])
+        for Rec in self.__ImportRecords:
+            if Rec[0]:
+                continue
+            wDict = RecData(Rec)
+            for k in self.__DefaultDict:
+                if k in wDict:
+                    Raw[k] = wDict[k]
+                    Source[k] = None  # the values of 'x'-imports are not checked
+
+        def Same(a, b) -> bool:
+            return type(a) is type(b) and a == b
+
+        Missing = object()
+        Keys = [
+            k
+            for k in self.__DefaultDict
+            if k not in self.__PinnedKeys and not Same(Raw.get(k, Missing), self.__ImportRaw.get(k, Missing))
+        ]
+        if not Keys:
+            return None
+        NewDict = dict(self.__WorkDict)
+        NewRaw = dict(self.__ImportRaw)
+        ChangedKeys = []
+        for k in Keys:
+            v = self.__DefaultDict[k]
+            NewDict[k] = list(v) if isinstance(v, list) else v  # imports are done on top of the defaults
+            if k in Raw:
+                if Source[k] is None:
+                    NewDict[k] = Raw[k]
                 else:
-                    Res = self.__CheckOption(k, NameStr, self.__Definition[k], iVal)
-                if Res is not None:  # der übergebene Wert war ungültig
+                    self.__AssignImportValue(k, Raw[k], Source[k], NewDict)
+                NewRaw[k] = Raw[k]
+            else:
+                del NewRaw[k]
+            if not Same(NewDict.get(k, Missing), self.__WorkDict.get(k, Missing)):
+                ChangedKeys.append(k)
+        return NewDict, NewRaw, ChangedKeys
+
+    def WatchImports(self, Callback=None, Interval: float = 1.0, OnError=None) -> threading.Event:
+        """
+        Start a (daemon) thread calling :func:`Reload` every Interval seconds.
+
+        The reloads are serialised with :func:`Process` by :attr:`Lock`. A single value read by
+        the dictionary-access is always either the old or the new one, hold :attr:`Lock` to read
+        several values of the same state (:attr:`Result` and the exports do this themselves).
+
+        :param Callback: passed to :func:`Reload`, defaults to None
+        :type Callback: callable, optional
+        :param Interval: seconds between two polls, defaults to 1.0
+        :type Interval: float, optional
+        :param OnError: function called with the :class:`ParamError` if a reload fails, defaults to None
+                    (the error is ignored and the old values are kept)
+        :type OnError: callable, optional
+        :return: set this event to stop the thread
+        :rtype: threading.Event
+        """
+        Stop = threading.Event()
+
+        def Watch():
+            while not Stop.wait(Interval):
+                try:
+                    self.Reload(Callback)
+                except self.ParamError as exc:
+                    if OnError is not None:
+                        OnError(exc)
+
+        threading.Thread(target=Watch, name=f"ParamWatch-{self.FullPrefix}", daemon=True).start()
+        return Stop
+
+    def __AssignEnvValues(self, Environ) -> None:
+        """Assign the values of the environment-variables from the compiled name map
+
+        Args:
+            Environ (dict): the environment (normally os.environ)
+
+        Raises:
+            self.ParamError: if values do not meet the limits
+        """
+        for EnvName, ParName in self.__EnvMap.items():
+            try:
+                eVal = Environ[EnvName]
+            except KeyError:
+                continue  # not set -> nothing to do
+            self.__PinnedKeys.add(ParName)
+            wPar = self.__Definition[ParName]
+            NameStr = f"{ParName} (Environment {EnvName})"  # Bezeichnung für ev. Fehlermeldungen
+            if wPar[self.__WorkPars["mode"]] == self.__WorkModes["count"]:
+                self.__WorkDict[ParName] = 0  # the environment sets the counter, it does not add to it
+            if wPar.get(self.__WorkPars["multiple"], False):
+                try:
+                    if wPar.get(self.__WorkPars["compact"], False):
+                        eList = [eVal]  # compact values are checked as one bulk
+                    else:
+                        eList = shlex.split(eVal)
+                except ValueError as exc:
+                    raise self.ParamError(f"{NameStr}: {exc}") from None
+                self.__WorkDict[ParName] = []
+                for eVs in eList:
+                    Res = self.__CheckOption(ParName, NameStr, wPar, eVs)
+                    if Res is not None:
+                        raise self.ParamError(Res) from None
+            else:
+                Res = self.__CheckOption(ParName, NameStr, wPar, eVal)
+                if Res is not None:
                     raise self.ParamError(Res) from None
-        for c in self.__Children.values():
-            c.__AssignImportValues(  # pylint: disable=protected-access
-                wGlobDict, FileName=FileName
-            )  # löse auch für alle Child-Klassen auf
 
     def __GetOptList(self, Name: str) -> str:
         """Liste der möglichen Commandline-Parameter eines Keys
@@ -3254,7 +5790,106 @@ class Param:
             Erg += "--" + Long + " "
         return Erg
 
-    def __CheckOption(self, ParName: str, ParKey: str, wPar: dict, a: str) -> Union[str, None]:
+    def __Msg(self, Key: str, **Fields) -> str:
+        """Return the translated message Key (the key is kept for the metrics)"""
+        self.__GetRoot().__LastMsgKey = Key
+        return self._Translation[Key].format(**Fields)
+
+    def __ToCompact(self, wPar: dict, Values):
+        """Convert the values to the compact storage of this parameter
+
+        Args:
+            wPar (dict): The definition dictionary for this parameter (mode 'i' or 'F')
+            Values (iterable): numbers or strings
+
+        Raises:
+            ValueError, TypeError, OverflowError: if one of the values can not be converted
+
+        Returns:
+            array.array or numpy.ndarray: the converted values
+        """
+        if wPar[self.__WorkPars["mode"]] == self.__WorkModes["int"]:
+            Conv, Code = int, "q"
+        else:
+            Conv, Code = float, "d"
+        if wPar[self.__WorkPars["compact"]] == "numpy" and _Numpy() is not None:
+            return numpy.fromiter(map(Conv, Values), dtype=numpy.int64 if Code == "q" else numpy.float64)
+        return array(Code, map(Conv, Values))
+
+    def __CheckCompact(self, ParName: str, ParKey: str, wPar: dict, a, Target: dict, Known) -> Union[str, None]:
+        """Check a bulk of values for a compact multi-value parameter ('A') and append it
+
+        The argument is a single value, a comma (or whitespace) separated list, "@file"
+        to read such a list from a file or (from imports and environment) a list of values.
+        All values are converted in one pass, the limits are checked against the
+        minimum and maximum of the bulk. On error nothing is appended.
+
+        Args:
+            ParName (string): Name of the parameter (index in class as dictionary)
+            ParKey (string): The parameter-value from commandline
+            wPar (dict): The definition dictionary for this parameter
+            a (string, list): the option given for this parameter
+            Target (dict): the dictionary to write the value to
+            Known (dict, Param): where to look if the parameter is already set
+
+        Returns:
+            None    if no error
+            Error-msg   if option is erroneous
+        """
+        IsInt = wPar[self.__WorkPars["mode"]] == self.__WorkModes["int"]
+        if isinstance(a, str):
+            if a.startswith("@"):
+                wFile = Path(a[1:]).expanduser()
+                if not wFile.is_absolute():
+                    wFile = Path(self.__MyPwd) / wFile
+                try:
+                    a = wFile.read_text()
+                except (OSError, UnicodeDecodeError) as exc:
+                    return self.__Msg("ValueFileError", **{"ParKey": ParKey, "FileName": a[1:], "Error": exc})
+            Items = a.replace(",", " ").split()
+        elif isinstance(a, (list, tuple)):
+            Items = a
+        else:
+            Items = (a,)
+        try:
+            New = self.__ToCompact(wPar, Items)
+        except (ValueError, TypeError, OverflowError):
+            for x in Items:  # slow path only to find the culprit
+                try:
+                    self.__ToCompact(wPar, (x,))
+                except (ValueError, TypeError, OverflowError):
+                    return self.__Msg("NoInt" if IsInt else "NoFloat", **{"OptValue": x, "ParKey": ParKey})
+            raise
+        if len(New) > 0:
+            IsArray = isinstance(New, array)
+            ll = wPar.get(self.__WorkPars["lowlimit"])
+            if ll is not None:
+                Lo = min(New) if IsArray else New.min()
+                if Lo < ll or Lo != Lo:  # a leading NaN hides the minimum
+                    for x in New:
+                        if x < ll:
+                            return self.__Msg("LessLow", **{"OptValue": x, "ParKey": ParKey, "LowLimit": ll})
+            ul = wPar.get(self.__WorkPars["uplimit"])
+            if ul is not None:
+                Hi = max(New) if IsArray else New.max()
+                if Hi > ul or Hi != Hi:
+                    for x in New:
+                        if x > ul:
+                            return self.__Msg("HigherUp", **{"OptValue": x, "ParKey": ParKey, "UppLimit": ul})
+        Old = Target.get(ParName) if ParName in Known else None
+        if Old is None or len(Old) == 0:
+            Target[ParName] = New
+        elif isinstance(Old, array) and isinstance(New, array):
+            Old.extend(New)
+        elif numpy is not None and isinstance(Old, numpy.ndarray):
+            Target[ParName] = numpy.concatenate((Old, New))
+        else:
+            Target[ParName] = self.__ToCompact(wPar, chain(Old, New))
+        return None
+
+    def __CheckOption(
+        self, ParName: str, ParKey: str, wPar: dict, a: str, Target: Optional[dict] = None
+    ) -> Union[str, None]:
         """Prüft ob der angegebene Inhalt für diesen Parameter gültig ist
         Wenn Ja: Der Wert wird in das Ergebnisdictionary geschrieben und "None" zurückgegeben.
         Wenn Nein: Das Ergebnisdictionary ist unverändert, Rückgabe ist die Fehlermeldung
@@ -3264,11 +5899,18 @@ class Param:
             ParKey (string): The parameter-value from commandline
             wPar (dict): The definition dictionary for this parameter
             a (string): the option given for this parameter
+            Target (dict): the dictionary to write the value to, defaults to our
+                            own result dictionary
 
         Returns:
             None    if no error
             Error-msg   if option is erroneous
         """
+        if Target is None:
+            Target = self.__WorkDict
+            Known = self  # like the dictionary: look also at the parents
+        else:
+            Known = Target
         wMod = wPar[self.__WorkPars["mode"]]
         # Prüfen ob Multiple gesetzt ist
         try:
@@ -3280,74 +5922,79 @@ class Param:
         # -------------------------
         if wMod == self.__WorkModes["text"] or wMod == self.__WorkModes["pwd"]:
             if wMulti:
-                if ParName not in self:
-                    self.__WorkDict[ParName] = []
+                if ParName not in Known:
+                    Target[ParName] = []
             a = str(a)
             try:
                 ll = wPar[self.__WorkPars["lowlimit"]]
                 if a < ll:
-                    return self._Translation["LessLow"].format(**{"OptValue": a, "ParKey": ParKey, "LowLimit": ll})
+                    return self.__Msg("LessLow", **{"OptValue": a, "ParKey": ParKey, "LowLimit": ll})
             except KeyError:
                 pass
             try:
                 ul = wPar[self.__WorkPars["uplimit"]]
                 if a > ul:
-                    return self._Translation["HigherUp"].format(**{"OptValue": a, "ParKey": ParKey, "Upp": ul})
+                    return self.__Msg("HigherUp", **{"OptValue": a, "ParKey": ParKey, "UppLimit": ul})
             except KeyError:
                 pass
             if wMulti:
-                self.__WorkDict[ParName].append(a)
+                Target[ParName].append(a)
             else:
-                self.__WorkDict[ParName] = a
+                Target[ParName] = a
             return None
         # -------------------------
         # IP
         # -------------------------
         if wMod in self.__IpModes:
             if wMulti:
-                if ParName not in self:
-                    self.__WorkDict[ParName] = []
+                if ParName not in Known:
+                    Target[ParName] = []
 
-            wIp = self.__IpModes[wMod][0](a)
+            wIp = self.__Lookup(wMod, a, self.__IpModes[wMod][0], ParKey, wMod)
             if wIp is None:
-                return self._Translation[self.__IpModes[wMod][1]].format(
-                    **{"OptValue": a, "ParKey": ParKey, "IpVers": self.__IpModes[wMod][2]}
+                return self.__Msg(
+                    self.__IpModes[wMod][1], **{"OptValue": a, "ParKey": ParKey, "IpVers": self.__IpModes[wMod][2]}
                 )
             if wMulti:
-                self.__WorkDict[ParName].append(wIp)
+                Target[ParName].append(wIp)
             else:
-                self.__WorkDict[ParName] = wIp
+                Target[ParName] = wIp
             return None
         # -------------------------
+        # Compact Integer / Float
+        # -------------------------
+        if wMulti and wPar.get(self.__WorkPars["compact"], False):
+            return self.__CheckCompact(ParName, ParKey, wPar, a, Target, Known)
+        # -------------------------
         # Integer
         # -------------------------
         if wMod == self.__WorkModes["int"]:
             if wMulti:
-                if ParName not in self:
-                    self.__WorkDict[ParName] = []
+                if ParName not in Known:
+                    Target[ParName] = []
             try:
                 n = int(a)
             except ValueError:
-                return self._Translation["NoInt"].format(**{"OptValue": a, "ParKey": ParKey})
+                return self.__Msg("NoInt", **{"OptValue": a, "ParKey": ParKey})
                 # return f"Value {a} for parameter {ParKey} is not a valid integer"
             try:
                 ll = wPar[self.__WorkPars["lowlimit"]]
                 if n < ll:
-                    return self._Translation["LessLow"].format(**{"OptValue": a, "ParKey": ParKey, "LowLimit": ll})
+                    return self.__Msg("LessLow", **{"OptValue": a, "ParKey": ParKey, "LowLimit": ll})
                     # return f"Value {a} for parameter {ParKey} is less than lower limit ({ll})"
             except KeyError:
                 pass
             try:
                 ul = wPar[self.__WorkPars["uplimit"]]
                 if n > ul:
-                    return self._Translation["HigherUp"].format(**{"OptValue": a, "ParKey": ParKey, "Upp": ul})
+                    return self.__Msg("HigherUp", **{"OptValue": a, "ParKey": ParKey, "UppLimit": ul})
                     # return f"Value {a} for parameter {ParKey} is bigger than upper limit ({ul})"
             except KeyError:
                 pass
             if wMulti:
-                self.__WorkDict[ParName].append(n)
+                Target[ParName].append(n)
             else:
-                self.__WorkDict[ParName] = n
+                Target[ParName] = n
             return None
         # -------------------------
         # Count
@@ -3358,46 +6005,46 @@ class Param:
             try:
                 n = int(a)
             except ValueError:
-                return self._Translation["NoInt"].format(**{"OptValue": a, "ParKey": ParKey})
+                return self.__Msg("NoInt", **{"OptValue": a, "ParKey": ParKey})
                 # return f"Value {a} for parameter {ParKey} is not a valid integer"
-            if ParName in self.__WorkDict:
+            if ParName in Target:
                 if ParKey.startswith("--"):
-                    self.__WorkDict[ParName] = n
+                    Target[ParName] = n
                 else:
-                    self.__WorkDict[ParName] += n
+                    Target[ParName] += n
             else:
-                self.__WorkDict[ParName] = n
+                Target[ParName] = n
             return None
         # -------------------------
         # Float
         # -------------------------
         if wMod == self.__WorkModes["float"]:
             if wMulti:
-                if ParName not in self:
-                    self.__WorkDict[ParName] = []
+                if ParName not in Known:
+                    Target[ParName] = []
             try:
                 n = float(a)
             except ValueError:
-                return self._Translation["NoFloat"].format(**{"OptValue": a, "ParKey": ParKey})
+                return self.__Msg("NoFloat", **{"OptValue": a, "ParKey": ParKey})
                 # return f"Value {a} for parameter {ParKey} is not a valid floating point"
             try:
                 ll = wPar[self.__WorkPars["lowlimit"]]
                 if n < ll:
-                    return self._Translation["LessLow"].format(**{"OptValue": a, "ParKey": ParKey, "LowLimit": ll})
+                    return self.__Msg("LessLow", **{"OptValue": a, "ParKey": ParKey, "LowLimit": ll})
                     # return f"Value {a} for parameter {ParKey} is less than lower limit ({ll})"
             except KeyError:
                 pass
             try:
                 ul = wPar[self.__WorkPars["uplimit"]]
                 if n > ul:
-                    return self._Translation["HigherUp"].format(**{"OptValue": a, "ParKey": ParKey, "Upp": ul})
+                    return self.__Msg("HigherUp", **{"OptValue": a, "ParKey": ParKey, "UppLimit": ul})
                     # return f"Value {a} for parameter {ParKey} is bigger than upper limit ({ul})"
             except KeyError:
                 pass
             if wMulti:
-                self.__WorkDict[ParName].append(n)
+                Target[ParName].append(n)
             else:
-                self.__WorkDict[ParName] = n
+                Target[ParName] = n
             return None
         # -------------------------
         # Boolean
@@ -3410,109 +6057,133 @@ class Param:
             try:
                 n = a.lower()[0]
             except IndexError:
-                return self._Translation["NoBool"].format(**{"OptValue": a, "ParKey": ParKey})
+                return self.__Msg("NoBool", **{"OptValue": a, "ParKey": ParKey})
                 # return f"Value {a} for parameter {ParKey} is not valid"
             if n in "jyt1":
-                self.__WorkDict[ParName] = True
+                Target[ParName] = True
                 return None
             if n in "nf0":
-                self.__WorkDict[ParName] = False
+                Target[ParName] = False
                 return None
-            return self._Translation["NoBool"].format(**{"OptValue": a, "ParKey": ParKey})
+            return self.__Msg("NoBool", **{"OptValue": a, "ParKey": ParKey})
             # return f"Value {a} for parameter {ParKey} is not valid"
         # -------------------------
         # File (existing)
         # -------------------------
         if wMod == self.__WorkModes["file"]:
             if wMulti:
-                if ParName not in self:
-                    self.__WorkDict[ParName] = []
+                if ParName not in Known:
+                    Target[ParName] = []
             a = str(a).strip()
             if len(a) == 0:
-                return self._Translation["PathNoFile"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": a})
+                return self.__Msg("PathNoFile", **{"OptionPath": a, "OptionName": ParKey, "FullPath": a})
                 # return f"The name {a} for parameter {ParKey} is not a valid path"
             if a[0] != "/":
                 a = self.__MyPwd + "/" + a
             n = a
             try:
-                n = Path(a).expanduser().resolve()
+                n = self.__Lookup("resolve", a, self.__Resolve, ParKey, wMod)
             except (ValueError, OSError):
-                return self._Translation["PathNoFile"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
+                return self.__Msg("PathNoFile", **{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
                 # return f"The name {a} for parameter {ParKey} is not a valid path"
-            if n.exists():
-                if n.is_file():
+            Exists, IsFile, _ = self.__Lookup("stat", n, self.__StatPath, ParKey, wMod)
+            if Exists:
+                if IsFile:
                     if wMulti:
-                        self.__WorkDict[ParName].append(str(n))
+                        Target[ParName].append(str(n))
                     else:
-                        self.__WorkDict[ParName] = str(n)
+                        Target[ParName] = str(n)
                     return None
                 else:
-                    return self._Translation["PathNoFile"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
+                    return self.__Msg("PathNoFile", **{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
                     # return f"The path {a} ({n}) for parameter {ParKey} is not a file"
-            return self._Translation["PathNoFile"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
+            return self.__Msg("PathNoFile", **{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
             # return f"The path {a} ({n}) for parameter {ParKey} does not exist"
         # -------------------------
         # Directory (existing)
         # -------------------------
         if wMod == self.__WorkModes["dir"]:
             if wMulti:
-                if ParName not in self:
-                    self.__WorkDict[ParName] = []
+                if ParName not in Known:
+                    Target[ParName] = []
             a = str(a).strip()
             if len(a) == 0:
-                return self._Translation["PathNoDir"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": a})
+                return self.__Msg("PathNoDir", **{"OptionPath": a, "OptionName": ParKey, "FullPath": a})
                 # return f"The name {a} for parameter {ParKey} is not a valid path"
             if a[0] != "/":
                 a = self.__MyPwd + "/" + a
                 n = a
                 try:
-                    n = Path(a).expanduser().resolve()
+                    n = self.__Lookup("resolve", a, self.__Resolve, ParKey, wMod)
                 except (ValueError, OSError):
-                    return self._Translation["PathNoDir"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
+                    return self.__Msg("PathNoDir", **{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
                     # return f"The name {a} for parameter {ParKey} is not a valid path"
             else:
-                n = Path(a).expanduser().resolve()
-            if n.exists():
-                if n.is_dir():
+                n = self.__Lookup("resolve", a, self.__Resolve, ParKey, wMod)
+            Exists, _, IsDir = self.__Lookup("stat", n, self.__StatPath, ParKey, wMod)
+            if Exists:
+                if IsDir:
                     if wMulti:
-                        self.__WorkDict[ParName].append(str(n))
+                        Target[ParName].append(str(n))
                     else:
-                        self.__WorkDict[ParName] = str(n)
+                        Target[ParName] = str(n)
                     return None
                 else:
-                    return self._Translation["PathNoDir"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
+                    return self.__Msg("PathNoDir", **{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
                     # return f"The path {a} ({n}) for parameter {ParKey} is not a directory"
-            return self._Translation["PathNoDir"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
+            return self.__Msg("PathNoDir", **{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
             # return f"The path {a} ({n}) for parameter {ParKey} does not exist"
         # -------------------------
         # Path
         # -------------------------
         if wMod == self.__WorkModes["path"]:
             if wMulti:
-                if ParName not in self:
-                    self.__WorkDict[ParName] = []
+                if ParName not in Known:
+                    Target[ParName] = []
             a = str(a).strip()
             if a != "":
                 if a[0] != "/":
                     a = self.__MyPwd + "/" + a
                 n = a
                 try:
-                    n = Path(a).expanduser().resolve()
+                    n = self.__Lookup("resolve", a, self.__Resolve, ParKey, wMod)
                 except (ValueError, OSError):
-                    return self._Translation["PathNoPath"].format(**{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
+                    return self.__Msg("PathNoPath", **{"OptionPath": a, "OptionName": ParKey, "FullPath": n})
                     # return f"The name {a} for parameter {ParKey} is not a valid path"
             else:
                 n = ""
             if wMulti:
-                self.__WorkDict[ParName].append(str(n))
+                Target[ParName].append(str(n))
             else:
-                self.__WorkDict[ParName] = str(n)
+                Target[ParName] = str(n)
         return None
 
     def __Intersection(self, List1: list, List2: list) -> list:
-        if len(List2) > len(List1):
-            List1, List2 = List2, List1
-        return [value for value in List1 if value in List2]
+        """Return the entries of the longer list that are also within the other one (in order of the longer list)"""
+        return _Intersection(List1, List2)
+
+    def __CombinedArgs(self) -> tuple:
+        """
+        Return the remainder and the unused arguments of this instance and all children.
+
+        The lists are combined only once after "Process", the result is kept until
+        the next "Process".
+
+        Returns:
+            tuple: (remainder, unused)
+        """
+        if self.__ArgsCombined is None:
+            Rem = self.__RemainArgs
+            Un = self.__UnusedArgs
+            for p in (self.__ChildOrder if self.__Pending else self.__Children):
+                if p in self.__Pending:
+                    cRem, cUn = self.__PendingArgs
+                else:
+                    cRem, cUn = self.__Children[p].__CombinedArgs()  # pylint: disable=protected-access
+                Rem = self.__Intersection(Rem, cRem)
+                Un = self.__Intersection(Un, cUn)
+            self.__ArgsCombined = (Rem, Un)
+        return self.__ArgsCombined
 
     def GetRemainder(self) -> list:
         """
@@ -3521,11 +6192,7 @@ class Param:
         Returns:
             list: List of additional arguments within runtime-arguments
         """
-        Rem = self.__RemainArgs
-        for c in self.__Children.values():
-            cRem = c.GetRemainder()
-            Rem = self.__Intersection(Rem, cRem)
-        return Rem
+        return self.__CombinedArgs()[0]
 
     @property
     def UnusedArgs(self) -> list:
@@ -3546,38 +6213,182 @@ class Param:
         Returns:
             list: list of undefined args (str)
         """
-        Un = self.__UnusedArgs
-        for c in self.__Children.values():
-            cUn = c.UnusedArgs
-            Un = self.__Intersection(Un, cUn)
-        return Un
+        return self.__CombinedArgs()[1]
+
+    def IterOptions(self) -> "Param.OptionStream":
+        """
+        Return the options of the command-line for this instance and all children as a stream.
+
+        The arguments are parsed while the stream is consumed; every option is checked like
+        in :func:`Process` and yielded as a record (FullPrefix, Name, Value). Nothing is stored
+        in the instances, so huge command-lines (e.g. from response files) are handled in
+        constant memory:
+
+        .. code-block:: python
+
+            Stream = MyParam.IterOptions()
+            for Prefix, Name, Value in Stream:
+                ...
+            for FileName in Stream.Remainder:
+                ...
+
+        Value is the checked value of the argument (a list for multi-value options),
+        the counter after the argument for counters and the inverted default for bools.
+        Help, license, import and export options are skipped, imports, environment-variables
+        and required options are left to :func:`Process`.
+        Like :attr:`UnusedArgs` an option is unknown and an argument is positional
+        only if this is true for every instance of the tree (compared by position
+        within the arguments, not by value). The stream raises
+        a ParamError for the unknown options at its end (if ErrorOnUnknown is set).
+
+        :raises ParamError: if an option is invalid (while the stream is consumed)
+        :return: Iterator of the records with the attributes "Unused" and "Remainder"
+        :rtype: Param.OptionStream
+        """
+        Root = self.__GetRoot()
+        Root.__PrefixCache = {}
+        Root.__ArgCache = {}
+        Args = self.__GetArgs()
+        if self.__LazyChildren:
+            self.__MaterializeNeeded(self.__ArgTokens(Args), self.__GetEnviron())
+        Nodes = []
+        self.__CollectNodes(Nodes)
+        Pwd = self.__GetCwd()
+        for n in Nodes:
+            if n.__DefDirty or (n.__PwdDependent and Pwd != n.__MyPwd):
+                n.__Prepare(Pwd)
+        Unused = []
+
+        def Scan():
+            for Kind, Index, _, _, _ in self.__TreeTokens(Nodes, Args):
+                if Kind == "p":
+                    yield Args[Index]
+                elif Kind == "t":
+                    yield from islice(Args, Index, None)
+
+        return self.OptionStream(self.__StreamRecords(Nodes, Args, Unused), Unused, self.ArgsView(Scan))
+
+    def __TreeTokens(self, Nodes: list, Args: Union[list, tuple]):
+        """
+        Parse Args with the option-tables of all Nodes in one pass.
+
+        Every node consumes the arguments with its own tables (like in __GetOpts), the
+        records of the nodes are merged by their position within Args.
+
+        Yields:
+            tuple: (Kind, Index, Node, Option, Argument) Kind is "o" (option of Node),
+                "u" (unknown to all nodes), "p" (positional for all nodes: Args[Index])
+                or "t" (last record: Args[Index:] are positional)
+        """
+
+        def Tagged(No, Node):
+            wLongList = list(Node.__LongList)
+            for nPre in Node.__ArgPrefixes(Args):
+                wLongList.extend(nPre + "." + nLong for nLong in Node.__LongList)
+            for i, j, Kind, Opt, Arg in Node._iter_gnu_getopt(Args, Node.__ShortStr, wLongList, True, 1):
+                yield (i, j, No, Kind, Opt, Arg)
+
+        Count = len(Nodes)
+        Tails = []  # start of the positional tail of the nodes that reached it
+        Key = None
+        Unknown = Positional = 0
+        UnknownOpt = ""
+        try:
+            for i, j, No, Kind, Opt, Arg in heapq.merge(*[Tagged(No, Node) for No, Node in enumerate(Nodes)]):
+                if (i, j) != Key:
+                    if Unknown == Count:
+                        yield ("u", Key[0], None, UnknownOpt, "")
+                    elif Positional and Positional + len(Tails) == Count:
+                        yield ("p", Key[0], None, "", "")
+                    Key = (i, j)
+                    Unknown = Positional = 0
+                if Kind == "o":
+                    yield ("o", i, Nodes[No], Opt, Arg)
+                elif Kind == "u":
+                    Unknown += 1
+                    UnknownOpt = Opt
+                elif Kind == "p":
+                    Positional += 1
+                else:
+                    Tails.append(i)
+        except self.GetoptError as exc:
+            raise self.ParamError(exc.msg) from None
+        if Unknown == Count:
+            yield ("u", Key[0], None, UnknownOpt, "")
+        elif Positional and Positional + len(Tails) == Count:
+            yield ("p", Key[0], None, "", "")
+        yield ("t", max(Tails), None, "", "")
+
+    def __StreamRecords(self, Nodes: list, Args: Union[list, tuple], Unused: list):
+        """Yield the records of :func:`IterOptions`, collect the unknown options in Unused"""
+        Prefixes = {id(n): n.FullPrefix for n in Nodes}
+        Counters = {}  # (FullPrefix, Name) -> value of the counters
+        for Kind, _, Node, Opt, Arg in self.__TreeTokens(Nodes, Args):
+            if Kind == "o":
+                Rec = Node.__StreamValue(Prefixes[id(Node)], Opt, Arg, Counters)
+                if Rec is not None:
+                    yield Rec
+            elif Kind == "u":
+                Unused.append(Opt)
+        if Unused and self.__ErrorOnUnknown:
+            raise self.__UnknownError(Unused) from None
+
+    def __StreamValue(self, Prefix: str, OptionName: str, OptionArg: str, Counters: dict) -> Union[tuple, None]:
+        """Check one option like __Process does, return the record (Prefix, Name, Value) or None"""
+        OptionName = self.__Make_OptName(OptionName)
+        try:
+            Kind, ParName, wPar, Check = self.__Actions[OptionName]
+        except KeyError:
+            return None
+        if Kind in ("help", "license", "fullLicense", "import", "glob_import", "export", "glob_export"):
+            return None
+        Target = {}
+        if Kind == "count":
+            Target[ParName] = Counters.get((Prefix, ParName), self.__DefaultDict.get(ParName, 0))
+        if Check is not None:
+            Res = Check(ParName, OptionName, wPar, OptionArg, Target)
+            if not Res is None:
+                raise self.ParamError(Res) from None
+            if Kind != "count":
+                return (Prefix, ParName, Target[ParName])
+        if Kind == "bool":
+            return (Prefix, ParName, not wPar.get(self.__WorkPars["default"], False))
+        if Kind == "count":
+            if "--" not in OptionName:
+                Target[ParName] += 1
+            Counters[(Prefix, ParName)] = Target[ParName]
+            return (Prefix, ParName, Target[ParName])
+        raise self.ParamError(self.__Msg("OptionNotDefined", **{"OptionName": OptionName}))
 
     @property
-    def LongOptsList(self) -> list:
+    def LongOptsList(self) -> tuple:
         """
-        Return copied list of long options
+        Return the long options (read-only, built once per preparation of the definition)
 
         Returns:
-            list: List of long options
+            tuple: the long options (e.g. "help", "len=")
         """
-        return copy.deepcopy(self.__LongList)
+        return self.__OptViews[0]
 
     @property
-    def ShortOptsList(self) -> list:
+    def ShortOptsList(self) -> tuple:
         """
-        Return copied list of short options
+        Return the short options (read-only, built once per preparation of the definition)
+
+        Returns:
+            tuple: the short options (e.g. "v", "l:")
         """
-        return copy.deepcopy(self.__ShortList)
+        return self.__OptViews[1]
 
     @property
-    def ParDict(self) -> dict:
+    def ParDict(self) -> types.MappingProxyType:
         """
-        Return copied dict with references options -> parameter-names
+        Return the references options -> parameter-names (read-only view)
 
         Returns:
-            dict: {option: name, ...}
+            MappingProxyType: {option: name, ...}
         """
-        return copy.deepcopy(self.__ParDict)
+        return self.__OptViews[2]
 
     @property
     def GetExportDict(self):
@@ -3587,18 +6398,78 @@ class Param:
         Returns:
             dict: The complete parameter dictionary
         """
+        with self.__GetRoot().__Lock:
+            return self.__ExportDict()
+
+    def __ExportDict(self) -> dict:
+        """The body of :attr:`GetExportDict` (the lock of the tree is held)"""
         Erg = {}
         wDict = {}
         for k, val in self.__WorkDict.items():
             wDict[k] = val
         Erg[self.__Prefix] = wDict
 
+        if self.__Pending:
+            self.__Materialize(list(self.__Pending))
         for c in self.__Children.values():
-            e = c.GetExportDict
+            e = c.__ExportDict()
             for n, d in e.items():
                 Erg[n] = d
         return Erg
 
+    def GetSparseExportDict(self, Required: bool = False) -> dict:
+        """
+        Return the dictionary for exporting only the values different from the compiled defaults.
+
+        Like :attr:`GetExportDict`, but a prefix without changed values is left out and
+        children not built yet (LazyChildren) are not built. Importing the result
+        gives the same values as importing the full export, but only the changed values
+        have to be checked (e.g. no path resolution or IP lookups for the defaults).
+
+        :param Required: True: include the required options (even with their default), defaults to False
+        :type Required: bool, optional
+        :return: The changed parameters per prefix
+        :rtype: dict
+        """
+        Erg = {}
+        Nodes = []
+        with self.__GetRoot().__Lock:
+            self.__CollectNodes(Nodes)
+            for n in Nodes:
+                wDict = {k: v for k, v in n.__WorkDict.items() if not n.__IsDefault(k, v, Required)}
+                if wDict:
+                    Erg[n.__Prefix] = wDict
+        return Erg
+
+    def __IsDefault(self, k: str, v, Required: bool) -> bool:
+        """True if v is the compiled default of k (and k is not a required option to be kept)"""
+        if Required and self.__Definition.get(k, {}).get(self.__WorkPars["required"], False):
+            return False
+        try:
+            d = self.__DefaultDict[k]
+        except KeyError:
+            return False
+        if type(v) is not type(d):
+            return False
+        if _IsCompact(v):
+            return len(v) == len(d) and list(v) == list(d)
+        return v == d
+
+    def SetSparseExport(self, Enable: bool = True, Required: bool = False) -> None:
+        """
+        Export only the values different from the compiled defaults with the options of type 'X' and '>'
+        (look at :func:`GetSparseExportDict`). Only the setting of the root is used.
+
+        :param Enable: True: sparse exports, False: full exports, defaults to True
+        :type Enable: bool, optional
+        :param Required: True: include the required options, defaults to False
+        :type Required: bool, optional
+        :raises TypeError: if a parameter is not bool
+        """
+        if not isinstance(Enable, bool) or not isinstance(Required, bool):
+            raise TypeError(f"{self.FullPrefix}: Enable and Required must be bool")
+        self.__SparseExport = Required if Enable else None
+
     @property
     def Prefix(self) -> str:
         """Return the prefix of this class
@@ -3836,16 +6707,16 @@ class Param:
                     Erg += wErg + Line[3] + "\n"
         return Erg
 
-    def __UsedShortCommandLineParameter(self, Par, WorkList: list) -> None:
-        List = Par.ShortOptsList
-        for l in List:
-            if l[-1] == ":":
-                l = l[:-1]
-            m = "-" + l
-            if m not in WorkList:
-                WorkList.append(m)
-        for c in Par.Child.values():
-            self.__UsedShortCommandLineParameter(c, WorkList)
+    def __UsedShortCommandLineParameter(self, Par, WorkSet: set) -> None:
+        """Add the short options of Par and all its children to WorkSet"""
+        Stack = [Par]
+        while Stack:
+            Node = Stack.pop()
+            for l in Node.ShortOptsList:
+                if l[-1] == ":":
+                    l = l[:-1]
+                WorkSet.add("-" + l)
+            Stack.extend(Node.Child.values())
 
     @property
     def OverviewCommandLineParameter(self) -> str:
@@ -3874,12 +6745,10 @@ Used long options:
         :return: A formatted string giving all information about short options used, broken to 68 characters a line.
         :rtype: str
         """
-        if not self.__IsPrepared:
-            self.__Prepare()
-        WorkList = []
-        self.__UsedShortCommandLineParameter(self, WorkList)
-        WorkList.sort()
-        return "    " + "\n    ".join(textwrap.wrap(", ".join(WorkList), 64, break_long_words=False))
+        self.__PrepareTree()
+        WorkSet = set()
+        self.__UsedShortCommandLineParameter(self, WorkSet)
+        return "    " + "\n    ".join(textwrap.wrap(", ".join(sorted(WorkSet)), 64, break_long_words=False))
 
     @property
     def FreeShortCommandLineParameter(self) -> str:
@@ -3890,11 +6759,11 @@ Used long options:
         :return: A formatted, sorted list of all unused (free to use) short options broken to 68 characters a line.
         :rtype: str
         """
-        UsedList = []
-        self.__UsedShortCommandLineParameter(self, UsedList)
+        UsedSet = set()
+        self.__UsedShortCommandLineParameter(self, UsedSet)
         FreeList = []
         for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyt0123456789":
-            if "-" + c not in UsedList:
+            if "-" + c not in UsedSet:
                 FreeList.append("-" + c)
         return "    " + "\n    ".join(textwrap.wrap(", ".join(FreeList), 64, break_long_words=False))
 
@@ -3907,24 +6776,17 @@ Used long options:
         :return: A formatted, sorted list of all used long options broken to 68 characters a line.
         :rtype: str
         """
-        if not self.__IsPrepared:
-            self.__Prepare()
-        WorkList = []
-
-        def __UsedLongCommandLineParameter(Par: Param, WorkList: list) -> None:
-            List = Par.LongOptsList
-            for l in List:
+        self.__PrepareTree()
+        WorkSet = set()
+        Stack = [self]
+        while Stack:
+            Node = Stack.pop()
+            for l in Node.LongOptsList:
                 if l[-1] == "=":
                     l = l[:-1]
-                m = "--" + l
-                if m not in WorkList:
-                    WorkList.append(m)
-            for c in Par.Child.values():
-                __UsedLongCommandLineParameter(c, WorkList)
-
-        __UsedLongCommandLineParameter(self, WorkList)
-        WorkList.sort()
-        return "    " + "\n    ".join(textwrap.wrap(", ".join(WorkList), 64, break_long_words=False))
+                WorkSet.add("--" + l)
+            Stack.extend(Node.Child.values())
+        return "    " + "\n    ".join(textwrap.wrap(", ".join(sorted(WorkSet)), 64, break_long_words=False))
 
     @property
     def TestCommandLineParameter(self) -> str:
@@ -3938,19 +6800,16 @@ Used long options:
                  or possible problems within the definition(s).
         :rtype: str
         """
-        if not self.__IsPrepared:
-            self.__Prepare()
+        self.__PrepareTree()
 
         Sd = {}
         Ld = {}
-
-        def __AddLists(Par: Param, Sd: dict, Ld: dict) -> None:
-            Sd[Par.FullPrefix] = Par.ShortOptsList
-            Ld[Par.FullPrefix] = Par.LongOptsList
-            for c in Par.Child.values():
-                __AddLists(c, Sd, Ld)
-
-        __AddLists(self, Sd, Ld)
+        Stack = [(self, self.FullPrefix)]
+        while Stack:  # parents bevore children, children in order of declaration
+            Node, TheFullPrefix = Stack.pop()
+            Sd[TheFullPrefix] = Node.ShortOptsList
+            Ld[TheFullPrefix] = Node.LongOptsList
+            Stack.extend((c, f"{TheFullPrefix}.{p}") for p, c in reversed(list(Node.Child.items())))
 
         # pprint.pprint(Sd,indent=4,sort_dicts=True)
         # pprint.pprint(Ld,indent=4,sort_dicts=True)
@@ -4026,19 +6885,721 @@ Used long options:
 
         return Res
 
-    class GetoptError(Exception):
-        """Own error-class for option-errors"""
+    def __GenLiteral(self, Value) -> bool:
+        """True if Value can be written as literal into the generated parser"""
+        if Value is None or isinstance(Value, (str, bool, int)):
+            return True
+        if isinstance(Value, float):
+            return Value == Value and Value not in (float("inf"), float("-inf"))
+        if isinstance(Value, list):
+            return all(self.__GenLiteral(x) for x in Value)
+        return False
 
-        opt = ""
-        msg = ""
+    def __GenOptionCode(self, ParName: str, wPar: dict) -> list:
+        """
+        Return the body-lines of the generated validator for one parameter.
 
-        def __init__(self, msg, opt=""):
-            self.msg = msg
-            self.opt = opt
-            Exception.__init__(self, msg, opt)
+        This is a straight-line copy of what "__Process" and "__CheckOption" do
+        for this parameter, the flags and limits are written as constants.
+        The generated function is called as f(W, K, a, Anc, Pwd): the own values,
+        the option-name, the argument, the values of the parents and the current directory.
+        """
+        wm = self.__WorkModes
+        Mode = wPar[self.__WorkPars["mode"]]
+        Multi = bool(wPar.get(self.__WorkPars["multiple"], False))
+        P = repr(ParName)
+        Code = []
 
-        def __str__(self):
-            return self.msg
+        def Init():
+            if Multi:
+                Code.extend([f"if not _InKnown({P}, W, Anc):", f"    W[{P}] = []"])
+
+        def Store(Value):
+            Code.append(f"W[{P}].append({Value})" if Multi else f"W[{P}] = {Value}")
+
+        def Limits(Value):
+            if self.__WorkPars["lowlimit"] in wPar:
+                ll = repr(wPar[self.__WorkPars["lowlimit"]])
+                Code.extend(
+                    [
+                        f"if {Value} < {ll}:",
+                        f'    raise ParamError(_MSG["LessLow"].format(**{{"OptValue": a, "ParKey": K, "LowLimit": {ll}}})) from None',
+                    ]
+                )
+            if self.__WorkPars["uplimit"] in wPar:
+                ul = repr(wPar[self.__WorkPars["uplimit"]])
+                Code.extend(
+                    [
+                        f"if {Value} > {ul}:",
+                        f'    raise ParamError(_MSG["HigherUp"].format(**{{"OptValue": a, "ParKey": K, "UppLimit": {ul}}})) from None',
+                    ]
+                )
+
+        def PathError(Key):
+            return f'raise ParamError(_MSG["{Key}"].format(**{{"OptionPath": a, "OptionName": K, "FullPath": n}})) from None'
+
+        NeedOpt = self.__WorkPars["needoption"] in wPar and wPar[self.__WorkPars["needoption"]]
+        if NeedOpt:
+            if Mode in (wm["text"], wm["pwd"]):
+                Init()
+                Code.append("a = str(a)")
+                Limits("a")
+                Store("a")
+            elif Mode in self.__IpModes:
+                Init()
+                Func = {wm["ip"]: "_IsValidIp", wm["ip4"]: "_IsValidIp4", wm["ip6"]: "_IsValidIp6"}[Mode]
+                ErrKey, IpVers = self.__IpModes[Mode][1], repr(self.__IpModes[Mode][2])
+                Code.extend(
+                    [
+                        f"wIp = {Func}(a)",
+                        "if wIp is None:",
+                        f'    raise ParamError(_MSG["{ErrKey}"].format(**{{"OptValue": a, "ParKey": K, "IpVers": {IpVers}}})) from None',
+                    ]
+                )
+                Store("wIp")
+            elif Mode in (wm["int"], wm["float"]):
+                Init()
+                Conv, ErrKey = ("int", "NoInt") if Mode == wm["int"] else ("float", "NoFloat")
+                Code.extend(
+                    [
+                        "try:",
+                        f"    n = {Conv}(a)",
+                        "except ValueError:",
+                        f'    raise ParamError(_MSG["{ErrKey}"].format(**{{"OptValue": a, "ParKey": K}})) from None',
+                    ]
+                )
+                Limits("n")
+                Store("n")
+            elif Mode == wm["count"]:
+                Code.extend(
+                    [
+                        'if a != "":',
+                        "    try:",
+                        "        n = int(a)",
+                        "    except ValueError:",
+                        '        raise ParamError(_MSG["NoInt"].format(**{"OptValue": a, "ParKey": K})) from None',
+                        f"    if {P} in W:",
+                        '        if K.startswith("--"):',
+                        f"            W[{P}] = n",
+                        "        else:",
+                        f"            W[{P}] += n",
+                        "    else:",
+                        f"        W[{P}] = n",
+                    ]
+                )
+            elif Mode == wm["bool"]:
+                Code.extend(
+                    [
+                        "a = str(a)",
+                        "n = a.lower()[:1]",
+                        'if n != "" and n in "jyt1":',
+                        f"    W[{P}] = True",
+                        'elif n != "" and n in "nf0":',
+                        f"    W[{P}] = False",
+                        "else:",
+                        '    raise ParamError(_MSG["NoBool"].format(**{"OptValue": a, "ParKey": K})) from None',
+                    ]
+                )
+            elif Mode in (wm["file"], wm["dir"]):
+                Init()
+                Key, Test = ("PathNoFile", "is_file") if Mode == wm["file"] else ("PathNoDir", "is_dir")
+                Code.extend(
+                    [
+                        "from pathlib import Path  # pylint: disable=import-outside-toplevel",
+                        "a = str(a).strip()",
+                        "if len(a) == 0:",
+                        "    n = a",
+                        "    " + PathError(Key),
+                    ]
+                )
+                if Mode == wm["file"]:
+                    Code.extend(['if a[0] != "/":', '    a = Pwd + "/" + a', "n = a", "try:", "    n = Path(a).expanduser().resolve()"])
+                    Code.extend(["except (ValueError, OSError):", "    " + PathError(Key)])
+                else:
+                    # unlike files an absolute directory is resolved without catching errors
+                    Code.extend(['if a[0] != "/":', '    a = Pwd + "/" + a', "    n = a", "    try:", "        n = Path(a).expanduser().resolve()"])
+                    Code.extend(["    except (ValueError, OSError):", "        " + PathError(Key), "else:", "    n = Path(a).expanduser().resolve()"])
+                Code.extend([f"if not (n.exists() and n.{Test}()):", "    " + PathError(Key)])
+                Store("str(n)")
+            elif Mode == wm["path"]:
+                Init()
+                Code.extend(
+                    [
+                        "from pathlib import Path  # pylint: disable=import-outside-toplevel",
+                        "a = str(a).strip()",
+                        'if a != "":',
+                        '    if a[0] != "/":',
+                        '        a = Pwd + "/" + a',
+                        "    n = a",
+                        "    try:",
+                        "        n = Path(a).expanduser().resolve()",
+                        "    except (ValueError, OSError):",
+                        "        " + PathError("PathNoPath"),
+                        "else:",
+                        '    n = ""',
+                    ]
+                )
+                Store("str(n)")
+            if Mode != wm["count"]:
+                return Code
+        if Mode == wm["bool"]:
+            Code.append(f"W[{P}] = {not wPar.get(self.__WorkPars['default'], False)!r}")
+        elif Mode == wm["count"]:
+            Code.extend(['if "--" not in K:', f"    W[{P}] += 1"])
+        else:
+            Code.append('raise ParamError(_MSG["OptionNotDefined"].format(**{"OptionName": K}))')
+        return Code
+
+    def __GenDefaultCode(self) -> list:
+        """
+        Return the body-lines of the generated function building the defaults of this node.
+
+        Static defaults are written as literal, defaults depending on the filesystem,
+        the current directory or the DNS are computed at runtime like in "__Prepare".
+        """
+        wm = self.__WorkModes
+        Static = dict(self.__DefaultDict)
+        Code = []
+        for ParName, SingleDef in self.__Definition.items():
+            ParMode = SingleDef[self.__WorkPars["mode"]]
+            if self.__WorkPars["default"] not in SingleDef or ParMode in self.__SpecialOpts:
+                continue
+            DefVal = SingleDef[self.__WorkPars["default"]]
+            P, V = repr(ParName), repr(DefVal)
+            if ParMode in self.__IpModes:
+                Func = {wm["ip"]: "_IsValidIp", wm["ip4"]: "_IsValidIp4", wm["ip6"]: "_IsValidIp6"}[ParMode]
+                Msg = repr(f"{self.FullPrefix}: {ParName} default value '{DefVal}' is invalid for this type (IP{self.__IpModes[ParMode][2]})")
+                Static[ParName] = None
+                Code.extend([f"wIp = {Func}({V})", "if wIp is None:", f"    raise DeclarationError({Msg})", f"D[{P}] = wIp"])
+            elif ParMode == wm["file"]:
+                Static[ParName] = DefVal
+                Code.extend(
+                    [
+                        f"wText = {V}",
+                        "try:",
+                        '    if wText[0] != "/":',
+                        '        wText = Pwd + "/" + wText',
+                        "    wFile = Path(wText).absolute()",
+                        "    if wFile.is_file():",
+                        f"        D[{P}] = str(wFile)",
+                        "except IndexError:",
+                        f'    D[{P}] = ""',
+                    ]
+                )
+            elif ParMode == self.__WorkPars["description"]:
+                Static[ParName] = DefVal
+                Code.extend(
+                    [
+                        f"wText = {V}",
+                        'if wText[0] != "/":',
+                        '    wText = Pwd + "/" + wText',
+                        "wFile = Path(wText).absolute()",
+                        "if wFile.is_dir():",
+                        f"    D[{P}] = str(wFile)",
+                    ]
+                )
+            elif ParMode == wm["path"]:
+                Static[ParName] = DefVal
+                Code.extend(
+                    [
+                        f"wText = {V}",
+                        "if len(wText) > 0:",
+                        '    if wText[0] != "/":',
+                        '        wText = Pwd + "/" + wText',
+                        f"    D[{P}] = str(Path(wText).absolute())",
+                        "else:",
+                        f'    D[{P}] = ""',
+                    ]
+                )
+        for ParName, Value in Static.items():
+            if not self.__GenLiteral(Value):
+                raise self.DeclarationError(f"{self.FullPrefix}: Default of {ParName} can not be written to the generated parser")
+        Lines = ["D = {" + ", ".join(f"{k!r}: {v!r}" for k, v in Static.items()) + "}"]
+        if Code:
+            Lines.append("from pathlib import Path  # pylint: disable=import-outside-toplevel,unused-import")
+        return Lines + Code + ["return D"]
+
+    def GenerateParser(self) -> str:
+        """
+        Generate the source of a plain python module that parses the command-line like this tree.
+
+        The module contains the flattened option-tables, the defaults, the prerendered
+        help-texts and one straight-line validator per parameter. It only imports
+        os and sys (and socket for IP modes) at load time, so it is imported in microseconds.
+        The getopt engine and the prefix handling are copied from this module. Use it as a build
+        step for often started programs:
+
+        .. code-block:: python
+
+            Source = MyParam.GenerateParser()
+            Diffs = MyParam.VerifyParser(Source, [["-v"], ["--alpha.count=3", "file"], ["--help"]])
+            if not Diffs:
+                Path("myprog_args.py").write_text(Source)
+
+            # in the program:
+            import myprog_args
+            Terminal, Values, Remainder, Unused = myprog_args.Process()
+            Port = Values["global"]["Port"]
+
+        The generated *Process* returns the own values of every node (keys are the full prefixes)
+        and raises its own *ParamError* with the same (translated) messages.
+        Imports, exports, the local IP modes ('lip', 'lip4', 'lip6'), compact storage ('A')
+        and environment-variables are not supported.
+
+        :raises self.DeclarationError: if the tree uses features not supported by the generated parser
+        :return: The source of the module
+        :rtype: str
+        """
+        if self.__Parent is not None:
+            return self.__Parent.GenerateParser()
+        self.__PrepareTree()
+        Nodes = []
+        self.__CollectNodes(Nodes)
+        wm = self.__WorkModes
+        Unsupported = (wm["import"], wm["export"], wm["glob_import"], wm["glob_export"], wm["lip"], wm["lip4"], wm["lip6"])
+
+        # prerender the help-texts with a placeholder for the program-name
+        SavedName = self.__MyProgName
+        self.__MyProgName = _PROG_MARK
+        self.__TextDirty = True
+        try:
+            UsageTexts = [n.Usage(n.__ShowPrefixOnHelp) for n in Nodes]  # pylint: disable=protected-access
+        finally:
+            self.__MyProgName = SavedName
+            self.__TextDirty = True
+
+        Out = [
+            '"""',
+            f"Command-line parser generated by Param.GenerateParser (Argpass {Version}).",
+            "",
+            "Do not edit, generate it again if the definitions change.",
+            '"""',
+            "# pylint: disable=too-many-lines,line-too-long,unused-argument",
+            _PARSER_RUNTIME,
+        ]
+        Shared = _PARSER_SHARED
+        if any(n.__Definition[p][n.__WorkPars["mode"]] in n.__IpModes for n in Nodes for p in n.__Definition):  # pylint: disable=protected-access
+            Out.append("import socket  # only for the IP modes\n")
+            Shared += _PARSER_SHARED_IP
+        Out.extend(inspect.getsource(f) + "\n" for f in Shared)
+        Out += [
+            f"_MSG = {self._Translation!r}",
+            f"_PROG = {_PROG_MARK!r}",
+            f"_ERROR_ON_UNKNOWN = {bool(self.__ErrorOnUnknown)!r}",
+            f"_USAGE = {UsageTexts!r}",
+            "(_FULLPREFIX, _PREFIX, _SHORT, _LONG, _PARENT, _ANCESTORS, _CHILDREN, _HELP, _LICENSE, _FULLLICENSE, _LICENSETEXT, _DISPATCH, _REQUIRED) = range(13)",
+            "",
+        ]
+        NodeLines = []
+        for Idx, n in enumerate(Nodes):
+            # pylint: disable=protected-access
+            if n.__EnvMap:
+                raise self.DeclarationError(f"{n.FullPrefix}: Environment-variables are not supported by the generated parser")
+            Funcs = {}
+            Required = []
+            for ParName, wPar in n.__Definition.items():
+                Mode = wPar[n.__WorkPars["mode"]]
+                if Mode in Unsupported:
+                    raise self.DeclarationError(f"{n.FullPrefix}: {ParName} (mode '{Mode}') is not supported by the generated parser")
+                if wPar.get(n.__WorkPars["compact"], False):
+                    raise self.DeclarationError(f"{n.FullPrefix}: Compact storage of {ParName} is not supported by the generated parser")
+                if Mode != wm["help"]:  # help is handled by the first pass only
+                    FuncName = f"_v{Idx}_{len(Funcs)}"
+                    Funcs[ParName] = FuncName
+                    Out.append("")
+                    Out.append(f"def {FuncName}(W, K, a, Anc, Pwd):  # {n.FullPrefix}: {ParName}")
+                    Out.extend("    " + x for x in n.__GenOptionCode(ParName, wPar))
+                    Out.append("")
+                if wPar.get(n.__WorkPars["required"], False):
+                    try:
+                        Required.append((ParName, n.__GetOptList(ParName)))
+                    except TypeError:
+                        raise self.DeclarationError(
+                            f"{n.FullPrefix}: Required option {ParName} with a list of long names is not supported by the generated parser"
+                        ) from None
+            Out.append("")
+            Out.append(f"def _d{Idx}(Pwd):  # defaults of {n.FullPrefix}")
+            Out.extend("    " + x for x in n.__GenDefaultCode())
+            Out.append("")
+            Ancestors = []
+            p = n.__Parent
+            while p is not None:
+                Ancestors.append(Nodes.index(p))
+                p = p.__Parent
+            Dispatch = "{" + ", ".join(f"{k!r}: {Funcs[v]}" for k, v in n.__ParDict.items() if k not in n.__HelpList) + "}"
+            NodeLines.append(
+                "    ("
+                + ", ".join(
+                    [
+                        repr(n.FullPrefix),
+                        repr(n.__Prefix),
+                        repr(n.__ShortStr),
+                        repr(tuple(n.__LongList)),
+                        repr(None if n.__Parent is None else Nodes.index(n.__Parent)),
+                        repr(tuple(Ancestors)),
+                        repr(tuple(Nodes.index(c) for c in n.__Children.values())),
+                        repr(frozenset(n.__HelpList)),
+                        repr(frozenset(n.__LicenseList)),
+                        repr(frozenset(n.__FullLicenseList)),
+                        repr(list(n.__License)),
+                        Dispatch,
+                        repr(tuple(Required)),
+                    ]
+                )
+                + "),"
+            )
+        Out.append("")
+        Out.append("_NODES = (")
+        Out.extend(NodeLines)
+        Out.append(")")
+        Out.append(f"_DEFAULTS = ({''.join(f'_d{i}, ' for i in range(len(Nodes)))})")
+        Out.append(_PARSER_PROCESS)
+        return "\n".join(Out)
+
+    def __VerifyRun(self, Func) -> tuple:
+        """Run one parser for VerifyParser, return (outcome, stdout)"""
+        Stdout = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(Stdout):
+                Res = ("ok",) + tuple(Func())
+        except SystemExit as exc:
+            Res = ("exit", exc.code)
+        except Exception as exc:  # pylint: disable=broad-except
+            Res = (type(exc).__name__, str(exc))
+        return Res, Stdout.getvalue()
+
+    def VerifyParser(self, Source: str, Corpus: list) -> list:
+        """
+        Run a parser generated by :func:`GenerateParser` and this tree on the same argument lists.
+
+        :param Source: The source returned by :func:`GenerateParser`
+        :type Source: str
+        :param Corpus: A list of argument lists (without the program-name)
+        :type Corpus: list
+        :return: One entry (Args, result of Param, result of the generated parser) for every
+            argument list with different results (values, remainder, unused options, errors, exit
+            and printed text). An empty list means both are identical for this corpus.
+        :rtype: list
+        """
+        if self.__Parent is not None:
+            return self.__Parent.VerifyParser(Source, Corpus)
+        Mod = types.ModuleType("argpass_generated")
+        exec(compile(Source, "<argpass generated parser>", "exec"), Mod.__dict__)  # pylint: disable=exec-used
+        SavedArgs = self.__Argumente
+        self.__MaterializeAll()
+        Nodes = []
+        self.__CollectNodes(Nodes)
+
+        def RunParam():
+            Erg = self.Process()
+            Values = {n.FullPrefix: dict(n.__WorkDict) for n in Nodes}  # pylint: disable=protected-access
+            return Erg, Values, self.GetRemainder(), self.UnusedArgs
+
+        Diffs = []
+        try:
+            for Args in Corpus:
+                wArgs = [sys.argv[0]] + list(Args)
+                self.SetArgs(wArgs)
+                Ref = self.__VerifyRun(RunParam)
+                Gen = self.__VerifyRun(lambda: Mod.Process(wArgs))  # pylint: disable=cell-var-from-loop
+                if Ref != Gen:
+                    Diffs.append((list(Args), Ref, Gen))
+        finally:
+            self.__Argumente = SavedArgs
+        return Diffs
+
+    @staticmethod
+    def __RandomDecl(Rnd: random.Random, Depth: int) -> tuple:
+        """Return a random (Def, Children) for FuzzEngines, the names are chosen to collide often"""
+        Def = {}
+        Shorts = Rnd.sample("abcdefgh", Rnd.randint(0, 5))
+        Longs = Rnd.sample(["alpha", "alpine", "al", "beta", "bet", "count", "cnt", "verbose", "verb", "x"], Rnd.randint(0, 6))
+        for No in range(max(len(Shorts), len(Longs))):
+            wPar = {"m": Rnd.choice("bbCCttiiFH")}
+            if No < len(Shorts):
+                wPar["s"] = Shorts[No]
+            if No < len(Longs):
+                wPar["l"] = Longs[No]
+            if wPar["m"] in "tiF":
+                wPar["o"] = True
+                wPar["M"] = Rnd.random() < 0.3
+            elif wPar["m"] == "b":
+                wPar["v"] = Rnd.random() < 0.5
+            Def[f"P{No}"] = wPar
+        Children = {}
+        if Depth > 0:
+            for Prefix in Rnd.sample(["sub", "alpha", "al", "beta", "y"], Rnd.randint(0, 2)):
+                cDef, cChildren = Param.__RandomDecl(Rnd, Depth - 1)
+                Children[Prefix] = {"Def": cDef, "Desc": "", "AddPar": "", "Children": cChildren}
+        return Def, Children
+
+    @staticmethod
+    def __RandomArgs(Rnd: random.Random, Shorts: list, Longs: list, Prefixes: list) -> list:
+        """Return a random argument list (with program-name) built from the options of a tree"""
+        Args = [sys.argv[0]]
+        Values = ["1", "-1", "3.5", "x", "", "=", "a=b"]
+        for _ in range(Rnd.randint(0, 10)):
+            Kind = Rnd.random()
+            if Kind < 0.3 and Shorts:
+                Arg = "-" + "".join(Rnd.choice(Shorts + ["z"]) for _ in range(Rnd.randint(1, 3)))
+                if Rnd.random() < 0.2:
+                    Arg += Rnd.choice(Values)
+            elif Kind < 0.6 and Longs:
+                wLong = Rnd.choice(Longs + ["zz"])
+                wLong = wLong[: Rnd.randint(1, len(wLong))] if Rnd.random() < 0.3 else wLong
+                if Prefixes and Rnd.random() < 0.3:
+                    wLong = Rnd.choice(Prefixes + ["global", "nope"]) + "." + wLong
+                Arg = "--" + wLong
+                if Rnd.random() < 0.4:
+                    Arg += "=" + Rnd.choice(Values)
+            elif Kind < 0.8:
+                Arg = Rnd.choice(Values)
+            else:
+                Arg = Rnd.choice(["--", "-", "file", "--", "-z"])
+            Args.append(Arg)
+        return Args
+
+    @classmethod
+    def FuzzEngines(cls, Count: int = 100, Seed: int = 0, Corpus: int = 20) -> list:
+        """
+        Compare the optimised engines with the reference on random definitions and argument lists.
+
+        For every random tree (up to 3 levels, colliding short and long names, prefixes) Corpus random
+        argument lists (clusters, abbreviations, 'prefix.option', unknown options, '--', '-', ...) are
+        processed with the "reference" and the "fast" engine (look at :func:`SetEngine`): the values,
+        the remainder, the unused options, the errors, the exits and the printed texts have to be the same.
+        The streaming tokenizer used by :func:`IterOptions` is compared with the reference getopt for every node.
+        Run it after every change of the option-handling:
+
+        .. code-block:: python
+
+            Diffs = Param.FuzzEngines(Count=500, Seed=1)
+            assert not Diffs, Diffs[0]
+
+        :param Count: The number of random trees, defaults to 100
+        :type Count: int, optional
+        :param Seed: The seed of the random generator (the same seed gives the same cases), defaults to 0
+        :type Seed: int, optional
+        :param Corpus: The number of argument lists per tree, defaults to 20
+        :type Corpus: int, optional
+        :return: One entry (Engine, Def, Children, Args, result of the reference, result of the engine)
+            for every difference. An empty list means all engines are identical for these cases.
+        :rtype: list
+        """
+        Rnd = random.Random(Seed)
+        Diffs = []
+        for _ in range(Count):
+            Def, Children = cls.__RandomDecl(Rnd, 2)
+            ErrorOnUnknown = Rnd.random() < 0.5
+            try:
+                Trees = {}
+                for Engine in ("reference", "fast"):
+                    Trees[Engine] = cls(Def=Def, Children=Children, ErrorOnUnknown=ErrorOnUnknown, HelpType=3)
+                    Trees[Engine].SetEngine(Engine)
+            except cls.DeclarationError:
+                continue
+            Ref = Trees["reference"]
+            Nodes = []
+            Ref.__CollectNodes(Nodes)
+            for n in Nodes:
+                n.__Prepare()
+            Shorts = sorted({c for n in Nodes for c in n.__ShortStr if c != ":"})
+            Longs = sorted({l.rstrip("=") for n in Nodes for l in n.__LongList})
+            Prefixes = [n.__Prefix for n in Nodes[1:]]
+            for _ in range(Corpus):
+                Args = cls.__RandomArgs(Rnd, Shorts, Longs, Prefixes)
+                Results = {}
+                for Engine, Tree in Trees.items():
+                    Tree.SetArgs(Args)
+
+                    def RunParam(Tree=Tree):
+                        Erg = Tree.Process()
+                        wNodes = []
+                        Tree.__CollectNodes(wNodes)
+                        Values = {n.FullPrefix: dict(n.__WorkDict) for n in wNodes}
+                        return Erg, Values, Tree.GetRemainder(), Tree.UnusedArgs
+
+                    Results[Engine] = Ref.__VerifyRun(RunParam)
+                if Results["fast"] != Results["reference"]:
+                    Diffs.append(("fast", Def, Children, Args, Results["reference"], Results["fast"]))
+                for n in Nodes:
+                    wLongList = list(n.__LongList)
+                    for nPre in n.__ArgPrefixes(Args):
+                        wLongList.extend(nPre + "." + nLong for nLong in n.__LongList)
+
+                    def RunStream(n=n, wLongList=wLongList):
+                        opts, prog_args, unused = [], [], []
+                        for i, _, Kind, Opt, Arg in n._iter_gnu_getopt(Args, n.__ShortStr, wLongList, True, 1):
+                            if Kind == "o":
+                                opts.append((Opt, Arg))
+                            elif Kind == "u":
+                                unused.append(Opt)
+                                if len(Opt) == 2:  # a short option
+                                    opts.append((Opt, ""))
+                            elif Kind == "p":
+                                prog_args.append(Opt)
+                            else:
+                                prog_args.extend(Args[i:])
+                        return opts, prog_args, unused
+
+                    wRef = Ref.__VerifyRun(lambda n=n, wLongList=wLongList: n._ref_gnu_getopt(Args[1:], n.__ShortStr, wLongList, True))
+                    wStream = Ref.__VerifyRun(RunStream)
+                    if wStream != wRef:
+                        Diffs.append(("stream", Def, Children, Args, wRef, wStream))
+        return Diffs
+
+    @property
+    def Result(self) -> object:
+        """
+        Return the values of the last "Process" as object with slotted attributes.
+
+        The class of the object is generated from the definition (one class per node),
+        the values of the children are attributes named by their prefix, e.g.:
+
+        .. code-block:: python
+
+            MyParam.Process()
+            Res = MyParam.Result
+            for x in Data:
+                if Res.Verbose > 1 and Res.alpha.Count < x:
+                    ...
+
+        Reading an attribute is a plain slot-read (no dictionary-lookup, no search within the tree).
+        Parameters without a value (AllParams=False) raise AttributeError, names that are no
+        python identifiers are left out (use the dictionary-access for them).
+        The object is built at the first access after "Process" (or "Reload") and is a snapshot,
+        values changed later by assignment are not seen. Children not built yet (LazyChildren)
+        are built. Use :func:`GenerateResultClasses` to get the classes with type-annotations
+        for type-checkers.
+
+        :raises self.DeclarationError: if a parameter and a child have the same name
+        :return: the result object of this instance
+        :rtype: object
+        """
+        if self.__ResultObj is None:
+            with self.__GetRoot().__Lock:
+                return self.__BuildResult()
+        return self.__ResultObj
+
+    def __BuildResult(self) -> object:
+        """Build the result object of :attr:`Result` (the lock of the tree is held)"""
+        if self.__ResultObj is None:
+            Cls, Fields, Kids = self.__GetResultLayout()
+            Obj = Cls()
+            for k in Fields:
+                if k in self.__WorkDict:
+                    setattr(Obj, k, self.__WorkDict[k])
+            for p in Kids:
+                setattr(Obj, p, self.__Children[p].Result)
+            self.__ResultObj = Obj
+        return self.__ResultObj
+
+    def __GetResultLayout(self) -> tuple:
+        """Return (class, parameter-names, child-prefixes) of the result-class, the class is built only once per definition"""
+        if self.__DefDirty:
+            self.__Prepare()
+        if self.__Pending:
+            self.__Materialize(list(self.__Pending))
+        if self.__ResultLayout is None:
+            Name, Fields, Kids = self.__ResultSpec()
+            Annotations = dict(Fields)
+            for p, c in Kids:
+                Annotations[p] = c.__ResultClassName()  # pylint: disable=protected-access
+            Cls = type(Name, (), {"__slots__": tuple(Annotations), "__annotations__": Annotations})
+            self.__ResultLayout = (Cls, tuple(n for n, _ in Fields), tuple(p for p, _ in Kids))
+        return self.__ResultLayout
+
+    def __ResultClassName(self) -> str:
+        """Return the name of the result-class (e.g. 'Result_global_alpha')"""
+        return "Result_" + "".join(x if x.isalnum() else "_" for x in self.FullPrefix)
+
+    def __ResultSpec(self) -> tuple:
+        """
+        Return the members of the result-class
+
+        Returns:
+            tuple: (class-name, [(parameter-name, annotation), ...], [(prefix, child), ...])
+
+        Raises:
+            self.DeclarationError: if a parameter and a child have the same name
+        """
+        wm = self.__WorkModes
+        Fields = []
+        for ParName, SingleDef in self.__Definition.items():
+            ParMode = SingleDef[self.__WorkPars["mode"]]
+            if ParMode in self.__SpecialOpts or not isinstance(ParName, str):
+                continue
+            if not ParName.isidentifier() or keyword.iskeyword(ParName):
+                continue
+            if ParMode in (wm["int"], wm["count"]):
+                Ann = "int"
+            elif ParMode == wm["float"]:
+                Ann = "float"
+            elif ParMode == wm["bool"]:
+                Ann = "bool"
+            elif ParMode == wm["path"] and self.__WorkPars["default"] in SingleDef:
+                Ann = "str"
+            elif ParMode in (wm["path"], wm["file"], wm["dir"]):
+                Ann = "Optional[str]"  # None if not given or the default does not exist
+            elif ParMode in (wm["text"], wm["pwd"]) or ParMode in self.__IpModes:
+                Ann = "str"
+            else:
+                Ann = "Any"
+            if SingleDef.get(self.__WorkPars["compact"], False):
+                Ann = f"Sequence[{Ann}]"  # array.array or numpy.ndarray
+            elif SingleDef.get(self.__WorkPars["multiple"], False):
+                Ann = f"List[{Ann}]"
+            Fields.append((ParName, Ann))
+        Kids = []
+        for p, c in self.__Children.items():
+            if not p.isidentifier() or keyword.iskeyword(p):
+                continue
+            if p in self.__Definition:
+                raise self.DeclarationError(f"{self.FullPrefix}: '{p}' is a parameter and a child")
+            Kids.append((p, c))
+        return self.__ResultClassName(), Fields, Kids
+
+    def GenerateResultClasses(self) -> str:
+        """
+        Generate the source of the result-classes (see :attr:`Result`) with type-annotations.
+
+        The module is meant for type-checkers and IDEs, e.g.:
+
+        .. code-block:: python
+
+            Path("myprog_result.py").write_text(MyParam.GenerateResultClasses())
+
+            # in the program:
+            from typing import cast
+            from myprog_result import Result_global
+            Res = cast(Result_global, MyParam.Result)
+
+        :raises self.DeclarationError: if a parameter and a child have the same name
+        :return: The source of the module (children bevore their parents)
+        :rtype: str
+        """
+        Classes = []
+
+        def Collect(Node: "Param") -> None:
+            Layout = Node.__GetResultLayout()  # pylint: disable=protected-access
+            for p in Layout[2]:
+                Collect(Node.__Children[p])  # pylint: disable=protected-access
+            Classes.append(Layout[0])
+
+        Collect(self)
+        Lines = [
+            '"""',
+            f"Result classes of {self.FullPrefix} (generated by pcs_argpass, do not edit)",
+            '"""',
+            "from typing import Any, List, Optional, Sequence  # pylint: disable=unused-import",
+        ]
+        for Cls in Classes:
+            Lines += ["", "", f"class {Cls.__name__}:", f"    __slots__ = {Cls.__slots__!r}"]
+            for Name, Ann in Cls.__annotations__.items():
+                Lines.append(f"    {Name}: {Ann}")
+        return "\n".join(Lines) + "\n"
+
+    GetoptError = _GetoptError  # Own error-class for option-errors
 
     def _getopt(self, args, shortopts, longopts=[], AcceptAll=False):  # pylint: disable=dangerous-default-value
         """getopt(args, options[, long_options]) -> opts, args
@@ -4066,22 +7627,7 @@ Used long options:
         multiple occurrences.  Long and short options may be mixed.
 
         """
-        unused = []
-        opts = []
-        if isinstance(longopts, str):
-            longopts = [longopts]
-        else:
-            longopts = list(longopts)
-        while args and args[0].startswith("-") and args[0] != "-":
-            if args[0] == "--":
-                args = args[1:]
-                break
-            if args[0].startswith("--"):
-                opts, args, unused = self._do_longs(opts, args[0][2:], longopts, args[1:], unused, AcceptAll)
-            else:
-                opts, args, unused = self._do_shorts(opts, args[0][1:], shortopts, args[1:], unused, AcceptAll)
-
-        return opts, args, unused
+        return _gnu_getopt(args, "+" + shortopts, longopts, AcceptAll, self.__Msg)
 
     def _gnu_getopt(self, args, shortopts, longopts=[], AcceptAll=False):  # pylint: disable=dangerous-default-value
         """getopt(args, options[, long_options]) -> opts, args
@@ -4096,7 +7642,27 @@ Used long options:
         environment variable POSIXLY_CORRECT is set, then option
         processing stops as soon as a non-option argument is encountered.
 
+        The results are collected from _iter_gnu_getopt (the only tokenizer).
+
+        """
+        return _gnu_getopt(args, shortopts, longopts, AcceptAll, self.__Msg)
+
+    def _iter_gnu_getopt(self, args, shortopts, longopts=[], AcceptAll=False, Start=0):  # pylint: disable=dangerous-default-value
         """
+        Like _gnu_getopt, but the results are yielded while args is consumed.
+
+        Look at the module-level _iter_gnu_getopt for the records.
+
+        """
+        return _iter_gnu_getopt(args, shortopts, longopts, AcceptAll, Start, self.__Msg)
+
+    # ---------------------------------------------
+    # Reference engine: the original getopt port (look at SetEngine)
+    # Keep it unchanged, it is the reference for FuzzEngines!
+    # ---------------------------------------------
+
+    def _ref_gnu_getopt(self, args, shortopts, longopts=[], AcceptAll=False):  # pylint: disable=dangerous-default-value
+        """Reference version of _gnu_getopt (the argument list is sliced for every token)"""
         unused = []
         opts = []
         prog_args = []
@@ -4120,9 +7686,9 @@ Used long options:
                 break
 
             if args[0][:2] == "--":
-                opts, args, unused = self._do_longs(opts, args[0][2:], longopts, args[1:], unused, AcceptAll)
+                opts, args, unused = self._ref_do_longs(opts, args[0][2:], longopts, args[1:], unused, AcceptAll)
             elif args[0][:1] == "-" and args[0] != "-":
-                opts, args, unused = self._do_shorts(opts, args[0][1:], shortopts, args[1:], unused, AcceptAll)
+                opts, args, unused = self._ref_do_shorts(opts, args[0][1:], shortopts, args[1:], unused, AcceptAll)
             else:
                 if all_options_first:
                     prog_args += args
@@ -4133,9 +7699,9 @@ Used long options:
 
         return opts, prog_args, unused
 
-    def _do_longs(self, opts, opt, longopts, args, unused, AcceptAll=False):
+    def _ref_do_longs(self, opts, opt, longopts, args, unused, AcceptAll=False):
         """
-        Process long options
+        Reference version of the long options of _gnu_getopt
         """
         try:
             i = opt.index("=")
@@ -4145,32 +7711,29 @@ Used long options:
             opt, optarg = opt[:i], opt[i + 1 :]
         if AcceptAll:
             try:
-                has_arg, opt = self._long_has_args(opt, longopts)
+                has_arg, opt = self._ref_long_has_args(opt, longopts)
             except self.GetoptError:
                 unused.append("--" + opt)
                 return opts, args, unused
         else:
-            has_arg, opt = self._long_has_args(opt, longopts)
+            has_arg, opt = self._ref_long_has_args(opt, longopts)
         if has_arg:
             if optarg is None:
                 if not args:
-                    raise self.GetoptError(self._Translation["OptionRequiresArgumentLong"].format(**{"opt": opt}), opt)
+                    raise self.GetoptError(self.__Msg("OptionRequiresArgumentLong", **{"opt": opt}), opt)
                 optarg, args = args[0], args[1:]
         elif optarg is not None:
-            raise self.GetoptError(self._Translation["OptionNeedNoArgs"].format(**{"opt": opt}), opt)
+            raise self.GetoptError(self.__Msg("OptionNeedNoArgs", **{"opt": opt}), opt)
         opts.append(("--" + opt, optarg or ""))
         return opts, args, unused
 
-    # Return:
-    #   has_arg?
-    #   full option name
-    def _long_has_args(self, opt, longopts):
+    def _ref_long_has_args(self, opt, longopts):
         """
-        determine if long option has args
+        Reference version of _long_has_args
         """
         possibilities = [o for o in longopts if o.startswith(opt)]
         if not possibilities:
-            raise self.GetoptError(self._Translation["OptionNotRecognizedLong"].format(**{"opt": opt}), opt)
+            raise self.GetoptError(self.__Msg("OptionNotRecognizedLong", **{"opt": opt}), opt)
         # Is there an exact match?
         if opt in possibilities:
             return False, opt
@@ -4178,9 +7741,7 @@ Used long options:
             return True, opt
         # No exact match, so better be unique.
         if len(possibilities) > 1:
-            # since possibilities contains all valid continuations, might be
-            # nice to work them into the error msg
-            raise self.GetoptError(self._Translation["ParNoUniquePrefix"].format(**{"opt": opt}), opt)
+            raise self.GetoptError(self.__Msg("ParNoUniquePrefix", **{"opt": opt}), opt)
         assert len(possibilities) == 1
         unique_match = possibilities[0]
         has_arg = unique_match.endswith("=")
@@ -4188,24 +7749,24 @@ Used long options:
             unique_match = unique_match[:-1]
         return has_arg, unique_match
 
-    def _do_shorts(self, opts, optstring, shortopts, args, unused, AcceptAll=False):
+    def _ref_do_shorts(self, opts, optstring, shortopts, args, unused, AcceptAll=False):
         """
-        Process short options
+        Reference version of the short options of _gnu_getopt
         """
         while optstring != "":
             opt, optstring = optstring[0], optstring[1:]
             if AcceptAll:
                 try:
-                    wHasArgs = self._short_has_arg(opt, shortopts)
+                    wHasArgs = self._ref_short_has_arg(opt, shortopts)
                 except self.GetoptError:
                     unused.append("-" + opt)
                     wHasArgs = False
             else:
-                wHasArgs = self._short_has_arg(opt, shortopts)
+                wHasArgs = self._ref_short_has_arg(opt, shortopts)
             if wHasArgs:
                 if optstring == "":
                     if not args:
-                        raise self.GetoptError(self._Translation["OptionRequiresArgumentShort"].format(**{"opt": opt}), opt)
+                        raise self.GetoptError(self.__Msg("OptionRequiresArgumentShort", **{"opt": opt}), opt)
                     optstring, args = args[0], args[1:]
                 optarg, optstring = optstring, ""
             else:
@@ -4213,14 +7774,14 @@ Used long options:
             opts.append(("-" + opt, optarg))
         return opts, args, unused
 
-    def _short_has_arg(self, opt, shortopts):
+    def _ref_short_has_arg(self, opt, shortopts):
         """
-        Determine if short option has args
+        Reference version of _short_has_arg
         """
         for i in range(len(shortopts)):  # pylint: disable=consider-using-enumerate
             if opt == shortopts[i] != ":":
                 return shortopts.startswith(":", i + 1)
-        raise self.GetoptError(self._Translation["OptionNotRecognizedShort"].format(**{"opt": opt}), opt)
+        raise self.GetoptError(self.__Msg("OptionNotRecognizedShort", **{"opt": opt}), opt)
 
 
 # if __name__ == '__main__':
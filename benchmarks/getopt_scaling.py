@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# vim: expandtab:ts=4:sw=4:noai
+"""
+Scaling benchmark of the getopt engine (Param._gnu_getopt) up to 10^6 tokens.
+
+Every size is run in four scanning modes:
+
+    gnu         options and arguments intermixed ("-v --count=3 fileN -ab")
+    plus        shortopts starting with '+' (options first, then the arguments)
+    posixly     the same with POSIXLY_CORRECT set in the environment
+    dashdash    intermixed, '--' in the middle of the list
+
+The reference engine (the original slicing implementation, quadratic) is
+timed up to --ref-max tokens and its result is compared with the fast engine.
+
+    python3 benchmarks/getopt_scaling.py
+    python3 benchmarks/getopt_scaling.py --max 100000 --ref-max 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from Param import Param  # noqa: E402  pylint: disable=wrong-import-position
+
+SHORTOPTS = "vab"
+LONGOPTS = ["verbose", "count="]
+
+
+def MakeArgs(Mode: str, Tokens: int) -> list:
+    """Return an argument list of about Tokens tokens for Mode"""
+    Groups = max(Tokens // 4, 1)
+    if Mode in ("plus", "posixly"):
+        Opts = []
+        for _ in range(Groups):
+            Opts.extend(("-v", "--count=3", "-ab"))
+        return Opts + [f"file{k}" for k in range(Groups)]
+    Args = []
+    for k in range(Groups):
+        Args.extend(("-v", "--count=3", f"file{k}", "-ab"))
+    if Mode == "dashdash":
+        Args.insert(len(Args) // 2, "--")
+    return Args
+
+
+def Run(Func, Mode: str, Args: list) -> tuple:
+    """Return (seconds, result) of one call of Func in Mode"""
+    Short = "+" + SHORTOPTS if Mode == "plus" else SHORTOPTS
+    Saved = os.environ.pop("POSIXLY_CORRECT", None)
+    if Mode == "posixly":
+        os.environ["POSIXLY_CORRECT"] = "1"
+    try:
+        Start = time.perf_counter()
+        Res = Func(Args, Short, LONGOPTS, True)
+        return time.perf_counter() - Start, Res
+    finally:
+        os.environ.pop("POSIXLY_CORRECT", None)
+        if Saved is not None:
+            os.environ["POSIXLY_CORRECT"] = Saved
+
+
+def main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    Parser.add_argument("--max", type=int, default=10**6, help="largest number of tokens (default 10^6)")
+    Parser.add_argument("--ref-max", type=int, default=10**4, help="largest size for the reference engine (default 10^4)")
+    Opts = Parser.parse_args()
+    P = Param(Def={"V": {"s": "v", "l": "verbose", "m": "C"}})
+    Sizes = []
+    Size = 1000
+    while Size <= Opts.max:
+        Sizes.append(Size)
+        Size *= 10
+    print(f"{'mode':<10} {'tokens':>9} {'fast [s]':>10} {'reference [s]':>14}")
+    for Mode in ("gnu", "plus", "posixly", "dashdash"):
+        for Size in Sizes:
+            Args = MakeArgs(Mode, Size)
+            Fast, FastRes = Run(P._gnu_getopt, Mode, Args)  # pylint: disable=protected-access
+            RefText = "-"
+            if Size <= Opts.ref_max:
+                Ref, RefRes = Run(P._ref_gnu_getopt, Mode, Args)  # pylint: disable=protected-access
+                if RefRes != FastRes:
+                    raise SystemExit(f"{Mode} {Size}: the engines differ")
+                RefText = f"{Ref:.4f}"
+            print(f"{Mode:<10} {len(Args):>9} {Fast:>10.4f} {RefText:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# vim: expandtab:ts=4:sw=4:noai
+"""
+Benchmark of the import decoding: json first (Param.JsonLoads) against json5 only.
+
+Import-files of about 1 KB, 1 MB and 100 MB are written to a temporary
+directory. For each file the decoding by Param.JsonLoads, by json5.loads
+(if json5 is installed, up to --json5-max bytes, it is about 1000 times
+slower) and a whole Process importing the file with a '<' option are timed.
+A small JSON5 file (with comments) shows the cost of the fallback.
+
+    python3 benchmarks/json_import.py
+    python3 benchmarks/json_import.py --json5-max 100000000    # json5 for all sizes (takes long)
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import Param as ParamModule  # noqa: E402  pylint: disable=wrong-import-position
+from Param import Param  # noqa: E402  pylint: disable=wrong-import-position
+
+SIZES = {"1KB": 10**3, "1MB": 10**6, "100MB": 10**8}
+
+
+def WriteFile(FileName: Path, Size: int) -> None:
+    """Write a global export of about Size bytes ('global' and one child with many entries)"""
+    with FileName.open("w", encoding="utf-8") as wFile:
+        wFile.write('{"global": {"Name": "bench"}, "data": {')
+        Written = 40
+        k = 0
+        while Written < Size - 60:
+            Entry = json.dumps({"name": f"value {k}", "n": k, "f": k + 0.5, "l": [1, 2, 3], "b": True})
+            Entry = f'{", " if k else ""}"K{k}": {Entry}'
+            wFile.write(Entry)
+            Written += len(Entry)
+            k += 1
+        wFile.write("}}\n")
+
+
+def Timed(Func, *args, Repeat: int = 1) -> float:
+    """Return the mean seconds of Repeat calls of Func(*args)"""
+    Start = time.perf_counter()
+    for _ in range(Repeat):
+        Func(*args)
+    return (time.perf_counter() - Start) / Repeat
+
+
+def main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    Parser.add_argument("--json5-max", type=int, default=10**6, help="largest file decoded by json5 only (default 1 MB)")
+    Opts = Parser.parse_args()
+    Json5 = ParamModule.json5
+    P = Param(Def={"Imp": {"l": "imp", "m": "<"}, "Name": {"l": "name", "m": "t", "o": True}})
+    print(f"{'file':<8} {'bytes':>11} {'json first [s]':>15} {'json5 only [s]':>15} {'Process [s]':>12}")
+    with tempfile.TemporaryDirectory() as Tmp:
+        for Name, Size in SIZES.items():
+            FileName = Path(Tmp) / f"import_{Name}.json"
+            WriteFile(FileName, Size)
+            Text = FileName.read_text(encoding="utf-8")
+            Repeat = max(1, 10**6 // Size)
+            First = Timed(ParamModule.JsonLoads, Text, FileName.name, Repeat=Repeat)
+            Only = "-"
+            if Json5 is not None and Size <= Opts.json5_max:
+                Only = f"{Timed(Json5.loads, Text, Repeat=max(1, Repeat // 100)):.6f}"
+            P.SetArgs(["prog", f"--imp={FileName}"])
+            Whole = Timed(P.Process)
+            if P["Name"] != "bench":
+                raise SystemExit(f"{Name}: the import failed")
+            print(f"{Name:<8} {os.path.getsize(FileName):>11} {First:>15.6f} {Only:>15} {Whole:>12.6f}")
+        FileName = Path(Tmp) / "import.json5"
+        FileName.write_text('// a comment\n{"global": {"Name": "bench",},}\n', encoding="utf-8")
+        Text = FileName.read_text(encoding="utf-8")
+        if Json5 is not None:
+            First = Timed(ParamModule.JsonLoads, Text, "import.json", Repeat=1000)
+            Only = Timed(Json5.loads, Text, Repeat=1000)
+            print(f"{'json5':<8} {len(Text):>11} {First:>15.6f} {Only:>15.6f} {'(fallback)':>12}")
+
+
+if __name__ == "__main__":
+    main()
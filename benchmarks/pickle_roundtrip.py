@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# vim: expandtab:ts=4:sw=4:noai
+"""
+Benchmark of the pickle round trip of a prepared and processed tree (1000 nodes).
+
+The tree (a root with --width children, each with --width children ...) is built,
+prepared (Prewarm with the help-texts) and processed. Timed are pickle.dumps,
+pickle.loads and the first Process() of the loaded tree, against building and
+preparing the tree again. The values of the loaded tree are compared with the
+original ones. The garbage of the former run (cyclic trees) is collected before
+every run.
+
+    python3 benchmarks/pickle_roundtrip.py
+    python3 benchmarks/pickle_roundtrip.py --width 10 --depth 3 --repeat 10
+"""
+
+import argparse
+import gc
+import pickle
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from Param import Param  # noqa: E402  pylint: disable=wrong-import-position
+
+NODE_DEF = {
+    "Count": {"s": "c", "l": "count", "m": "i", "o": True, "v": 1, "L": 0, "U": 100},
+    "Name": {"l": "name", "m": "t", "o": True, "v": "x"},
+    "Flag": {"l": "flag", "m": "b"},
+    "Hosts": {"l": "host", "m": "t", "o": True, "M": True},
+}
+
+
+def Balanced(Width: int, Depth: int) -> dict:
+    """Return the Children declaration of a balanced tree"""
+    if Depth == 0:
+        return {}
+    return {f"n{k}": {"Def": NODE_DEF, "Children": Balanced(Width, Depth - 1)} for k in range(Width)}
+
+
+def Build(Width: int, Depth: int, Args: list) -> Param:
+    """Return the prepared and processed tree"""
+    Root = Param(Def=NODE_DEF, Children=Balanced(Width, Depth), Args=Args)
+    Root.Prewarm(Help=True)
+    Root.Process()
+    return Root
+
+
+def Best(Func, Repeat: int) -> tuple:
+    """Return (best seconds, last result) of Repeat calls of Func, collected before each"""
+    Res = None
+    Seconds = None
+    for _ in range(Repeat):
+        Res = None
+        gc.collect()
+        Start = time.perf_counter()
+        Res = Func()
+        Took = time.perf_counter() - Start
+        Seconds = Took if Seconds is None else min(Seconds, Took)
+    return Seconds, Res
+
+
+def Nodes(Root: Param) -> list:
+    """Return all nodes of the tree (breadth first)"""
+    Res = [Root]
+    for n in Res:
+        Res.extend(n.Child.values())
+    return Res
+
+
+def main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    Parser.add_argument("--width", type=int, default=31, help="children per node (default 31: 31 + 961 + root = 993 nodes)")
+    Parser.add_argument("--depth", type=int, default=2, help="levels of children (default 2)")
+    Parser.add_argument("--repeat", type=int, default=5, help="runs per row, the best is printed (default 5)")
+    Opts = Parser.parse_args()
+    Args = ["prog", "-c", "7", "--n0.name=y", "--host=a", "--host=b", "file.txt"]
+    Root = Build(Opts.width, Opts.depth, Args)
+    Count = len(Nodes(Root))
+
+    Dumps, Data = Best(lambda: pickle.dumps(Root, protocol=pickle.HIGHEST_PROTOCOL), Opts.repeat)
+    Loads, Loaded = Best(lambda: pickle.loads(Data), Opts.repeat)
+    for a, b in zip(Nodes(Root), Nodes(Loaded)):
+        if a.FullPrefix != b.FullPrefix or dict(a) != dict(b):
+            raise SystemExit(f"{a.FullPrefix}: the loaded values differ")
+
+    def LoadAndProcess():
+        Tree = pickle.loads(Data)
+        Tree.Process()
+        return Tree
+
+    Processed, _ = Best(LoadAndProcess, Opts.repeat)
+    Rebuild, _ = Best(lambda: Build(Opts.width, Opts.depth, Args), Opts.repeat)
+
+    print(f"nodes {Count}, pickle {len(Data) / 1e6:.2f} MB")
+    print(f"{'step':<26} {'best [ms]':>10}")
+    print(f"{'pickle.dumps':<26} {Dumps * 1e3:>10.2f}")
+    print(f"{'pickle.loads':<26} {Loads * 1e3:>10.2f}")
+    print(f"{'pickle.loads + Process()':<26} {Processed * 1e3:>10.2f}")
+    print(f"{'build + Prewarm + Process':<26} {Rebuild * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# vim: expandtab:ts=4:sw=4:noai
+"""
+Benchmark of the response-file expansion ("@file", look at Param.SetResponseFiles) at 10^6 tokens.
+
+Three files are written to a temporary directory:
+
+    plain       one path per line
+    quoted      Quoted=True, every line quoted ("dir k/file k.txt")
+    nested      plain, the list split into 10 files included by one response-file
+
+For each file the expansion alone and a whole Process (expansion, getopt,
+remainder) are timed.
+
+    python3 benchmarks/response_files.py
+    python3 benchmarks/response_files.py --tokens 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from Param import Param  # noqa: E402  pylint: disable=wrong-import-position
+
+
+def WriteFiles(Dir: Path, Tokens: int) -> dict:
+    """Write the response-files, return {Name: (Quoted, Argument)}"""
+    with (Dir / "plain.txt").open("w", encoding="utf-8") as wFile:
+        for k in range(Tokens):
+            wFile.write(f"/data/dir{k % 1000}/file{k}.txt\n")
+    with (Dir / "quoted.txt").open("w", encoding="utf-8") as wFile:
+        for k in range(Tokens):
+            wFile.write(f'"/data/dir {k % 1000}/file {k}.txt"\n')
+    Parts = 10
+    with (Dir / "nested.txt").open("w", encoding="utf-8") as wTop:
+        for p in range(Parts):
+            with (Dir / f"part{p}.txt").open("w", encoding="utf-8") as wFile:
+                for k in range(p * Tokens // Parts, (p + 1) * Tokens // Parts):
+                    wFile.write(f"/data/dir{k % 1000}/file{k}.txt\n")
+            wTop.write(f"@part{p}.txt\n")
+    return {"plain": (False, "@plain.txt"), "quoted": (True, "@quoted.txt"), "nested": (False, "@nested.txt")}
+
+
+def main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    Parser.add_argument("--tokens", type=int, default=10**6, help="number of tokens (default 10^6)")
+    Opts = Parser.parse_args()
+    P = Param(Def={"V": {"s": "v", "l": "verbose", "m": "C"}})
+    print(f"{'file':<8} {'tokens':>9} {'MB':>6} {'expansion [s]':>14} {'Process [s]':>12}")
+    with tempfile.TemporaryDirectory() as Tmp:
+        Files = WriteFiles(Path(Tmp), Opts.tokens)
+        Cwd = os.getcwd()
+        os.chdir(Tmp)
+        try:
+            for Name, (Quoted, Arg) in Files.items():
+                P.SetResponseFiles(Quoted=Quoted)
+                P.SetArgs(["prog", "-v", Arg])
+                Start = time.perf_counter()
+                Expanded = P._Param__GetArgs()  # pylint: disable=protected-access
+                Expansion = time.perf_counter() - Start
+                Start = time.perf_counter()
+                P.Process()
+                Whole = time.perf_counter() - Start
+                if len(P.GetRemainder()) != Opts.tokens or len(Expanded) != Opts.tokens + 2:
+                    raise SystemExit(f"{Name}: wrong number of tokens")
+                Size = sum(f.stat().st_size for f in Path(Tmp).glob(f"{'part' if Name == 'nested' else Name}*.txt"))
+                print(f"{Name:<8} {Opts.tokens:>9} {Size / 1e6:>6.1f} {Expansion:>14.3f} {Whole:>12.3f}")
+        finally:
+            os.chdir(Cwd)
+
+
+if __name__ == "__main__":
+    main()
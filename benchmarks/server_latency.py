@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# vim: expandtab:ts=4:sw=4:noai
+"""
+Latency benchmark of the parse server (Param.Serve) against a cold Process().
+
+A tree (root and --children children with a few options each) is written to a
+temporary module. The mean time per call of --runs calls is printed for:
+
+    interpreter     python3 -S -c pass (the start of the interpreter alone)
+    cold            a new interpreter: import Param, build the tree, Process()
+    warm            Process() of the prepared tree within this process
+    request         Param.ServerRequest to the server (a separate process)
+    client          the shell client of Param.ClientScript (python3 -S) to the server
+
+    python3 benchmarks/server_latency.py
+    python3 benchmarks/server_latency.py --children 100 --runs 50
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from Param import Param  # noqa: E402  pylint: disable=wrong-import-position
+
+TREE = """
+import sys
+sys.path.insert(0, {Root!r})
+from Param import Param
+
+CHILD = {{
+    "Count": {{"s": "c", "l": "count", "m": "i", "o": True, "v": 1, "L": 0, "U": 100}},
+    "Name": {{"l": "name", "m": "t", "o": True, "v": "x"}},
+    "Flag": {{"l": "flag", "m": "b"}},
+}}
+
+
+def Build():
+    Def = {{
+        "Help": {{"s": "h", "l": "help", "m": "H"}},
+        "Verbose": {{"s": "v", "l": "verbose", "m": "C"}},
+        "Out": {{"s": "o", "l": "out", "m": "p", "o": True, "v": "out"}},
+    }}
+    Children = {{f"c{{k}}": {{"Def": CHILD, "Desc": f"child {{k}}"}} for k in range({Children})}}
+    return Param(Def=Def, Children=Children)
+"""
+
+COLD = "import tree\ntree.Build().Process()\n"
+SERVER = "import sys, tree\ntree.Build().Serve(sys.argv[1])\n"
+
+
+def Mean(Func, Runs: int) -> float:
+    """Return the mean seconds of Runs calls of Func (after one warm-up call)"""
+    Func()
+    Start = time.perf_counter()
+    for _ in range(Runs):
+        Func()
+    return (time.perf_counter() - Start) / Runs
+
+
+def main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    Parser.add_argument("--children", type=int, default=20, help="number of children (default 20)")
+    Parser.add_argument("--runs", type=int, default=20, help="calls per row (default 20)")
+    Opts = Parser.parse_args()
+    Args = ["prog", "-vv", "--c3.count=4", f"--c{Opts.children - 1}.name=y", "--flag", "file.txt"]
+    with tempfile.TemporaryDirectory() as Tmp:
+        (Path(Tmp) / "tree.py").write_text(TREE.format(Root=str(ROOT), Children=Opts.children), encoding="utf-8")
+        (Path(Tmp) / "cold.py").write_text(COLD, encoding="utf-8")
+        (Path(Tmp) / "server.py").write_text(SERVER, encoding="utf-8")
+        SocketPath = str(Path(Tmp) / "parse.sock")
+        (Path(Tmp) / "client").write_text(Param.ClientScript(SocketPath), encoding="utf-8")
+        sys.path.insert(0, Tmp)
+        import tree  # pylint: disable=import-error,import-outside-toplevel
+
+        Warm = tree.Build()
+        Warm.Prewarm()
+        Warm.SetArgs(Args)
+        Server = subprocess.Popen([sys.executable, str(Path(Tmp) / "server.py"), SocketPath], cwd=Tmp)
+        try:
+            for _ in range(200):
+                if os.path.exists(SocketPath):
+                    break
+                time.sleep(0.05)
+            else:
+                raise SystemExit("the server did not start")
+            Rows = [
+                ("interpreter", lambda: subprocess.run([sys.executable, "-S", "-c", "pass"], check=True)),
+                ("cold", lambda: subprocess.run([sys.executable, "cold.py"] + Args[1:], cwd=Tmp, check=True)),
+                ("warm", Warm.Process),
+                ("request", lambda: Param.ServerRequest(SocketPath, Args, Cwd=Tmp)),
+                (
+                    "client",
+                    lambda: subprocess.run(
+                        [sys.executable, "-S", "client"] + Args[1:], cwd=Tmp, check=True, stdout=subprocess.DEVNULL
+                    ),
+                ),
+            ]
+            Answer = Param.ServerRequest(SocketPath, Args, Cwd=Tmp)
+            if Answer["Status"] != "ok":
+                raise SystemExit(f"the server answered: {Answer}")
+            Warm.Process()
+            Values = Answer["Values"]
+            if Values["global"]["Verbose"] != Warm["Verbose"] or Values["global.c3"]["Count"] != Warm.Child["c3"]["Count"]:
+                raise SystemExit("the server and Process differ")
+            print(f"{'path':<12} {'runs':>5} {'mean [ms]':>10}")
+            for Name, Func in Rows:
+                print(f"{Name:<12} {Opts.runs:>5} {Mean(Func, Opts.runs) * 1e3:>10.2f}")
+        finally:
+            Server.terminate()
+            Server.wait()
+
+
+if __name__ == "__main__":
+    main()
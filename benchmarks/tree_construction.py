@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# vim: expandtab:ts=4:sw=4:noai
+"""
+Benchmark of the construction of child trees (Param(Children=...)) by node count and depth.
+
+Three shapes are built from a nested Children declaration:
+
+    wide        one level of N children
+    balanced    every node has W children, D levels
+    chain       one child per level, D levels
+
+Every node defines two options. The time per node should not grow with the
+number of nodes (wide, balanced) nor with the depth (chain).
+
+    python3 benchmarks/tree_construction.py
+    python3 benchmarks/tree_construction.py --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from Param import Param  # noqa: E402  pylint: disable=wrong-import-position
+
+NODE_DEF = {
+    "Count": {"s": "c", "l": "count", "m": "i", "o": True, "v": 1},
+    "Flag": {"l": "flag", "m": "b"},
+}
+
+
+def Balanced(Width: int, Depth: int) -> dict:
+    """Return the Children declaration of a balanced tree"""
+    if Depth == 0:
+        return {}
+    return {f"n{k}": {"Def": NODE_DEF, "Children": Balanced(Width, Depth - 1)} for k in range(Width)}
+
+
+def Chain(Depth: int) -> dict:
+    """Return the Children declaration of a chain (built without recursion)"""
+    Children = {}
+    for _ in range(Depth):
+        Children = {"n": {"Def": NODE_DEF, "Children": Children}}
+    return Children
+
+
+def Shapes() -> list:
+    """Return [(Name, Nodes, Factory), ...], Factory returns a fresh declaration"""
+    Res = []
+    for Width in (100, 1000, 10000):
+        Res.append((f"wide {Width}", Width, lambda w=Width: Balanced(w, 1)))
+    for Width, Depth in ((3, 4), (3, 6), (5, 3), (5, 4), (10, 3)):
+        Nodes = sum(Width**d for d in range(1, Depth + 1))
+        Res.append((f"balanced {Width}^{Depth}", Nodes, lambda w=Width, d=Depth: Balanced(w, d)))
+    for Depth in (100, 200, 400, 800):
+        Res.append((f"chain {Depth}", Depth, lambda d=Depth: Chain(d)))
+    return Res
+
+
+def main() -> None:
+    Parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    Parser.add_argument("--repeat", type=int, default=3, help="runs per shape, the best is printed (default 3)")
+    Opts = Parser.parse_args()
+    print(f"{'shape':<16} {'nodes':>7} {'total [ms]':>11} {'per node [us]':>14}")
+    for Name, Nodes, Factory in Shapes():
+        Best = None
+        try:
+            for _ in range(Opts.repeat):
+                Children = Factory()
+                Start = time.perf_counter()
+                Param(Def=NODE_DEF, Children=Children)
+                Seconds = time.perf_counter() - Start
+                Best = Seconds if Best is None else min(Best, Seconds)
+        except RecursionError:
+            print(f"{Name:<16} {Nodes:>7} {'RecursionError':>26}")
+            continue
+        print(f"{Name:<16} {Nodes:>7} {Best * 1e3:>11.2f} {Best * 1e6 / Nodes:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
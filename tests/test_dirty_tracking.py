@@ -0,0 +1,95 @@
+"""Only the changed nodes are prepared again, only the changed artefacts are rebuilt"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from Param import Param  # noqa: E402  pylint: disable=wrong-import-position
+
+ChildDef = {
+    "Count": {"s": "c", "l": "count", "m": "i", "o": True, "v": 1},
+    "Flag": {"s": "g", "l": "flag", "m": "b"},
+}
+
+
+class DirtyTrackingTest(unittest.TestCase):
+    """Count the calls of __Prepare (option tables) and __GenUsageText (usage text) per node"""
+
+    def setUp(self):
+        self.Prepared = []
+        self.Texts = []
+        self.OrigPrepare = Param._Param__Prepare  # pylint: disable=protected-access
+        self.OrigGenUsage = Param._Param__GenUsageText  # pylint: disable=protected-access
+        Prepared, Texts, OrigPrepare, OrigGenUsage = self.Prepared, self.Texts, self.OrigPrepare, self.OrigGenUsage
+
+        def Prepare(Node, *args, **kwargs):
+            Prepared.append(Node.FullPrefix)
+            return OrigPrepare(Node, *args, **kwargs)
+
+        def GenUsage(Node, *args, **kwargs):
+            Texts.append(Node.FullPrefix)
+            return OrigGenUsage(Node, *args, **kwargs)
+
+        Param._Param__Prepare = Prepare  # pylint: disable=protected-access
+        Param._Param__GenUsageText = GenUsage  # pylint: disable=protected-access
+        Children = {p: {"Def": ChildDef, "Desc": p, "AddPar": ""} for p in ("alpha", "beta", "gamma")}
+        self.Tree = Param(
+            Def={"Verbose": {"s": "v", "l": "verbose", "m": "C"}},
+            Children=Children,
+            Args=["prog", "-v", "--alpha.count=3"],
+        )
+        self.Tree.Process()
+        self.Tree.Usage()
+        self.Reset()
+
+    def tearDown(self):
+        Param._Param__Prepare = self.OrigPrepare  # pylint: disable=protected-access
+        Param._Param__GenUsageText = self.OrigGenUsage  # pylint: disable=protected-access
+
+    def Reset(self):
+        del self.Prepared[:]
+        del self.Texts[:]
+
+    def test_unchanged_tree(self):
+        self.Tree.SetArgs(["prog", "--beta.count=4", "file"])
+        self.Tree.Process()
+        self.Tree.Usage()
+        self.assertEqual(self.Prepared, [])
+        self.assertEqual(self.Texts, [])
+        self.assertEqual(self.Tree.Child["beta"]["Count"], 4)
+
+    def test_changed_definition(self):
+        Def = dict(ChildDef, Name={"s": "n", "l": "name", "m": "t", "o": True})
+        self.Tree.Child["beta"].SetDef(Def)
+        self.Tree.SetArgs(["prog", "--beta.name=x"])
+        self.Tree.Process()
+        self.assertEqual(self.Prepared, ["global.beta"])
+        self.Tree.Usage()
+        self.assertEqual(self.Prepared, ["global.beta"])
+        self.assertEqual(self.Texts, ["global.beta"])
+        self.assertEqual(self.Tree.Child["beta"]["Name"], "x")
+
+    def test_changed_description(self):
+        self.Tree.Child["gamma"].SetDesc("new description")
+        self.Tree.Child["alpha"].SetAddPar("FILES")
+        self.Tree.Process()
+        self.assertEqual(self.Prepared, [])
+        Text = self.Tree.Usage()
+        self.assertEqual(self.Prepared, [])
+        self.assertEqual(sorted(self.Texts), ["global.alpha", "global.gamma"])
+        self.assertIn("new description", Text)
+
+    def test_added_child(self):
+        self.Tree.AddChild("delta", Def=ChildDef, Description="delta")
+        self.Tree.SetArgs(["prog", "--delta.count=5"])
+        self.Tree.Process()
+        self.assertEqual(self.Prepared, ["global.delta"])
+        self.Tree.Usage()
+        self.assertEqual(self.Texts, ["global.delta"])
+        self.assertEqual(self.Tree.Child["delta"]["Count"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()